@@ -1,12 +1,29 @@
 import streamlit as st
 import requests
 import pandas as pd
-from collections import Counter
-from wordcloud import WordCloud
-import re
+import numpy as np
 import os
 import json
-from io import BytesIO
+
+from review_analysis import BASIC_MATCHER, WEBTOON_MATCHER
+from review_analysis.sentiment import score_sentiment
+from review_analysis.fingerprint import dataset_fingerprint
+from review_analysis.search import ReviewIndex
+from review_analysis.context import context_rules
+from review_analysis.dataset import read_reviews_csv, compact_reviews, memory_report
+from review_analysis.ngrams import complaint_ngrams, positive_bigrams, top_ngrams
+from review_analysis.association import CooccurrenceMatrix
+from review_analysis.pipeline import StageGraph, RUN
+from review_analysis.result_cache import ResultCache
+from review_analysis.facets import Facets
+from review_analysis.shared_cache import SharedCache, WAITED
+from review_analysis.instrumentation import MISS, RerunRecorder, activate, cached, deactivate, span
+from review_analysis import deep_dive, paging, parallel
+from review_analysis.snapshot import TOP_KEYWORDS, load_snapshot, snapshot_matches, sentiment_by_score_frame
+from review_analysis.topics import TOPIC_KEYWORDS, TOPIC_PRIORITY, topic_counts, rows_to_matrix
+from review_analysis.collector import CollectorError, iter_review_chunks, collect_many
+from review_analysis.wordcloud_cache import WordCloudCache
+from review_analysis.store import ReviewStore, STORED_COLUMNS, stored_sentiment, topic_matrix_from_masks, sync_chunks
 
 # ----------------------------
 # 페이지 설정
@@ -190,455 +207,420 @@ APP_LIST = {
     "리디북스": "com.initialcoms.ridi",
 }
 
-# ----------------------------
-# 불용어 정의
-# ----------------------------
-STOPWORDS = {
-    "너무", "정말", "진짜", "매우", "아주", "완전", "되게", "꽤", "좀", "약간", "살짝",
-    "그냥", "이거", "저거", "그것", "이것", "저것", "하는", "있는", "없는",
-    "해서", "하고", "해요", "합니다", "입니다", "있어요", "없어요", "같아요",
-    "이런", "저런", "그런", "어떤", "무슨", "왜", "어디", "언제", "어떻게",
-    "근데", "그래서", "하지만", "그러나", "그리고", "또한", "그래도",
-    "있어", "없어", "하면", "이용", "사용", "정도", "이상", "계속", "다시", "처음", "마지막",
-    "쿠키", "만화", "작품", "좋아", "읽고", "보고"
-}
-
-# ----------------------------
-# 토픽 키워드 정의
-# ----------------------------
-TOPIC_KEYWORDS = {
-    "📚 콘텐츠": ["작품", "연재", "완결", "스토리", "내용", "재미", "그림", "퀄리티", "신작", "추천", "작가", "회차", "출시", "보고싶", "읽고싶", "기다", "시즌", "에피소드", "캐릭터", "결말", "전작", "후속", "외전", "재밌", "재미있", "웹툰"],
-    "💰 결제/가격": ["결제", "돈", "유료", "무료", "가격", "비싸", "비용", "코인", "충전", "환불", "구매", "구독", "이용권", "할인", "캐시", "쿠키", "유료화", "과금", "유료가", "무료로", "무료면", "유료면", "돈내", "돈을"],
-    "📺 광고": ["광고", "배너", "팝업", "스킵", "건너뛰기", "동영상광고", "전면광고", "광고가", "광고없", "광고좀", "광고를"],
-    "🐛 버그/오류": ["버그", "오류", "에러", "렉걸", "튕김", "튕겨", "멈춤", "작동안", "느려", "로딩", "꺼짐", "강제종료", "crash", "팅김", "무한로딩", "앱꺼", "실행안", "멈춰", "다운됨"],
-    "📱 UI/UX": ["화면", "버튼", "디자인", "인터페이스", "메뉴", "레이아웃", "구성", "위치", "아이콘", "색상", "폰트", "글씨", "스크롤", "터치", "조작"],
-    "🔔 알림/편의": ["알림", "푸시", "북마크", "저장", "기록", "목록", "검색", "정렬", "필터", "공유", "다운로드", "오프라인"],
-}
-
-# ----------------------------
-# 감성 키워드 정의 (기본)
-# ----------------------------
-POSITIVE_WORDS = {"좋아", "최고", "재밌", "재미있", "편리", "편해", "만족", "추천", "굿", "대박", "사랑", "완벽", "훌륭", "감사", "행복", "즐거"}
-NEGATIVE_WORDS = {"별로", "싫어", "최악", "불편", "짜증", "화나", "실망", "후회", "쓰레기", "폭망", "구림", "개선", "답답", "불만", "짜증나", "에러", "버그"}
-
-# ----------------------------
-# 웹툰/만화 특화 감성 키워드 (가중치 포함)
-# ----------------------------
-WEBTOON_SENTIMENT = {
-    "positive": {
-        # 기본 (weight 1-3)
-        "좋다": 1, "좋아요": 1, "만족": 1,
-        "재밌다": 2, "재미있다": 2, "추천": 2, "감동": 2, "몰입": 2, "여운": 2,
-        "강추": 3, "최고": 3, "완벽": 3,
-        # 웹툰특화
-        "작화좋다": 2, "작화좋음": 2, "작화미쳤다": 3, "작화미침": 3,
-        "스토리탄탄": 3, "전개깔끔": 2, "연출좋다": 2, "연출좋음": 2,
-        "캐릭터매력": 2, "개연성있다": 2, "세계관탄탄": 3,
-        "떡밥회수": 3, "다음화기대": 2, "정주행": 2, "시간순삭": 3,
-        # 극단
-        "갓작": 3, "명작": 3, "레전드": 3, "인생웹툰": 3, "소름": 3,
-        # 추가 변형
-        "재밌": 2, "재미있": 2, "좋아": 1, "강력추천": 3, "꿀잼": 3,
-        "작화": 1, "스토리": 1, "몰입감": 2, "감동적": 2,
-    },
-    "negative": {
-        # 기본
-        "노잼": 3, "별로": 1, "실망": 2, "아쉽다": 1, "아쉬움": 1,
-        "지루": 2, "답답": 2, "비추": 2, "최악": 3, "재미없다": 2, "재미없": 2,
-        # 웹툰특화
-        "작화붕괴": 3, "작붕": 3, "스토리산으로": 3, "산으로": 2,
-        "개연성없다": 3, "개연성없음": 3, "전개느림": 2, "급전개": 2,
-        "캐붕": 3, "설정붕괴": 3, "질질끈다": 2, "질질끔": 2,
-        "떡밥방치": 3, "몰입깨짐": 2,
-        # 극단
-        "하차": 3, "시간낭비": 3, "돈아까움": 3, "발암": 3, "개망작": 3,
-        # 추가 변형
-        "노잼임": 3, "별로임": 1, "지루함": 2, "지루해": 2,
-    }
-}
-
-# ----------------------------
-# 요청 패턴 정의
-# ----------------------------
-REQUEST_PATTERNS = [
-    r"(.{2,20})(해주세요|해줘요|해주길|바랍니다|바래요|원합니다|원해요|했으면|으면 좋겠|면 좋겠|해달라|해줬으면)",
-    r"(제발|부탁).{0,20}(해주|바랍|원)",
-    r"(.{2,15})(기능|옵션).{0,5}(추가|넣어|만들어)",
-]
+# 연관어 표 (동시출현 PMI, PMI 결과가 없으면 키워드 포함 리뷰의 토큰 빈도)
+RELATED_COLUMNS = ["키워드", "동시출현", "PMI"]
+FREQUENT_COLUMNS = ["키워드", "빈도"]
+RELATED_EMPTY = "연관 키워드 없음"
+RELATED_HELP = "키워드 앞뒤 5단어 안에 우연보다 자주 함께 나온 단어 (PMI = log2(키워드 주변 출현 비율 / 전체 출현 비율)), 결과가 없거나 리뷰가 적으면 키워드 포함 리뷰의 단어 빈도"
 
 # ----------------------------
 # 유틸리티 함수
 # ----------------------------
-def simple_tokenizer(text):
-    tokens = re.findall(r"[가-힣]{2,}", str(text))
-    tokens = [t for t in tokens if t not in STOPWORDS and len(t) >= 2]
-    return tokens
+def content_rows(fingerprint, contents, *args):
+    """성능 계측용 처리 행 수 (지문 다음 인자가 리뷰 배열/토큰 저장소인 분석 함수)"""
+    return len(contents)
 
 def analyze_keyword_context_sentiment(text, keyword):
-    """키워드 주변 문맥 기반 감성 분석"""
-    # 키워드 주변 부정 패턴
-    negative_patterns = [
-        f"{keyword}.*?(빼|없애|제거|싫|별로|짜증|불편|안좋|최악|노잼|지루|답답|하차|그만)",
-        f"(빼|없애|제거|싫|별로|짜증|불편|안좋|최악|노잼|지루|답답|하차|그만).*?{keyword}",
-        f"{keyword}.*?(왜|뭐야|뭔|진짜|도대체).*?(있|나와|뜨|보여)",
-        f"(제발|부탁).*?{keyword}.*?(빼|없|제거|하지)",
-    ]
-    
-    # 키워드 주변 긍정 패턴
-    positive_patterns = [
-        f"{keyword}.*?(좋|최고|완벽|대박|굿|짱|사랑|감사|편리|유용|도움)",
-        f"(좋|최고|완벽|대박|굿|짱|사랑|감사|편리|유용|도움).*?{keyword}",
-        f"{keyword}.*?(있어서|덕분|편해|좋아)",
-    ]
-    
-    text_lower = text.lower()
-    
-    # 부정 패턴 체크
-    for pattern in negative_patterns:
-        if re.search(pattern, text_lower):
-            return "부정"
-    
-    # 긍정 패턴 체크
-    for pattern in positive_patterns:
-        if re.search(pattern, text_lower):
-            return "긍정"
-    
-    # 패턴 매칭 안되면 None (기존 감성 사용)
-    return None
+    """키워드 주변 문맥 기반 감성 분석 (패턴 매칭 안되면 None → 기존 감성 사용)"""
+    return context_rules(keyword).classify(text)
 
-def extract_bigrams(text):
-    """키워드 조합 (바이그램) 추출"""
-    tokens = simple_tokenizer(text)
-    bigrams = []
-    for i in range(len(tokens) - 1):
-        bigram = f"{tokens[i]} + {tokens[i+1]}"
-        bigrams.append(bigram)
-    return bigrams
-
-def extract_trigrams(text):
-    """키워드 조합 (트리그램 - 3단어) 추출"""
-    tokens = simple_tokenizer(text)
-    trigrams = []
-    for i in range(len(tokens) - 2):
-        trigram = f"{tokens[i]} + {tokens[i+1]} + {tokens[i+2]}"
-        trigrams.append(trigram)
-    return trigrams
-
-@st.cache_data(ttl=86400, show_spinner="기본 데이터 로딩...")
+@cached(st.cache_data(ttl=86400, show_spinner="기본 데이터 로딩..."), "기본 데이터 로드")
 def load_default_data():
     """기본 데이터 로드 (CSV에 sentiment 포함 시 즉시 반환)"""
     try:
         csv_path = os.path.join(os.path.dirname(__file__), "default_reviews.csv")
-        df = pd.read_csv(csv_path)
-        df["at"] = pd.to_datetime(df["at"])
-        
-        # 메모리 최적화: 최대 500건만 사용
-        if len(df) > 1000:
-            df = df.head(1000)
-        
-        # CSV에 이미 sentiment가 있으면 바로 반환
-        if "sentiment" in df.columns:
-            return df
-        
-        # 없으면 감성분석 수행 (최초 1회)
-        results = []
-        pos_scores = []
-        neg_scores = []
-        
-        for _, row in df.iterrows():
-            text = str(row["content"])
-            score = row["score"]
-            
-            pos_weight = sum(weight for word, weight in WEBTOON_SENTIMENT["positive"].items() if word in text)
-            neg_weight = sum(weight for word, weight in WEBTOON_SENTIMENT["negative"].items() if word in text)
-            
-            pos_scores.append(pos_weight)
-            neg_scores.append(neg_weight)
-            
-            if score >= 4:
-                sentiment = "부정" if neg_weight >= 6 and neg_weight > pos_weight else "긍정"
-            elif score <= 2:
-                sentiment = "긍정" if pos_weight >= 6 and pos_weight > neg_weight else "부정"
-            else:
-                diff = pos_weight - neg_weight
-                sentiment = "긍정" if diff >= 2 else ("부정" if diff <= -2 else "중립")
-            
-            results.append(sentiment)
-        
-        df["sentiment"] = results
-        df["pos_score"] = pos_scores
-        df["neg_score"] = neg_scores
-        
-        return df
+        return read_reviews_csv(csv_path)
     except Exception as e:
         st.error(f"기본 데이터 로드 실패: {e}")
         return pd.DataFrame()
 
-# Modal API URL (배포 후 업데이트 필요)
-MODAL_API_URL = "https://blendiing--review-collector-collect-reviews-api.modal.run/"
+@cached(st.cache_data(ttl=86400, show_spinner=False), "스냅샷 로드")
+def load_default_snapshot():
+    """기본 데이터 분석 스냅샷 (default_analysis.json, 없으면 None)"""
+    return load_snapshot(os.path.join(os.path.dirname(__file__), "default_analysis.json"))
 
-def get_reviews_with_progress(app_id, count=500):
-    """리뷰 수집 (Modal API 사용)"""
-    import requests
-    
+# Modal API URL (배포 후 업데이트 필요, 로컬 테스트 서버는 REVIEW_COLLECTOR_URL 로 지정)
+MODAL_API_URL = os.environ.get("REVIEW_COLLECTOR_URL", "https://blendiing--review-collector-collect-reviews-api.modal.run/")
+
+# 로컬 리뷰 저장소 (앱별 누적, 동기화 시 새 리뷰만 수집)
+REVIEW_STORE_PATH = os.environ.get("REVIEW_STORE_PATH", os.path.join(os.path.dirname(__file__), "reviews.db"))
+
+@cached(st.cache_resource(show_spinner=False), "리뷰 저장소 연결")
+def get_review_store():
+    """프로세스 전체에서 공유하는 리뷰 저장소"""
+    return ReviewStore(REVIEW_STORE_PATH)
+
+# 워드클라우드 PNG 디스크 캐시 (빈도 지문 + 폰트 + 크기 키, 세션/재시작 간 공유)
+WORDCLOUD_CACHE_DIR = os.environ.get("WORDCLOUD_CACHE_DIR", os.path.join(os.path.dirname(__file__), "wordcloud_cache"))
+# 백그라운드 렌더링 완료 확인 주기 (초)
+WORDCLOUD_POLL_SECONDS = 0.5
+
+@cached(st.cache_resource(show_spinner=False), "워드클라우드 캐시")
+def get_wordcloud_cache():
+    """프로세스 전체에서 공유하는 워드클라우드 렌더러 (디스크 캐시 + 작업자 스레드)"""
+    return WordCloudCache(WORDCLOUD_CACHE_DIR)
+
+# 세션별 분석 결과 캐시 예산 (MB, 넘으면 오래 안 쓴 결과부터 제거)
+SESSION_CACHE_MB = int(os.environ.get("SESSION_CACHE_MB", "256"))
+
+# 프로세스 전체 공유 캐시 (같은 앱/건수 수집과 같은 데이터셋 감성 분석을 세션끼리 나눠 씀)
+SHARED_CACHE_MB = int(os.environ.get("SHARED_CACHE_MB", "512"))
+SHARED_CACHE_TTL = int(os.environ.get("SHARED_CACHE_TTL", "3600"))
+
+@cached(st.cache_resource(show_spinner=False), "공유 캐시")
+def get_shared_cache():
+    """프로세스 전체에서 공유하는 수집/분석 결과 캐시 (TTL + 메모리 예산 + 같은 키 단일 실행)"""
+    return SharedCache(SHARED_CACHE_TTL, SHARED_CACHE_MB * 1024 * 1024)
+
+def get_session_cache():
+    """세션별 분석 결과 캐시 (감성 분석 결과 + 분석 단계 결과)"""
+    if "result_cache" not in st.session_state:
+        st.session_state["result_cache"] = ResultCache(SESSION_CACHE_MB * 1024 * 1024)
+    return st.session_state["result_cache"]
+
+def render_collection_preview(placeholder, df, count):
+    """수집 중간 결과 (도착한 리뷰까지의 지표/평점 분포)"""
+    with placeholder.container():
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("수집된 리뷰", f"{len(df):,} / {count:,}")
+        with col2:
+            st.metric("평균 평점", f"{df['score'].mean():.1f}⭐")
+        with col3:
+            pos_ratio = (df["sentiment"] == "긍정").sum() / len(df) * 100
+            st.metric("긍정 비율", f"{pos_ratio:.0f}%")
+        st.bar_chart(df["score"].value_counts().sort_index())
+
+def get_reviews_with_progress(app_id, count=500, chunks_iter=None, store=None):
+    """리뷰 수집 (Modal API 스트리밍, 조각이 도착할 때마다 중간 결과 표시)
+
+    chunks_iter: 조각 제너레이터 (기본은 전체 수집, 저장소 동기화 시 sync_chunks)
+    store: 저장소 동기화 시 조각이 도착할 때마다 바로 저장 (중간 결과는 새 리뷰뿐이므로 세션에는 남기지 않음)
+    """
     progress_bar = st.progress(0, text="🚀 수집 서버 연결 중...")
+    preview = st.empty()
+    chunks = []
+    sentiments = []
     
     try:
-        progress_bar.progress(0.2, text="🔄 Google Play에서 리뷰 수집 중...")
-        
-        response = requests.get(
-            MODAL_API_URL,
-            params={"app_id": app_id, "count": count},
-            timeout=300
-        )
-        
-        progress_bar.progress(0.8, text="📊 데이터 처리 중...")
+        if chunks_iter is None:
+            chunks_iter = iter_review_chunks(MODAL_API_URL, app_id, count)
+        with span("리뷰 수집 (API 스트리밍 + 미리보기)") as frame:
+            for chunk in chunks_iter:
+                if chunk.empty:
+                    continue
+                chunks.append(chunk)
+                # 미리보기용 감성은 새로 도착한 조각만 분석해 누적
+                sentiments.append(score_sentiment(chunk["content"].to_numpy(), chunk["score"].to_numpy())["sentiment"])
+                df = pd.concat(chunks, ignore_index=True)
+                # 중간에 다른 위젯 조작으로 재실행되거나 오류가 나도 받은 만큼은 남김
+                if store is not None:
+                    store.add(app_id, chunk)
+                else:
+                    st.session_state["collected_df"] = compact_reviews(df.sort_values(by="at", ascending=False))
+                    st.session_state["collected_app"] = app_id
+                progress_bar.progress(min(len(df) / count, 1.0), text=f"🔄 Google Play에서 리뷰 수집 중... ({len(df):,}/{count:,})")
+                render_collection_preview(preview, df.assign(sentiment=np.concatenate(sentiments)), count)
+            frame["rows"] = sum(len(chunk) for chunk in chunks)
         
-        if response.status_code == 200:
-            result = response.json()
-            
-            if result.get("success"):
-                df = pd.DataFrame(result["data"])
-                if not df.empty:
-                    df["at"] = pd.to_datetime(df["at"], errors='coerce')
-                    df["content"] = df["content"].astype(str)
-                progress_bar.progress(1.0, text=f"✅ {len(df)}건 수집 완료!")
-                progress_bar.empty()
-                return df
-            else:
-                progress_bar.empty()
-                st.error(f"수집 실패: {result.get('error', '알 수 없는 오류')}")
-                return pd.DataFrame()
-        else:
-            progress_bar.empty()
-            st.error(f"API 오류: {response.status_code}")
-            return pd.DataFrame()
+        df = pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        progress_bar.progress(1.0, text=f"✅ {len(df)}건 수집 완료!")
+        progress_bar.empty()
+        preview.empty()
+        return df
             
     except requests.exceptions.Timeout:
         progress_bar.empty()
-        st.error("⏰ 수집 시간 초과 (5분). 수집 건수를 줄여주세요.")
+        st.error("⏰ 수집 서버 응답 대기 시간 초과. 수집 건수를 줄여주세요.")
+        return pd.DataFrame()
+    except CollectorError as e:
+        progress_bar.empty()
+        st.error(f"수집 실패: {e}")
         return pd.DataFrame()
     except Exception as e:
         progress_bar.empty()
         st.error(f"수집 중 오류: {e}")
         return pd.DataFrame()
 
+def get_reviews_shared(app_id, count=500):
+    """리뷰 수집 (같은 앱/건수는 세션 간 공유, 다른 세션이 수집 중이면 그 결과를 기다림) → (데이터, 캐시 상태)
+
+    실패하면 빈 데이터프레임 (실패 결과는 공유하지 않음)
+    """
+    waiting = st.empty()
+
+    def collect():
+        df = get_reviews_with_progress(app_id, count=count)
+        return None if df.empty else compact_reviews(df.sort_values(by="at", ascending=False))
+
+    def on_wait(waited_seconds):
+        # 기다리는 동안에도 st 호출이 있어야 이 세션의 중단/재실행 요청이 처리됨
+        waiting.info(f"⏳ 다른 세션에서 같은 앱을 수집 중입니다. 끝나면 같은 결과를 사용합니다... ({waited_seconds:.0f}초)")
+
+    with span("리뷰 수집 (공유 캐시)") as frame:
+        df, status = get_shared_cache().get_or_compute(("reviews", app_id, count), collect, on_wait)
+        frame["cache"] = status
+        frame["rows"] = 0 if df is None else len(df)
+    waiting.empty()
+    if df is None:
+        if status == WAITED:
+            st.error("수집 실패: 같은 앱을 수집하던 다른 세션에서 오류가 발생했습니다.")
+        return pd.DataFrame(), status
+    return df, status
+
+# 진행 중인 저장소 동기화의 앱 ID (끝나기 전에 재실행되면 남아 있음)
+SYNC_PENDING_KEY = "sync_pending_app"
+
+def load_synced_reviews(store, app_id):
+    """저장소에 쌓인 앱 리뷰 전체 (최신순)"""
+    with span("저장소 불러오기") as frame:
+        df = store.load(app_id)
+        frame["rows"] = len(df)
+    return compact_reviews(df.sort_values(by="at", ascending=False)) if not df.empty else df
+
+def restore_interrupted_sync():
+    """동기화가 위젯 조작 등으로 끊겼으면 그때까지 저장된 리뷰를 포함한 저장소 전체로 분석 데이터를 교체"""
+    app_id = st.session_state.pop(SYNC_PENDING_KEY, None)
+    if app_id is None:
+        return
+    df = load_synced_reviews(get_review_store(), app_id)
+    if not df.empty:
+        st.session_state["collected_df"] = df
+        st.session_state["collected_app"] = app_id
+        st.session_state["sync_message"] = f"⚠️ 동기화가 중단되어 저장된 리뷰 {len(df):,}건으로 분석합니다"
+
+def get_reviews_batch(app_ids, count=500):
+    """여러 앱 동시 수집 (앱 하나가 끝날 때마다 진행률 갱신, 실패한 앱은 건너뜀)"""
+    progress_bar = st.progress(0, text=f"🚀 {len(app_ids)}개 앱 동시 수집 중...")
+    done = []
+
+    def on_done(app_id, df, error):
+        done.append(app_id)
+        status = f"❌ {app_id}" if error else f"✅ {app_id} ({len(df):,}건)"
+        progress_bar.progress(len(done) / len(app_ids), text=f"🔄 {len(done)}/{len(app_ids)} 완료 - {status}")
+
+    with span("일괄 수집") as frame:
+        df, errors = collect_many(MODAL_API_URL, app_ids, count, on_done=on_done)
+        frame["rows"] = len(df)
+    progress_bar.empty()
+    for app_id, message in errors.items():
+        st.error(f"수집 실패 ({app_id}): {message}")
+    return df
+
 # ----------------------------
 # 분석 함수들 (캐싱 적용)
 # ----------------------------
-@st.cache_data(ttl=7200, show_spinner=False)
-def analyze_sentiment_basic_cached(df_json):
-    """기본 감성 분석 (캐싱용)"""
-    from io import StringIO
-    df = pd.read_json(StringIO(df_json))
-    results = []
-    
-    for _, row in df.iterrows():
-        text = str(row["content"])
-        score = row["score"]
-        
-        pos_count = sum(1 for w in POSITIVE_WORDS if w in text)
-        neg_count = sum(1 for w in NEGATIVE_WORDS if w in text)
-        
-        if score >= 4:
-            sentiment = "긍정"
-        elif score <= 2:
-            sentiment = "부정"
-        else:
-            if pos_count > neg_count:
-                sentiment = "긍정"
-            elif neg_count > pos_count:
-                sentiment = "부정"
-            else:
-                sentiment = "중립"
-        
-        results.append(sentiment)
-    
-    df["sentiment"] = results
-    df["pos_score"] = 0
-    df["neg_score"] = 0
-    return df.to_json()
-
-@st.cache_data(ttl=7200, show_spinner=False)
-def analyze_sentiment_webtoon_cached(df_json):
-    """웹툰/만화 특화 감성 분석 (캐싱용)"""
-    from io import StringIO
-    df = pd.read_json(StringIO(df_json))
-    results = []
-    pos_scores = []
-    neg_scores = []
-    
-    for _, row in df.iterrows():
-        text = str(row["content"])
-        score = row["score"]
-        
-        # 가중치 합산
-        pos_weight = sum(weight for word, weight in WEBTOON_SENTIMENT["positive"].items() if word in text)
-        neg_weight = sum(weight for word, weight in WEBTOON_SENTIMENT["negative"].items() if word in text)
-        
-        pos_scores.append(pos_weight)
-        neg_scores.append(neg_weight)
-        
-        # 평점 기반 기본 판단 + 가중치 보정
-        if score >= 4:
-            if neg_weight >= 6:
-                sentiment = "부정" if neg_weight > pos_weight else "긍정"
-            else:
-                sentiment = "긍정"
-        elif score <= 2:
-            if pos_weight >= 6:
-                sentiment = "긍정" if pos_weight > neg_weight else "부정"
-            else:
-                sentiment = "부정"
-        else:
-            diff = pos_weight - neg_weight
-            if diff >= 2:
-                sentiment = "긍정"
-            elif diff <= -2:
-                sentiment = "부정"
-            else:
-                sentiment = "중립"
-        
-        results.append(sentiment)
-    
-    df["sentiment"] = results
-    df["pos_score"] = pos_scores
-    df["neg_score"] = neg_scores
-    return df.to_json()
+# 대용량 분석 병렬 실행: 작업자 프로세스 수 (1이면 항상 직렬), 이보다 적은 리뷰는 직렬 실행
+ANALYSIS_WORKERS = int(os.environ.get("ANALYSIS_WORKERS", parallel.DEFAULT_WORKERS))
+PARALLEL_MIN_ROWS = int(os.environ.get("PARALLEL_MIN_ROWS", parallel.MIN_PARALLEL_ROWS))
+
+@cached(st.cache_data(ttl=7200, show_spinner=False), "감성 분석 (기본)", rows=content_rows)
+def analyze_sentiment_basic_cached(fingerprint, _contents, _scores):
+    """기본 감성 분석 (캐싱용, 데이터셋 지문으로 캐시 키 생성)"""
+    return pd.DataFrame(parallel.score_sentiment(_contents, _scores, False, ANALYSIS_WORKERS, PARALLEL_MIN_ROWS))
+
+@cached(st.cache_data(ttl=7200, show_spinner=False), "감성 분석 (웹툰)", rows=content_rows)
+def analyze_sentiment_webtoon_cached(fingerprint, _contents, _scores):
+    """웹툰/만화 특화 감성 분석 (캐싱용, 데이터셋 지문으로 캐시 키 생성)"""
+    # 가중치 합산 + 평점 기반 판단/보정을 컬럼 단위로 처리
+    return pd.DataFrame(parallel.score_sentiment(_contents, _scores, True, ANALYSIS_WORKERS, PARALLEL_MIN_ROWS))
+
+def _with_sentiment(df, columns):
+    """감성 결과 컬럼을 붙이고 작은 dtype 으로 (원본 컬럼 값은 그대로)"""
+    return compact_reviews(df.assign(**{name: columns[name].to_numpy() for name in columns.columns}))
 
 def analyze_sentiment_basic(df):
     """기본 감성 분석 (래퍼)"""
-    from io import StringIO
-    result_json = analyze_sentiment_basic_cached(df.to_json(date_format='iso'))
-    return pd.read_json(StringIO(result_json))
+    columns = analyze_sentiment_basic_cached(dataset_fingerprint(df), df["content"].to_numpy(), df["score"].to_numpy())
+    return _with_sentiment(df, columns)
 
 def analyze_sentiment_webtoon(df):
     """웹툰/만화 특화 감성 분석 (래퍼)"""
-    from io import StringIO
-    result_json = analyze_sentiment_webtoon_cached(df.to_json(date_format='iso'))
-    return pd.read_json(StringIO(result_json))
+    columns = analyze_sentiment_webtoon_cached(dataset_fingerprint(df), df["content"].to_numpy(), df["score"].to_numpy())
+    return _with_sentiment(df, columns)
 
 def get_matched_keywords(text, is_webtoon_mode=False):
     """텍스트에서 매칭된 감성 키워드 추출"""
-    if is_webtoon_mode:
-        pos_matched = [(w, weight) for w, weight in WEBTOON_SENTIMENT["positive"].items() if w in text]
-        neg_matched = [(w, weight) for w, weight in WEBTOON_SENTIMENT["negative"].items() if w in text]
-    else:
-        pos_matched = [(w, 1) for w in POSITIVE_WORDS if w in text]
-        neg_matched = [(w, 1) for w in NEGATIVE_WORDS if w in text]
-    return pos_matched, neg_matched
-
-@st.cache_data(ttl=7200)
-def analyze_topics(contents_tuple):
-    """토픽 분류 - 리뷰별로 분류 (복수 토픽 허용)"""
-    topic_priority = ["📚 콘텐츠", "💰 결제/가격", "📺 광고", "🐛 버그/오류", "📱 UI/UX", "🔔 알림/편의"]
-    topic_data = {topic: [] for topic in topic_priority}
-    
-    # 요청 패턴 (이게 있으면 버그가 아님)
-    request_patterns = ["해주", "해줘", "싶어", "바람", "원해", "으면 좋", "면 좋겠", "제발", "부탁", "없으면", "있으면"]
-    
-    for text in contents_tuple:
-        text = str(text)
-        is_request = any(p in text for p in request_patterns)
-        
-        # 복수 토픽 허용
-        for topic in topic_priority:
-            keywords = TOPIC_KEYWORDS[topic]
-            
-            # 버그/오류 토픽은 요청 패턴이 있으면 스킵
-            if topic == "🐛 버그/오류" and is_request:
-                continue
-            
-            if any(kw in text for kw in keywords):
-                topic_data[topic].append(text)
-    
-    return topic_data
+    matcher = WEBTOON_MATCHER if is_webtoon_mode else BASIC_MATCHER
+    found = matcher.find(text)
+    return found["positive"], found["negative"]
 
-@st.cache_data(ttl=7200)
-def extract_requests(contents_tuple):
+@cached(st.cache_data(ttl=7200, show_spinner=False), "토픽 분류", rows=content_rows)
+def analyze_topics(fingerprint, _contents):
+    """토픽 분류 - 리뷰 × 토픽 boolean 행렬 (복수 토픽 허용)"""
+    return parallel.topic_matrix(_contents, ANALYSIS_WORKERS, PARALLEL_MIN_ROWS)
+
+@cached(st.cache_data(ttl=7200, show_spinner=False), "요청사항 추출", rows=content_rows)
+def extract_requests(fingerprint, _contents):
     """요청사항 추출"""
-    requests = []
-    
-    for text in contents_tuple:
-        text = str(text)
-        for pattern in REQUEST_PATTERNS:
-            matches = re.findall(pattern, text)
-            for match in matches:
-                if isinstance(match, tuple):
-                    request_text = "".join(match)
-                else:
-                    request_text = match
-                if len(request_text) > 5:
-                    requests.append(request_text)
-    
-    return Counter(requests).most_common(30)
+    return parallel.extract_requests(_contents, ANALYSIS_WORKERS, PARALLEL_MIN_ROWS)
 
-@st.cache_data(ttl=7200, show_spinner=False)
-def analyze_complaints_trigram(contents_tuple, scores_tuple):
+@cached(st.cache_resource(ttl=7200, max_entries=8, show_spinner=False), "토큰화", rows=content_rows)
+def build_token_store(fingerprint, _contents):
+    """데이터셋 토큰 저장소 (리뷰당 1회 토큰화, 모든 텍스트 분석이 공유)"""
+    return parallel.build_token_store(_contents, ANALYSIS_WORKERS, PARALLEL_MIN_ROWS)
+
+@cached(st.cache_resource(ttl=7200, max_entries=8, show_spinner=False), "리뷰 색인", rows=content_rows)
+def build_review_index(fingerprint, _contents):
+    """리뷰 역색인 (키워드 심층 분석/리뷰 검색/불만 검색이 공유)"""
+    return ReviewIndex(_contents)
+
+@cached(st.cache_data(ttl=7200, show_spinner=False), "불만 n-gram", rows=content_rows)
+def analyze_complaints_trigram(fingerprint, _token_store, _scores):
     """불만 키워드 조합 분석 (1-2점 리뷰, 트리그램 - 3단어 조합)"""
-    negative_contents = [c for c, s in zip(contents_tuple, scores_tuple) if s <= 2]
-    
-    if not negative_contents:
-        return [], []
-    
-    bigrams = []
-    trigrams = []
-    for text in negative_contents:
-        bigrams += extract_bigrams(text)
-        trigrams += extract_trigrams(text)
-    
-    return Counter(bigrams).most_common(30), Counter(trigrams).most_common(30)
+    return complaint_ngrams(_token_store, _scores)
 
-@st.cache_data(ttl=7200, show_spinner=False)
-def analyze_positive_bigram(contents_tuple, scores_tuple):
+@cached(st.cache_data(ttl=7200, show_spinner=False), "긍정 bigram", rows=content_rows)
+def analyze_positive_bigram(fingerprint, _token_store, _scores):
     """긍정 키워드 조합 분석 (4-5점 리뷰, 바이그램)"""
-    positive_contents = [c for c, s in zip(contents_tuple, scores_tuple) if s >= 4]
-    
-    if not positive_contents:
-        return []
-    
-    bigrams = []
-    for text in positive_contents:
-        bigrams += extract_bigrams(text)
-    
-    return Counter(bigrams).most_common(30)
+    return positive_bigrams(_token_store, _scores)
+
+@cached(st.cache_data(ttl=7200, show_spinner=False), "키워드 빈도", rows=content_rows)
+def analyze_keywords(fingerprint, _token_store):
+    """전체 리뷰 상위 키워드 (워드클라우드용)"""
+    return top_ngrams(_token_store, 1, k=TOP_KEYWORDS)
+
+@cached(st.cache_resource(ttl=7200, max_entries=8, show_spinner=False), "동시출현 행렬", rows=content_rows)
+def build_cooccurrence(fingerprint, _token_store):
+    """토큰 동시출현 희소 행렬 (데이터셋당 1회, 연관어 PMI 계산용)"""
+    return CooccurrenceMatrix(_token_store)
+
+# ----------------------------
+# 분석 단계 (지연 계산: 열린 탭/바뀐 위젯에 필요한 단계만 실행)
+# ----------------------------
+# 입력: reviews(감성 포함 데이터, 키=지문+모드), fingerprint, contents, scores, stored_topics, 탭 위젯 값
+ANALYSIS = StageGraph()
+
+@ANALYSIS.stage("fingerprint", "contents", name="token_store")
+def stage_token_store(fingerprint, contents):
+    return build_token_store(fingerprint, contents)
+
+@ANALYSIS.stage("fingerprint", "contents", name="review_index")
+def stage_review_index(fingerprint, contents):
+    return build_review_index(fingerprint, contents)
+
+@ANALYSIS.stage("fingerprint", "token_store", name="cooccurrence")
+def stage_cooccurrence(fingerprint, token_store):
+    return build_cooccurrence(fingerprint, token_store)
+
+@ANALYSIS.stage("reviews", name="facets")
+def stage_facets(reviews):
+    return Facets(reviews["score"], reviews["sentiment"])
+
+@ANALYSIS.stage("facets", name="sentiment_by_score")
+def stage_sentiment_by_score(facets):
+    # 컬럼은 범주형이 아닌 일반 문자열 인덱스 (범주형 컬럼 인덱스는 표 직렬화(Arrow)에서 복원되지 않음)
+    return facets.crosstab()
+
+@ANALYSIS.stage("reviews", name="memory_report")
+def stage_memory_report(reviews):
+    return memory_report(reviews)
+
+@ANALYSIS.stage("fingerprint", "token_store", name="keywords")
+def stage_keywords(fingerprint, token_store):
+    return analyze_keywords(fingerprint, token_store)
+
+@ANALYSIS.stage("fingerprint", "token_store", "scores", name="positive_bigrams")
+def stage_positive_bigrams(fingerprint, token_store, scores):
+    return analyze_positive_bigram(fingerprint, token_store, scores)
+
+@ANALYSIS.stage("fingerprint", "token_store", "scores", name="complaint_ngrams")
+def stage_complaint_ngrams(fingerprint, token_store, scores):
+    return analyze_complaints_trigram(fingerprint, token_store, scores)
+
+@ANALYSIS.stage("fingerprint", "contents", "stored_topics", name="topics")
+def stage_topics(fingerprint, contents, stored_topics):
+    if stored_topics is not None:
+        return topic_matrix_from_masks(stored_topics)
+    return analyze_topics(fingerprint, contents)
+
+@ANALYSIS.stage("fingerprint", "contents", name="requests")
+def stage_requests(fingerprint, contents):
+    return extract_requests(fingerprint, contents)
+
+@ANALYSIS.stage("review_index", "deep_keyword", name="keyword_rows")
+def stage_keyword_rows(review_index, deep_keyword):
+    return deep_dive.keyword_rows(review_index, deep_keyword)
+
+@ANALYSIS.stage("reviews", "keyword_rows", "deep_keyword", name="keyword_sentiment")
+def stage_keyword_sentiment(reviews, keyword_rows, deep_keyword):
+    return deep_dive.keyword_sentiment(reviews["content"].to_numpy(), reviews["sentiment"].to_numpy(), keyword_rows, deep_keyword)
+
+@ANALYSIS.stage("cooccurrence", "keyword_rows", "deep_keyword", name="keyword_related")
+def stage_keyword_related(cooccurrence, keyword_rows, deep_keyword):
+    return deep_dive.related_terms(cooccurrence, keyword_rows, deep_keyword)
 
-@st.cache_data(ttl=7200)
-def generate_wordcloud_image(word_freq_tuple, font_path):
-    word_freq = dict(word_freq_tuple)
+@ANALYSIS.stage("token_store", "keyword_rows", "deep_keyword", name="keyword_bigrams")
+def stage_keyword_bigrams(token_store, keyword_rows, deep_keyword):
+    return deep_dive.keyword_bigrams(token_store, keyword_rows, deep_keyword)
+
+@ANALYSIS.stage("cooccurrence", "keyword_rows", "keyword_sentiment", "deep_keyword", name="keyword_split_related")
+def stage_keyword_split_related(cooccurrence, keyword_rows, keyword_sentiment, deep_keyword):
+    return deep_dive.split_related(cooccurrence, keyword_rows, keyword_sentiment, deep_keyword)
+
+@ANALYSIS.stage("facets", "review_index", "review_search", "review_score", "review_sent", name="review_rows")
+def stage_review_rows(facets, review_index, review_search, review_score, review_sent):
+    bitmap = facets.mask(review_score, review_sent)
+    if not review_search:
+        return facets.rows(bitmap)
+    return np.flatnonzero(facets.bool_mask(bitmap) & review_index.contains_mask(review_search))
+
+@ANALYSIS.stage("scores", "review_index", "complaint_search", name="complaint_rows")
+def stage_complaint_rows(scores, review_index, complaint_search):
+    mask = scores <= 2
+    if complaint_search:
+        mask = mask & review_index.contains_mask(complaint_search)
+    return np.flatnonzero(mask)
+
+@ANALYSIS.stage("reviews", "review_rows", "review_sort", name="review_sorted")
+def stage_review_sorted(reviews, review_rows, review_sort):
+    return paging.sorted_rows(reviews, review_rows, review_sort)
+
+@ANALYSIS.stage("reviews", "complaint_rows", "complaint_sort", name="complaint_sorted")
+def stage_complaint_sorted(reviews, complaint_rows, complaint_sort):
+    return paging.sorted_rows(reviews, complaint_rows, complaint_sort)
+
+ANALYSIS_TABS = ["📈 통계", "📂 토픽분류", "🔎 키워드분석", "🙏 요청/리뷰", "😊 감성/불만"]
+
+# 탭 안 위젯 기본값 (탭이 닫혀 위젯이 그려지지 않은 실행에서도 값이 유지되도록 session_state 로 관리)
+TAB_WIDGET_DEFAULTS = {
+    "deep_kw": "컷츠",
+    "review_search": "",
+    "review_score": [1, 2, 3, 4, 5],
+    "review_sent": ["긍정", "중립", "부정"],
+    "complaint_search": "",
+    "review_sort": "기본 순서",
+    "review_page": 1,
+    "complaint_sort": "기본 순서",
+    "complaint_page": 1,
+}
+
+def analysis_tabs():
+    """분석 탭 (지원하는 Streamlit 버전이면 선택된 탭만 실행)"""
+    for key, default in TAB_WIDGET_DEFAULTS.items():
+        # 다시 대입해 두면 위젯이 그려지지 않은 실행에서도 값이 지워지지 않음
+        st.session_state[key] = st.session_state.get(key, default)
     try:
-        wc = WordCloud(
-            font_path=font_path,
-            width=800, height=400,
-            background_color="white",
-            colormap="viridis",
-            max_words=50
+        return st.tabs(ANALYSIS_TABS, key="analysis_tab", on_change="rerun")
+    except TypeError:
+        # 지연 탭을 지원하지 않는 버전: 모든 탭 실행
+        return st.tabs(ANALYSIS_TABS)
+
+def tab_is_open(tab):
+    return getattr(tab, "open", None) is not False
+
+def render_trace(run, cache):
+    """이번 재실행의 단계 실행 기록 + 세션 캐시 통계"""
+    ran = sum(1 for _, status, _ in run.trace if status == RUN)
+    with st.expander(f"⏱️ 단계 실행 기록 (계산 {ran}개 / 캐시 {len(run.trace) - ran}개)", expanded=False):
+        stats = cache.stats()
+        st.caption(
+            f"세션 캐시: 적중 {stats['hits']:,} · 미스 {stats['misses']:,} · 제거 {stats['evictions']:,} "
+            f"(적중률 {stats['hit_rate']:.0%}) | {stats['entries']}개, "
+            f"{stats['bytes'] / 1024 / 1024:.1f} / {stats['max_bytes'] / 1024 / 1024:.0f} MB"
         )
-        wc.generate_from_frequencies(word_freq)
-        img_buffer = BytesIO()
-        wc.to_image().save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        return img_buffer.getvalue()
-    except:
-        return None
-
-@st.cache_data(ttl=7200)
-def extract_keywords_cached(contents_tuple):
-    tokens = []
-    for text in contents_tuple:
-        tokens += simple_tokenizer(text)
-    return tokens
-
-@st.cache_data(ttl=7200)
-def calculate_co_occurrence(contents_tuple):
-    co_occurrence = {}
-    for text in contents_tuple:
-        tokens = simple_tokenizer(text)
-        for i in range(len(tokens) - 1):
-            a, b = tokens[i], tokens[i + 1]
-            if a != b:
-                co_occurrence.setdefault(a, []).append(b)
-    return co_occurrence
+        trace_df = pd.DataFrame(run.trace, columns=["단계", "상태", "ms"]).round({"ms": 2})
+        st.dataframe(trace_df, use_container_width=True, hide_index=True)
 
 # ----------------------------
 # 메인 분석 표시 함수 (신규 수집용)
@@ -651,6 +633,19 @@ def display_analysis(df, app_name="", data_info=""):
     if data_info:
         st.info(data_info)
     
+    # 일괄 수집 데이터: 앱별로 나눠 보기
+    if "app_id" in df.columns and df["app_id"].nunique() > 1:
+        app_names = {app_id: name for name, app_id in APP_LIST.items()}
+        app_ids = list(df["app_id"].unique())
+        selected_app = st.selectbox(
+            "📱 앱 선택",
+            options=["전체"] + app_ids,
+            format_func=lambda app_id: app_names.get(app_id, app_id)
+        )
+        if selected_app != "전체":
+            df = df[df["app_id"] == selected_app].reset_index(drop=True)
+            app_name = app_names.get(selected_app, selected_app)
+    
     # 웹툰 특화 키워드 help 텍스트 (표 형태)
     webtoon_help = """
 【긍정 키워드 (가중치)】
@@ -664,8 +659,9 @@ def display_analysis(df, app_name="", data_info=""):
 • 극단: 하차(3), 시간낭비(3), 발암(3)
 """
     
-    # 데이터 고유 키 생성 (캐싱용)
-    data_key = f"{app_name}_{len(df)}"
+    # 데이터 고유 키 (캐싱용, 리뷰 내용 기반이라 같은 앱/같은 건수의 다른 데이터와 겹치지 않음)
+    fingerprint = dataset_fingerprint(df)
+    cache = get_session_cache()
     
     # 웹툰 특화 모드 토글
     col1, col2 = st.columns([3, 1])
@@ -675,339 +671,486 @@ def display_analysis(df, app_name="", data_info=""):
         webtoon_mode = st.toggle("🎨 웹툰 특화 분석", value=True, help=webtoon_help)
     
     # 감성 분석: 이미 sentiment 컬럼이 있으면 그대로 사용
-    if "sentiment" not in df.columns:
+    if "sentiment" not in df.columns and set(STORED_COLUMNS) <= set(df.columns):
+        # 저장소 데이터: 저장할 때 분석해 둔 모드별 결과 사용
+        df = compact_reviews(df.assign(**stored_sentiment(df, webtoon_mode)))
+    elif "sentiment" not in df.columns:
         # sentiment 없을 때만 분석 (새로 수집한 데이터)
-        cache_key = f"analyzed_{data_key}_{'webtoon' if webtoon_mode else 'basic'}"
-        if cache_key in st.session_state:
-            df = st.session_state[cache_key]
-        else:
+        cache_key = ("sentiment", fingerprint, "webtoon" if webtoon_mode else "basic")
+        analyzed = cache.get(cache_key)
+        if analyzed is None:
+            # 다른 세션이 같은 데이터셋을 분석했거나 분석 중이면 그 결과를 함께 사용
+            analyze = analyze_sentiment_webtoon if webtoon_mode else analyze_sentiment_basic
             with st.spinner("🔄 감성 분석 중..."):
-                if webtoon_mode:
-                    df = analyze_sentiment_webtoon(df)
-                else:
-                    df = analyze_sentiment_basic(df)
-                st.session_state[cache_key] = df
+                with span("감성 분석 (공유 캐시)", rows=len(df)) as frame:
+                    analyzed, frame["cache"] = get_shared_cache().get_or_compute(cache_key, lambda: analyze(df))
+            cache[cache_key] = analyzed
+        df = analyzed
     
-    # datetime 변환 확인
+    # datetime 변환 확인 (공유 캐시 값일 수 있으므로 새 데이터프레임으로)
     if not pd.api.types.is_datetime64_any_dtype(df["at"]):
-        df["at"] = pd.to_datetime(df["at"])
+        df = df.assign(at=pd.to_datetime(df["at"]))
+    
+    # 기본 데이터와 같은 리뷰면 미리 계산된 분석 스냅샷 섹션을 그대로 사용
+    snapshot = load_default_snapshot()
+    if not snapshot_matches(snapshot, df):
+        snapshot = None
     
-    contents_tuple = tuple(df["content"].tolist())
-    scores_tuple = tuple(df["score"].tolist())
+    # 이번 재실행의 단계 입력 (큰 값은 지문을 캐시 키로 사용)
+    run = ANALYSIS.run(cache)
+    run.set_input("reviews", df, key=(fingerprint, webtoon_mode))
+    run.set_input("fingerprint", fingerprint)
+    run.set_input("contents", df["content"].to_numpy(), key=fingerprint)
+    run.set_input("scores", df["score"].to_numpy(), key=fingerprint)
+    run.set_input("stored_topics", df["topic_mask"].to_numpy() if "topic_mask" in df.columns else None, key=fingerprint)
     
     # 탭 구성 (5개) - 순서: 통계, 토픽, 키워드, 요청/리뷰, 감성/불만
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
-        "📈 통계", "📂 토픽분류", "🔎 키워드분석", "🙏 요청/리뷰", "😊 감성/불만"
-    ])
-    
-    # ----------------------------
-    # 탭 1: 통계
-    # ----------------------------
-    with tab1:
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.metric("총 리뷰", f"{len(df):,}")
-        with col2:
-            st.metric("평균 평점", f"{df['score'].mean():.1f}⭐")
-        with col3:
-            pos_ratio = (df["sentiment"] == "긍정").sum() / len(df) * 100
-            st.metric("긍정 비율", f"{pos_ratio:.0f}%")
-        with col4:
-            neg_ratio = (df["sentiment"] == "부정").sum() / len(df) * 100
-            st.metric("부정 비율", f"{neg_ratio:.0f}%")
-        
+    tabs = analysis_tabs()
+    renderers = [render_stats_tab, render_topics_tab, render_keyword_tab, render_reviews_tab, render_sentiment_tab]
+    for tab, render in zip(tabs, renderers):
+        if tab_is_open(tab):
+            with tab:
+                render(run, snapshot, webtoon_mode)
+    
+    render_trace(run, cache)
+
+# ----------------------------
+# 탭 1: 통계
+# ----------------------------
+def render_stats_tab(run, snapshot, webtoon_mode):
+    df = run["reviews"]
+    sentiment_counts = run["facets"].sentiment_counts()
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("총 리뷰", f"{len(df):,}")
+    with col2:
+        st.metric("평균 평점", f"{df['score'].mean():.1f}⭐")
+    with col3:
+        pos_ratio = sentiment_counts.get("긍정", 0) / len(df) * 100
+        st.metric("긍정 비율", f"{pos_ratio:.0f}%")
+    with col4:
+        neg_ratio = sentiment_counts.get("부정", 0) / len(df) * 100
+        st.metric("부정 비율", f"{neg_ratio:.0f}%")
+    
+    st.markdown("---")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 🗓️ 날짜별 리뷰")
+        daily = df.groupby(df["at"].dt.date).size()
+        st.line_chart(daily)
+    
+    with col2:
+        st.markdown("#### ⭐ 평점 분포")
+        st.bar_chart(run["facets"].score_counts())
+    
+    # 데이터셋 메모리 (컬럼별 dtype / 사용량)
+    report, total_bytes = run["memory_report"]
+    with st.expander(f"🧮 데이터셋 메모리 ({total_bytes / 1024 / 1024:.2f} MB)", expanded=False):
+        st.dataframe(report, use_container_width=True, hide_index=True)
+
+# ----------------------------
+# 탭 5: 감성/불만 분석 (통합)
+# ----------------------------
+def render_sentiment_tab(run, snapshot, webtoon_mode):
+    df = run["reviews"]
+    
+    # 감성 분석 섹션
+    st.markdown("### 😊 감성 분석")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        sentiment_counts = run["facets"].sentiment_counts()
+        sentiment_counts = sentiment_counts[sentiment_counts > 0]
+        for sentiment, count in sentiment_counts.items():
+            pct = count / len(df) * 100
+            if sentiment == "긍정":
+                st.success(f"😊 긍정: **{count:,}건** ({pct:.1f}%)")
+            elif sentiment == "부정":
+                st.error(f"😤 부정: **{count:,}건** ({pct:.1f}%)")
+            else:
+                st.warning(f"😐 중립: **{count:,}건** ({pct:.1f}%)")
+    
+    with col2:
+        if snapshot:
+            sentiment_by_score = sentiment_by_score_frame(snapshot)
+        else:
+            sentiment_by_score = run["sentiment_by_score"]
+        st.dataframe(sentiment_by_score, use_container_width=True)
+    
+    # 웹툰 모드일 때 감성 점수 표시
+    if webtoon_mode and "pos_score" in df.columns:
         st.markdown("---")
-        
-        col1, col2 = st.columns(2)
-        with col1:
-            st.markdown("#### 🗓️ 날짜별 리뷰")
-            daily = df.groupby(df["at"].dt.date).size()
-            st.line_chart(daily)
-        
-        with col2:
-            st.markdown("#### ⭐ 평점 분포")
-            scores = df["score"].value_counts().sort_index()
-            st.bar_chart(scores)
-    
-    # ----------------------------
-    # 탭 5: 감성/불만 분석 (통합)
-    # ----------------------------
-    with tab5:
-        # 감성 분석 섹션
-        st.markdown("### 😊 감성 분석")
-        
+        st.markdown("#### 🎯 감성 점수 분포 (웹툰 특화)")
         col1, col2 = st.columns(2)
-        
         with col1:
-            sentiment_counts = df["sentiment"].value_counts()
-            for sentiment, count in sentiment_counts.items():
-                pct = count / len(df) * 100
-                if sentiment == "긍정":
-                    st.success(f"😊 긍정: **{count:,}건** ({pct:.1f}%)")
-                elif sentiment == "부정":
-                    st.error(f"😤 부정: **{count:,}건** ({pct:.1f}%)")
-                else:
-                    st.warning(f"😐 중립: **{count:,}건** ({pct:.1f}%)")
-        
+            avg_pos = df["pos_score"].mean()
+            max_pos = df["pos_score"].max()
+            st.metric("평균 긍정 점수", f"{avg_pos:.1f}", help=f"최대 {max_pos}")
         with col2:
-            sentiment_by_score = df.groupby(["score", "sentiment"]).size().unstack(fill_value=0)
-            st.dataframe(sentiment_by_score, use_container_width=True)
-        
-        # 웹툰 모드일 때 감성 점수 표시
-        if webtoon_mode and "pos_score" in df.columns:
-            st.markdown("---")
-            st.markdown("#### 🎯 감성 점수 분포 (웹툰 특화)")
-            col1, col2 = st.columns(2)
-            with col1:
-                avg_pos = df["pos_score"].mean()
-                max_pos = df["pos_score"].max()
-                st.metric("평균 긍정 점수", f"{avg_pos:.1f}", help=f"최대 {max_pos}")
-            with col2:
-                avg_neg = df["neg_score"].mean()
-                max_neg = df["neg_score"].max()
-                st.metric("평균 부정 점수", f"{avg_neg:.1f}", help=f"최대 {max_neg}")
-        
+            avg_neg = df["neg_score"].mean()
+            max_neg = df["neg_score"].max()
+            st.metric("평균 부정 점수", f"{avg_neg:.1f}", help=f"최대 {max_neg}")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 😊 긍정 키워드 조합")
+        if snapshot:
+            pos_bigrams = snapshot["positives"]["bigrams"]
+        else:
+            pos_bigrams = run["positive_bigrams"]
+        if pos_bigrams:
+            pos_df = pd.DataFrame(pos_bigrams[:10], columns=["키워드 조합", "빈도"])
+            st.dataframe(pos_df, use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("#### 😤 부정 키워드 조합")
+        if snapshot:
+            neg_bigrams, neg_trigrams = snapshot["complaints"]["bigrams"], snapshot["complaints"]["trigrams"]
+        else:
+            neg_bigrams, neg_trigrams = run["complaint_ngrams"]
+        if neg_bigrams:
+            neg_df_display = pd.DataFrame(neg_bigrams[:10], columns=["키워드 조합", "빈도"])
+            st.dataframe(neg_df_display, use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # 불만 분석 섹션
+    st.markdown("### 😤 불만 집중 분석 (1~2점)")
+    
+    neg_count = int((run["scores"] <= 2).sum())
+    
+    st.markdown(f"🔴 불만 리뷰: **{neg_count:,}건** ({neg_count/len(df)*100:.1f}%)")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 2단어 조합")
+        if neg_bigrams:
+            st.dataframe(pd.DataFrame(neg_bigrams[:15], columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
+    
+    with col2:
+        st.markdown("#### 3단어 조합 (맥락)")
+        if neg_trigrams:
+            st.dataframe(pd.DataFrame(neg_trigrams[:15], columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
+    
+    # 불만 리뷰 원문
+    with st.expander(f"📋 불만 리뷰 원문 ({neg_count:,}건)", expanded=True):
+        search_complaint = st.text_input("🔍 검색", key="complaint_search", on_change=reset_page, args=("complaint",))
+        run.set_input("complaint_search", search_complaint)
+        render_review_page(run, df, "complaint", {"at": "날짜", "score": "평점", "content": "내용"}, height=300)
+
+# ----------------------------
+# 탭 2: 토픽분류
+# ----------------------------
+def render_topics_tab(run, snapshot, webtoon_mode):
+    df = run["reviews"]
+    contents = run["contents"]
+    st.markdown("### 📂 토픽별 리뷰 분류")
+    
+    if snapshot:
+        topics = rows_to_matrix(snapshot["topics"], len(df))
+    else:
+        topics = run["topics"]
+    sorted_topics = sorted(topic_counts(topics).items(), key=lambda x: x[1], reverse=True)
+    
+    # 요약 테이블
+    summary_data = []
+    for topic, count in sorted_topics:
+        summary_data.append({"토픽": topic, "건수": count, "비율": f"{count/len(df)*100:.1f}%"})
+    st.dataframe(pd.DataFrame(summary_data), use_container_width=True, hide_index=True)
+    
+    st.markdown("---")
+    
+    # 토픽별 펼침 (예시 리뷰는 행렬에서 앞 5건만 꺼냄)
+    for topic, count in sorted_topics:
+        with st.expander(f"{topic} ({count:,}건)", expanded=True):
+            if count:
+                keywords = TOPIC_KEYWORDS[topic]
+                st.caption(f"🔑 키워드: {', '.join(keywords[:8])}")
+                example_rows = np.flatnonzero(topics[:, TOPIC_PRIORITY.index(topic)])[:5]
+                for i, row in enumerate(example_rows, 1):
+                    review = str(contents[row])
+                    truncated = review[:120] + "..." if len(review) > 120 else review
+                    st.text(f"{i}. {truncated}")
+            else:
+                st.info("해당 토픽 리뷰 없음")
+
+# ----------------------------
+# 탭 3: 키워드 분석 (통합)
+# ----------------------------
+def render_related_table(related):
+    if related:
+        columns = RELATED_COLUMNS if len(related[0]) == len(RELATED_COLUMNS) else FREQUENT_COLUMNS
+        st.dataframe(pd.DataFrame(related, columns=columns), use_container_width=True, hide_index=True)
+    else:
+        st.caption(RELATED_EMPTY)
+
+def wordcloud_pending(future, preview):
+    """렌더링이 끝날 때까지 미리보기 표시 (주기적으로 이 부분만 다시 실행), 끝나면 전체 재실행으로 교체"""
+    if future.done():
+        st.rerun()
+    if preview is not None:
+        st.image(preview, use_container_width=True)
+    st.caption("⏳ 워드클라우드 생성 중... (미리보기)")
+
+def render_wordcloud(word_freq):
+    """워드클라우드 (디스크 캐시에 있으면 바로, 없으면 저해상도 미리보기 후 백그라운드 렌더링 결과로 교체)"""
+    renderer = get_wordcloud_cache()
+    word_freq = tuple(word_freq)
+    key = renderer.key(word_freq, FONT_PATH)
+    png = renderer.load(key)
+    if png is not None:
+        st.image(png, use_container_width=True)
+        return
+    if renderer.failed(key):
+        st.caption("워드클라우드를 만들 수 없습니다")
+        return
+    future = renderer.submit(word_freq, FONT_PATH)
+    if future.done() and future.result() is not None:
+        st.image(future.result(), use_container_width=True)
+        return
+    st.fragment(wordcloud_pending, run_every=WORDCLOUD_POLL_SECONDS)(future, renderer.preview(word_freq, FONT_PATH))
+
+def render_keyword_tab(run, snapshot, webtoon_mode):
+    df = run["reviews"]
+    
+    # 전체 키워드 워드클라우드
+    st.markdown("### ☁️ 키워드 워드클라우드")
+    word_freq = snapshot["keywords"] if snapshot else run["keywords"]
+    if word_freq:
+        render_wordcloud(word_freq)
+    
+    # 키워드 심층 분석
+    st.markdown("### 🔍 키워드 심층 분석")
+    st.caption("특정 키워드 입력 시 해당 리뷰만 추출하여 분석")
+    
+    # 분석할 키워드 입력 (타이틀 + 인풋 가로 배치)
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        st.markdown('<p style="margin-top: 8px;">분석할 키워드</p>', unsafe_allow_html=True)
+    with col2:
+        st.markdown('<div class="keyword-input">', unsafe_allow_html=True)
+        deep_keyword = st.text_input("분석할 키워드", placeholder="예: 광고, 결제", key="deep_kw", max_chars=30, label_visibility="collapsed")
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    if not deep_keyword:
+        st.caption("💡 추천: 광고, 결제, 버그, 로딩, 작품, 연재, 쿠키")
+        return
+    
+    run.set_input("deep_keyword", deep_keyword)
+    keyword_rows = run["keyword_rows"]
+    if len(keyword_rows) == 0:
+        st.warning(f"'{deep_keyword}' 포함 리뷰 없음")
+        return
+    
+    keyword_df = df.iloc[keyword_rows].copy()
+    keyword_df["keyword_sentiment"] = run["keyword_sentiment"]
+    
+    st.success(f"**'{deep_keyword}'** 관련 **{len(keyword_df):,}건** ({len(keyword_df)/len(df)*100:.1f}%)")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    pos_cnt = (keyword_df["keyword_sentiment"] == "긍정").sum()
+    neg_cnt = (keyword_df["keyword_sentiment"] == "부정").sum()
+    
+    with col1:
+        st.metric("리뷰 수", f"{len(keyword_df):,}")
+    with col2:
+        st.metric("평균 평점", f"{keyword_df['score'].mean():.1f}⭐")
+    with col3:
+        st.metric(f"'{deep_keyword}' 긍정", f"{pos_cnt/len(keyword_df)*100:.0f}%", help="키워드 문맥 기반")
+    with col4:
+        st.metric(f"'{deep_keyword}' 부정", f"{neg_cnt/len(keyword_df)*100:.0f}%", help="키워드 문맥 기반")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### 연관 키워드", help=RELATED_HELP)
+        render_related_table(run["keyword_related"])
+    
+    with col2:
+        st.markdown("#### 키워드 조합")
+        bigram_cnt = run["keyword_bigrams"]
+        if bigram_cnt:
+            st.dataframe(pd.DataFrame(bigram_cnt, columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
+    
+    # 긍정/부정 리뷰 비교 (키워드 문맥 기반)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"#### 😊 '{deep_keyword}' 긍정 ({pos_cnt}건)")
+        pos_examples = keyword_df[keyword_df["keyword_sentiment"] == "긍정"].head(5)
+        for score, content in zip(pos_examples["score"], pos_examples["content"]):
+            st.caption(f"⭐{score} | {content[:80]}...")
+    with col2:
+        st.markdown(f"#### 😤 '{deep_keyword}' 부정 ({neg_cnt}건)")
+        neg_examples = keyword_df[keyword_df["keyword_sentiment"] == "부정"].head(5)
+        for score, content in zip(neg_examples["score"], neg_examples["content"]):
+            st.caption(f"⭐{score} | {content[:80]}...")
+    
+    st.markdown("---")
+    
+    # 하위: 긍부정별 연관 키워드 분석 (해당 리뷰들만의 동시출현 PMI)
+    st.markdown(f"### 📊 '{deep_keyword}' 연관 긍부정 키워드 분석")
+    
+    split_related = run["keyword_split_related"]
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 😊 긍정 리뷰 연관 키워드", help=RELATED_HELP)
+        if split_related["긍정"] is not None:
+            render_related_table(split_related["긍정"])
+        else:
+            st.info("긍정 리뷰 없음")
+    
+    with col2:
+        st.markdown("#### 😤 부정 리뷰 연관 키워드", help=RELATED_HELP)
+        if split_related["부정"] is not None:
+            render_related_table(split_related["부정"])
+        else:
+            st.info("부정 리뷰 없음")
+
+# ----------------------------
+# 탭 4: 요청/리뷰 (통합)
+# ----------------------------
+def reset_page(prefix):
+    """필터/정렬이 바뀌면 첫 페이지로"""
+    st.session_state[f"{prefix}_page"] = 1
+
+def render_review_page(run, df, prefix, columns, height):
+    """리뷰 목록 한 페이지 (필터 결과는 행 번호 단계로 캐시, 정렬도 행 번호로, 보이는 행만 변환해 전송)
+
+    prefix: 행 번호 단계/위젯 키 앞부분 ("review" → review_rows, review_sort, review_page)
+    """
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        sort = st.selectbox("정렬", list(paging.SORT_OPTIONS), key=f"{prefix}_sort", on_change=reset_page, args=(prefix,))
+    run.set_input(f"{prefix}_sort", sort)
+    rows = run[f"{prefix}_sorted"]
+    
+    pages = paging.page_count(len(rows))
+    page_key = f"{prefix}_page"
+    st.session_state[page_key] = min(max(st.session_state[page_key], 1), pages)
+    with col2:
+        page = st.number_input("페이지", min_value=1, max_value=pages, step=1, key=page_key)
+    with col3:
+        if len(rows):
+            start = (page - 1) * paging.PAGE_SIZE
+            st.caption(f"{start + 1:,}–{min(start + paging.PAGE_SIZE, len(rows)):,} / {len(rows):,}건 ({pages:,}페이지)")
+    
+    page_df = paging.format_page(df, paging.page_rows(rows, page), columns)
+    st.dataframe(page_df, use_container_width=True, hide_index=True, height=height)
+
+def render_reviews_tab(run, snapshot, webtoon_mode):
+    df = run["reviews"]
+    
+    # 요청사항 섹션
+    st.markdown("### 🙏 사용자 요청사항")
+    
+    if snapshot:
+        requests = snapshot["requests"]
+    else:
+        requests = run["requests"]
+    
+    if requests:
         col1, col2 = st.columns(2)
         with col1:
-            st.markdown("#### 😊 긍정 키워드 조합")
-            pos_bigrams = analyze_positive_bigram(contents_tuple, scores_tuple)
-            if pos_bigrams:
-                pos_df = pd.DataFrame(pos_bigrams[:10], columns=["키워드 조합", "빈도"])
-                st.dataframe(pos_df, use_container_width=True, hide_index=True)
-        
+            st.markdown(f"#### 요청사항 TOP 15")
+            st.dataframe(pd.DataFrame(requests[:15], columns=["요청", "횟수"]), use_container_width=True, hide_index=True)
         with col2:
-            st.markdown("#### 😤 부정 키워드 조합")
-            neg_bigrams, neg_trigrams = analyze_complaints_trigram(contents_tuple, scores_tuple)
-            if neg_bigrams:
-                neg_df_display = pd.DataFrame(neg_bigrams[:10], columns=["키워드 조합", "빈도"])
-                st.dataframe(neg_df_display, use_container_width=True, hide_index=True)
-        
+            st.markdown("#### 요청 빈도")
+            st.bar_chart(pd.DataFrame(requests[:8], columns=["요청", "횟수"]).set_index("요청"))
+    else:
+        st.info("요청사항 없음")
+    
+    st.markdown("---")
+    
+    # 리뷰 원문 섹션
+    st.markdown("### 📝 리뷰 원문")
+    
+    # 키워드 검색, 평점, 감성 같은 라인 (균등 배치)
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        st.markdown('<div class="keyword-input">', unsafe_allow_html=True)
+        keyword = st.text_input("키워드 검색", key="review_search", max_chars=30, placeholder="검색어 입력", on_change=reset_page, args=("review",))
+        st.markdown('</div>', unsafe_allow_html=True)
+    with col2:
+        score_filter = st.multiselect("평점", [1,2,3,4,5], key="review_score", on_change=reset_page, args=("review",))
+    with col3:
+        sentiment_filter = st.multiselect("감성", ["긍정", "중립", "부정"], key="review_sent", on_change=reset_page, args=("review",))
+    
+    run.set_input("review_search", keyword)
+    run.set_input("review_score", tuple(score_filter))
+    run.set_input("review_sent", tuple(sentiment_filter))
+    st.write(f"**{len(run['review_rows']):,}건**")
+    
+    render_review_page(run, df, "review", {"at": "날짜", "score": "평점", "sentiment": "감성", "content": "내용"}, height=400)
+
+# ----------------------------
+# 성능 계측 (사이드바 하단, 켜져 있을 때만 기록)
+# ----------------------------
+INSTRUMENT_KEY = "instrumentation_enabled"
+# 내보내기에 포함할 최근 재실행 수
+INSTRUMENT_HISTORY = 20
+
+def add_instrumentation_history(recorder):
+    history = st.session_state.setdefault("instrumentation_history", [])
+    history.append(recorder.to_dict())
+    del history[:-INSTRUMENT_HISTORY]
+    return history
+
+def start_instrumentation():
+    """이번 재실행 계측 시작"""
+    interrupted = deactivate()
+    if interrupted is not None:
+        # st.rerun 으로 끊긴 재실행(수집 직후 등)의 기록도 내보내기에 남김
+        add_instrumentation_history(interrupted)
+    st.session_state[INSTRUMENT_KEY] = st.session_state.get(INSTRUMENT_KEY, False)
+    if st.session_state[INSTRUMENT_KEY]:
+        activate(RerunRecorder(label=st.session_state.get("collected_app") or "기본 데이터"))
+
+def render_instrumentation_panel(recorder):
+    """계측 결과 (구간별 시간/처리 행 수/캐시 적중, 재실행 RSS 변화와 프로세스 최대 RSS) + JSON 내보내기"""
+    with st.sidebar:
         st.markdown("---")
-        
-        # 불만 분석 섹션
-        st.markdown("### 😤 불만 집중 분석 (1~2점)")
-        
-        neg_bigrams, neg_trigrams = analyze_complaints_trigram(contents_tuple, scores_tuple)
-        neg_df = df[df["score"] <= 2]
-        
-        st.markdown(f"🔴 불만 리뷰: **{len(neg_df):,}건** ({len(neg_df)/len(df)*100:.1f}%)")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            st.markdown("#### 2단어 조합")
-            if neg_bigrams:
-                st.dataframe(pd.DataFrame(neg_bigrams[:15], columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
-        
-        with col2:
-            st.markdown("#### 3단어 조합 (맥락)")
-            if neg_trigrams:
-                st.dataframe(pd.DataFrame(neg_trigrams[:15], columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
-        
-        # 불만 리뷰 원문
-        with st.expander(f"📋 불만 리뷰 원문 ({len(neg_df):,}건)", expanded=True):
-            search_complaint = st.text_input("🔍 검색", key="complaint_search")
-            filtered_neg = neg_df.copy()
-            if search_complaint:
-                filtered_neg = filtered_neg[filtered_neg["content"].str.contains(search_complaint, na=False)]
+        with st.expander("🛠️ 성능 계측", expanded=recorder is not None):
+            st.toggle("계측 켜기", key=INSTRUMENT_KEY, help="켜면 다음 재실행부터 분석 함수/수집 호출의 시간, 캐시 적중, 최대 메모리를 기록")
+            if recorder is None:
+                st.caption("꺼져 있으면 기록하지 않음")
+                return
             
-            display_neg = filtered_neg[["at", "score", "content"]].copy()
-            display_neg["at"] = display_neg["at"].dt.strftime("%Y-%m-%d")
-            display_neg.columns = ["날짜", "평점", "내용"]
-            st.dataframe(display_neg, use_container_width=True, hide_index=True, height=300)
-    
-    # ----------------------------
-    # 탭 2: 토픽분류
-    # ----------------------------
-    with tab2:
-        st.markdown("### 📂 토픽별 리뷰 분류")
-        
-        topic_data = analyze_topics(contents_tuple)
-        sorted_topics = sorted(topic_data.items(), key=lambda x: len(x[1]), reverse=True)
-        
-        # 요약 테이블
-        summary_data = []
-        for topic, reviews_list in sorted_topics:
-            summary_data.append({"토픽": topic, "건수": len(reviews_list), "비율": f"{len(reviews_list)/len(df)*100:.1f}%"})
-        st.dataframe(pd.DataFrame(summary_data), use_container_width=True, hide_index=True)
-        
-        st.markdown("---")
-        
-        # 토픽별 펼침
-        for topic, reviews_list in sorted_topics:
-            with st.expander(f"{topic} ({len(reviews_list):,}건)", expanded=True):
-                if reviews_list:
-                    keywords = TOPIC_KEYWORDS[topic]
-                    st.caption(f"🔑 키워드: {', '.join(keywords[:8])}")
-                    for i, review in enumerate(reviews_list[:5], 1):
-                        truncated = review[:120] + "..." if len(review) > 120 else review
-                        st.text(f"{i}. {truncated}")
-                else:
-                    st.info("해당 토픽 리뷰 없음")
-    
-    # ----------------------------
-    # 탭 3: 키워드 분석 (통합)
-    # ----------------------------
-    with tab3:
-        # 키워드 심층 분석
-        st.markdown("### 🔍 키워드 심층 분석")
-        st.caption("특정 키워드 입력 시 해당 리뷰만 추출하여 분석")
-        
-        # 분석할 키워드 입력 (타이틀 + 인풋 가로 배치)
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            st.markdown('<p style="margin-top: 8px;">분석할 키워드</p>', unsafe_allow_html=True)
-        with col2:
-            st.markdown('<div class="keyword-input">', unsafe_allow_html=True)
-            deep_keyword = st.text_input("분석할 키워드", value="컷츠", placeholder="예: 광고, 결제", key="deep_kw", max_chars=30, label_visibility="collapsed")
-            st.markdown('</div>', unsafe_allow_html=True)
-        
-        if deep_keyword:
-            keyword_df = df[df["content"].str.contains(deep_keyword, na=False, case=False)].copy()
+            history = add_instrumentation_history(recorder)
             
-            if keyword_df.empty:
-                st.warning(f"'{deep_keyword}' 포함 리뷰 없음")
-            else:
-                # 키워드 문맥 기반 감성 재분류
-                keyword_sentiments = []
-                for _, row in keyword_df.iterrows():
-                    context_sentiment = analyze_keyword_context_sentiment(row["content"], deep_keyword)
-                    # 문맥 감성이 있으면 그걸 사용, 없으면 기존 감성 사용
-                    keyword_sentiments.append(context_sentiment if context_sentiment else row["sentiment"])
-                keyword_df["keyword_sentiment"] = keyword_sentiments
-                
-                st.success(f"**'{deep_keyword}'** 관련 **{len(keyword_df):,}건** ({len(keyword_df)/len(df)*100:.1f}%)")
-                
-                col1, col2, col3, col4 = st.columns(4)
-                pos_cnt = (keyword_df["keyword_sentiment"] == "긍정").sum()
-                neg_cnt = (keyword_df["keyword_sentiment"] == "부정").sum()
-                
-                with col1:
-                    st.metric("리뷰 수", f"{len(keyword_df):,}")
-                with col2:
-                    st.metric("평균 평점", f"{keyword_df['score'].mean():.1f}⭐")
-                with col3:
-                    st.metric(f"'{deep_keyword}' 긍정", f"{pos_cnt/len(keyword_df)*100:.0f}%", help="키워드 문맥 기반")
-                with col4:
-                    st.metric(f"'{deep_keyword}' 부정", f"{neg_cnt/len(keyword_df)*100:.0f}%", help="키워드 문맥 기반")
-                
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("#### 연관 키워드")
-                    kw_tokens = extract_keywords_cached(tuple(keyword_df["content"].tolist()))
-                    kw_tokens = [t for t in kw_tokens if deep_keyword not in t and t not in deep_keyword]
-                    kw_counter = Counter(kw_tokens).most_common(10)
-                    if kw_counter:
-                        st.dataframe(pd.DataFrame(kw_counter, columns=["키워드", "빈도"]), use_container_width=True, hide_index=True)
-                
-                with col2:
-                    st.markdown("#### 키워드 조합")
-                    bigrams = []
-                    for text in keyword_df["content"]:
-                        bigrams += extract_bigrams(text)
-                    bigrams = [b for b in bigrams if deep_keyword in b]
-                    bigram_cnt = Counter(bigrams).most_common(10)
-                    if bigram_cnt:
-                        st.dataframe(pd.DataFrame(bigram_cnt, columns=["조합", "빈도"]), use_container_width=True, hide_index=True)
-                
-                # 긍정/부정 리뷰 비교 (키워드 문맥 기반)
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f"#### 😊 '{deep_keyword}' 긍정 ({pos_cnt}건)")
-                    for _, row in keyword_df[keyword_df["keyword_sentiment"] == "긍정"].head(5).iterrows():
-                        st.caption(f"⭐{row['score']} | {row['content'][:80]}...")
-                with col2:
-                    st.markdown(f"#### 😤 '{deep_keyword}' 부정 ({neg_cnt}건)")
-                    for _, row in keyword_df[keyword_df["keyword_sentiment"] == "부정"].head(5).iterrows():
-                        st.caption(f"⭐{row['score']} | {row['content'][:80]}...")
-                
-                st.markdown("---")
-                
-                # 하위: 긍부정별 최다 빈도 키워드 분석
-                st.markdown(f"### 📊 '{deep_keyword}' 연관 긍부정 키워드 분석")
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("#### 😊 긍정 리뷰 최다 키워드")
-                    pos_keyword_df = keyword_df[keyword_df["keyword_sentiment"] == "긍정"]
-                    if not pos_keyword_df.empty:
-                        pos_contents = pos_keyword_df["content"].tolist()
-                        pos_tokens = extract_keywords_cached(tuple(pos_contents))
-                        pos_tokens = [t for t in pos_tokens if deep_keyword not in t and t not in deep_keyword]
-                        pos_kw_counter = Counter(pos_tokens).most_common(15)
-                        if pos_kw_counter:
-                            st.dataframe(pd.DataFrame(pos_kw_counter, columns=["키워드", "빈도"]), use_container_width=True, hide_index=True)
-                    else:
-                        st.info("긍정 리뷰 없음")
-                
-                with col2:
-                    st.markdown("#### 😤 부정 리뷰 최다 키워드")
-                    neg_keyword_df = keyword_df[keyword_df["keyword_sentiment"] == "부정"]
-                    if not neg_keyword_df.empty:
-                        neg_contents = neg_keyword_df["content"].tolist()
-                        neg_tokens = extract_keywords_cached(tuple(neg_contents))
-                        neg_tokens = [t for t in neg_tokens if deep_keyword not in t and t not in deep_keyword]
-                        neg_kw_counter = Counter(neg_tokens).most_common(15)
-                        if neg_kw_counter:
-                            st.dataframe(pd.DataFrame(neg_kw_counter, columns=["키워드", "빈도"]), use_container_width=True, hide_index=True)
-                    else:
-                        st.info("부정 리뷰 없음")
-        
-        else:
-            st.caption("💡 추천: 광고, 결제, 버그, 로딩, 작품, 연재, 쿠키")
-    
-    # ----------------------------
-    # 탭 4: 요청/리뷰 (통합)
-    # ----------------------------
-    with tab4:
-        # 요청사항 섹션
-        st.markdown("### 🙏 사용자 요청사항")
-        
-        requests = extract_requests(contents_tuple)
-        
-        if requests:
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"#### 요청사항 TOP 15")
-                st.dataframe(pd.DataFrame(requests[:15], columns=["요청", "횟수"]), use_container_width=True, hide_index=True)
-            with col2:
-                st.markdown("#### 요청 빈도")
-                st.bar_chart(pd.DataFrame(requests[:8], columns=["요청", "횟수"]).set_index("요청"))
-        else:
-            st.info("요청사항 없음")
-        
-        st.markdown("---")
-        
-        # 리뷰 원문 섹션
-        st.markdown("### 📝 리뷰 원문")
-        
-        # 키워드 검색, 평점, 감성 같은 라인 (균등 배치)
-        col1, col2, col3 = st.columns([2, 1, 1])
-        with col1:
-            st.markdown('<div class="keyword-input">', unsafe_allow_html=True)
-            keyword = st.text_input("키워드 검색", key="review_search", max_chars=30, placeholder="검색어 입력")
-            st.markdown('</div>', unsafe_allow_html=True)
-        with col2:
-            score_filter = st.multiselect("평점", [1,2,3,4,5], default=[1,2,3,4,5], key="review_score")
-        with col3:
-            sentiment_filter = st.multiselect("감성", ["긍정", "중립", "부정"], default=["긍정", "중립", "부정"], key="review_sent")
-        
-        filtered = df[df["score"].isin(score_filter) & df["sentiment"].isin(sentiment_filter)]
-        if keyword:
-            filtered = filtered[filtered["content"].str.contains(keyword, na=False)]
-        
-        st.write(f"**{len(filtered):,}건**")
-        
-        display_df = filtered[["at", "score", "sentiment", "content"]].copy()
-        display_df["at"] = display_df["at"].dt.strftime("%Y-%m-%d")
-        display_df.columns = ["날짜", "평점", "감성", "내용"]
-        st.dataframe(display_df, use_container_width=True, hide_index=True, height=400)
+            cache_calls = [r["cache"] for r in recorder.records if r["cache"]]
+            memory = []
+            if recorder.rss_delta_bytes is not None:
+                memory.append(f"RSS 변화 {recorder.rss_delta_bytes / 1024 / 1024:+,.1f}MB")
+            if recorder.peak_bytes is not None:
+                # 프로세스 시작 이후 최대값 (이번 재실행만의 값이 아님)
+                memory.append(f"프로세스 시작 이후 최대 RSS {recorder.peak_bytes / 1024 / 1024:,.1f}MB")
+            memory = " · ".join(memory) or "메모리 -"
+            st.caption(
+                f"이번 재실행 {recorder.total_ms:,.0f}ms · {memory} · "
+                f"캐시 적중 {cache_calls.count('hit')} / 미스 {cache_calls.count('miss')}"
+            )
+            records = pd.DataFrame(recorder.ordered_records(), columns=["name", "ms", "rows", "cache", "depth"])
+            records["name"] = ["  " * depth + name for name, depth in zip(records["name"], records["depth"])]
+            records["rows"] = records["rows"].astype("Int64")
+            records = records.drop(columns="depth").rename(columns={"name": "구간", "rows": "행 수", "cache": "캐시"})
+            st.dataframe(records, use_container_width=True, hide_index=True)
+            st.download_button(
+                "📥 JSON 내보내기",
+                data=json.dumps({"reruns": history}, ensure_ascii=False, indent=2),
+                file_name="instrumentation.json",
+                mime="application/json",
+                use_container_width=True,
+            )
 
 # ----------------------------
 # 메인 UI
 # ----------------------------
+start_instrumentation()
+
 st.markdown("#### 📊 앱 리뷰 분석 &nbsp;&nbsp;|&nbsp;&nbsp; [GitHub](https://github.com/blendiing/appread)")
 
 # 사이드바
@@ -1040,6 +1183,9 @@ with st.sidebar:
         value=200
     )
     
+    # 저장소 동기화: 저장된 최근 리뷰 이후만 수집해 누적
+    sync_store = st.toggle("💾 저장소 동기화 (새 리뷰만 수집)", value=False)
+    
     # 데이터 수집 버튼
     has_input = app_id_input is not None and len(app_id_input.strip()) > 0
     collect_btn = st.button(
@@ -1051,25 +1197,101 @@ with st.sidebar:
     
     if not has_input:
         st.caption("💡 앱 ID 입력 시 활성화")
+    
+    # 저장된 리뷰 불러오기 (세션이 끝나도 남아 있음)
+    stored_apps = get_review_store().app_ids() if sync_store else []
+    if stored_apps:
+        stored_app = st.selectbox("📂 저장된 앱", options=stored_apps)
+        stored_latest = get_review_store().latest_at(stored_app)
+        # 작성 시각이 모두 비어 있으면(NaT 로 저장) 최근 시각 없음
+        stored_latest = "-" if stored_latest is None else f"{stored_latest:%Y-%m-%d %H:%M}"
+        st.caption(f"저장된 리뷰 {get_review_store().count(stored_app):,}건 (최근: {stored_latest})")
+        load_btn = st.button("📂 불러오기", use_container_width=True)
+    else:
+        load_btn = False
+    
+    st.markdown("---")
+    
+    # 여러 앱 일괄 수집 (동시 수집 후 app_id 로 구분)
+    st.markdown("#### 📦 일괄 수집")
+    batch_apps = st.multiselect(
+        "비교할 앱",
+        options=list(APP_LIST),
+        default=[],
+        label_visibility="collapsed",
+        placeholder="앱 선택"
+    )
+    batch_btn = st.button(
+        "📦 일괄 수집",
+        use_container_width=True,
+        disabled=(not batch_apps)
+    )
 
 # 메인 콘텐츠
+restore_interrupted_sync()
+
 # 수집 버튼 클릭 시 데이터 수집
 if collect_btn and has_input:
     if st.session_state.get("is_collecting", False):
         st.error("⚠️ 현재 수집이 진행 중입니다. 중단하려면 **브라우저 새로고침(F5)**을 해주세요.")
     else:
         st.session_state["is_collecting"] = True
-        df = get_reviews_with_progress(app_id_input, count=review_count)
-        st.session_state["is_collecting"] = False
+        try:
+            if sync_store:
+                store = get_review_store()
+                stored_before = store.count(app_id_input)
+                # 동기화가 중간에 끊기면 다음 실행에서 저장소 전체를 다시 불러옴 (restore_interrupted_sync)
+                st.session_state[SYNC_PENDING_KEY] = app_id_input
+                # 새 행은 도착하는 대로 분석해 저장하고, 저장된 전체 리뷰로 분석
+                get_reviews_with_progress(
+                    app_id_input, count=review_count,
+                    chunks_iter=sync_chunks(store, MODAL_API_URL, app_id_input, review_count), store=store,
+                )
+                df = load_synced_reviews(store, app_id_input)
+                added = store.count(app_id_input) - stored_before
+                st.session_state["sync_message"] = f"💾 새 리뷰 {added:,}건 저장 (누적 {store.count(app_id_input):,}건)"
+                st.session_state.pop(SYNC_PENDING_KEY, None)
+            else:
+                # 공유 캐시 값은 이미 정렬/변환된 상태 (세션마다 복사하지 않음)
+                df, status = get_reviews_shared(app_id_input, count=review_count)
+                if status == MISS:
+                    st.session_state.pop("sync_message", None)
+                else:
+                    st.session_state["sync_message"] = f"♻️ 다른 세션에서 수집한 리뷰 {len(df):,}건을 함께 사용합니다 (최대 {SHARED_CACHE_TTL // 60}분 보관)"
+        finally:
+            st.session_state["is_collecting"] = False
         if not df.empty:
-            df = df.sort_values(by="at", ascending=False)
             st.session_state["collected_df"] = df
             st.session_state["collected_app"] = app_id_input
             st.rerun()
 
+if batch_btn and batch_apps:
+    if st.session_state.get("is_collecting", False):
+        st.error("⚠️ 현재 수집이 진행 중입니다. 중단하려면 **브라우저 새로고침(F5)**을 해주세요.")
+    else:
+        st.session_state["is_collecting"] = True
+        st.session_state.pop("sync_message", None)
+        try:
+            df = get_reviews_batch([APP_LIST[name] for name in batch_apps], count=review_count)
+        finally:
+            st.session_state["is_collecting"] = False
+        if not df.empty:
+            df = compact_reviews(df.sort_values(by="at", ascending=False))
+            st.session_state["collected_df"] = df
+            st.session_state["collected_app"] = ", ".join(batch_apps)
+            st.rerun()
+
+if load_btn:
+    with span("저장소 불러오기") as frame:
+        st.session_state["collected_df"] = get_review_store().load(stored_app)
+        frame["rows"] = len(st.session_state["collected_df"])
+    st.session_state["collected_app"] = stored_app
+    st.session_state["sync_message"] = f"📂 저장된 리뷰 {len(st.session_state['collected_df']):,}건"
+    st.rerun()
+
 # 수집된 데이터가 있으면 표시
 if st.session_state.get("collected_df") is not None and not st.session_state["collected_df"].empty:
-    display_analysis(st.session_state["collected_df"], st.session_state.get("collected_app", ""))
+    display_analysis(st.session_state["collected_df"], st.session_state.get("collected_app", ""), st.session_state.get("sync_message", ""))
 
 # 수집된 데이터가 없으면 기본 데이터 표시
 else:
@@ -1078,3 +1300,5 @@ else:
 
 st.markdown("---")
 st.caption("Made with ❤️ using Streamlit | 데이터: Google Play Store")
+
+render_instrumentation_panel(deactivate())
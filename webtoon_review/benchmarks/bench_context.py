@@ -0,0 +1,83 @@
+"""키워드 문맥 감성 판정 최악 경우 벤치마크 (2,000자 리뷰)
+
+기존 `.*?` 정규식 7개 방식과 KeywordContextRules 를 같은 입력에서 비교하고,
+새 방식이 리뷰당 WORST_CASE_MS 안에 끝나는지 확인한다.
+
+실행: python benchmarks/bench_context.py  (webtoon_review 폴더에서)
+"""
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from review_analysis.context import context_rules  # noqa: E402
+
+KEYWORD = "광고"
+REVIEW_LENGTH = 2_000
+# 2,000자 리뷰 1건당 허용 시간
+WORST_CASE_MS = 5.0
+
+NEGATIVE = "(빼|없애|제거|싫|별로|짜증|불편|안좋|최악|노잼|지루|답답|하차|그만)"
+POSITIVE = "(좋|최고|완벽|대박|굿|짱|사랑|감사|편리|유용|도움)"
+
+
+def regex_classify(text, keyword):
+    """기존 방식: 키워드마다 정규식 7개를 순서대로 검색"""
+    negative_patterns = [
+        f"{keyword}.*?{NEGATIVE}",
+        f"{NEGATIVE}.*?{keyword}",
+        f"{keyword}.*?(왜|뭐야|뭔|진짜|도대체).*?(있|나와|뜨|보여)",
+        f"(제발|부탁).*?{keyword}.*?(빼|없|제거|하지)",
+    ]
+    positive_patterns = [
+        f"{keyword}.*?{POSITIVE}",
+        f"{POSITIVE}.*?{keyword}",
+        f"{keyword}.*?(있어서|덕분|편해|좋아)",
+    ]
+    text_lower = text.lower()
+    for pattern in negative_patterns:
+        if re.search(pattern, text_lower):
+            return "부정"
+    for pattern in positive_patterns:
+        if re.search(pattern, text_lower):
+            return "긍정"
+    return None
+
+
+def fit(unit):
+    return (unit * (REVIEW_LENGTH // len(unit) + 1))[:REVIEW_LENGTH]
+
+
+# 역추적이 많이 일어나는 입력들
+CASES = {
+    "keyword_then_questions": KEYWORD + fit("왜"),
+    "plea_keyword_no_remove": fit("제발")[:REVIEW_LENGTH // 2] + fit(KEYWORD)[:REVIEW_LENGTH // 2],
+    "repeated_keyword": fit(KEYWORD + " "),
+    "no_markers": fit("가나다라마바사 "),
+    "many_lines": fit(KEYWORD + " 왜\n"),
+}
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    rules = context_rules(KEYWORD)
+    print(f"{'case':<24} {'regex(ms)':>10} {'rules(ms)':>10}")
+    for name, text in CASES.items():
+        regex_ms, expected = timed(regex_classify, text, KEYWORD)
+        rules_ms, actual = timed(rules.classify, text)
+        if expected != actual:
+            raise SystemExit(f"결과 불일치: {name}")
+        if rules_ms > WORST_CASE_MS:
+            raise SystemExit(f"{name}: {rules_ms:.2f}ms > {WORST_CASE_MS}ms")
+        print(f"{name:<24} {regex_ms:>10.2f} {rules_ms:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""감성 사전 매칭 벤치마크: 단어별 `in` 루프 vs LexiconMatcher
+
+실행: python benchmarks/bench_lexicon.py  (webtoon_review 폴더에서)
+"""
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from review_analysis import WEBTOON_SENTIMENT, WEBTOON_MATCHER  # noqa: E402
+
+CSV_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "default_reviews.csv")
+SIZES = [1_000, 10_000, 100_000]
+
+
+def loop_scores(texts):
+    """기존 방식: 사전 단어마다 부분 문자열 검사"""
+    results = []
+    for text in texts:
+        pos = sum(w for word, w in WEBTOON_SENTIMENT["positive"].items() if word in text)
+        neg = sum(w for word, w in WEBTOON_SENTIMENT["negative"].items() if word in text)
+        results.append((pos, neg))
+    return results
+
+
+def matcher_scores(texts):
+    return WEBTOON_MATCHER.score_many(texts)
+
+
+def timed(fn, texts):
+    start = time.perf_counter()
+    result = fn(texts)
+    return time.perf_counter() - start, result
+
+
+def main():
+    base = pd.read_csv(CSV_PATH)["content"].astype(str).tolist()
+    print(f"{'reviews':>8} {'loop(s)':>9} {'matcher(s)':>11} {'speedup':>8}")
+    for size in SIZES:
+        texts = (base * (size // len(base) + 1))[:size]
+        loop_time, expected = timed(loop_scores, texts)
+        matcher_time, actual = timed(matcher_scores, texts)
+        if expected != actual:
+            raise SystemExit(f"결과 불일치 ({size}건)")
+        print(f"{size:>8,} {loop_time:>9.3f} {matcher_time:>11.3f} {loop_time / matcher_time:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
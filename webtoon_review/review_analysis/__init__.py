@@ -0,0 +1,22 @@
+"""리뷰 분석 엔진 (Streamlit 비의존)
+
+앱과 같은 분석 함수를 배치 작업이나 다른 프로세스에서 그대로 쓸 수 있다.
+파일 단위 일괄 분석은 python -m review_analysis (cli.py) 로 실행한다.
+"""
+from .matcher import LexiconMatcher
+from .lexicon import (
+    POSITIVE_WORDS,
+    NEGATIVE_WORDS,
+    WEBTOON_SENTIMENT,
+    BASIC_MATCHER,
+    WEBTOON_MATCHER,
+)
+from .tokens import TokenStore, simple_tokenizer
+from .sentiment import POSITIVE, NEGATIVE, NEUTRAL, score_sentiment
+from .topics import TOPIC_KEYWORDS, topic_matrix, classify_topics
+from .request_phrases import extract_requests
+from .ngrams import top_ngrams, complaint_ngrams, positive_bigrams
+from .association import CooccurrenceMatrix
+from .search import ReviewIndex
+from .dataset import read_reviews, prepare_reviews, compact_reviews
+from .snapshot import build_snapshot, write_snapshot, load_snapshot
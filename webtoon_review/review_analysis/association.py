@@ -0,0 +1,122 @@
+"""연관어 분석 (토큰 동시출현 희소 행렬 + PMI)
+
+같은 리뷰 안에서 WINDOW 토큰 이내에 함께 나온 토큰 쌍을 세어 어휘 × 어휘 희소 행렬(CSR)로 데이터셋당 1회 만들고,
+키워드 X 의 연관어는 X 를 포함하는 어휘들의 행을 더해 PMI(lift) 로 순위를 매긴다.
+
+lift(y) = P(y | X 주변) / P(y),  PMI = log2(lift)
+- P(y | X 주변): X 주변 window 안 동시출현 중 y 의 비율
+- P(y): 데이터셋 전체 토큰 중 y 의 비율
+긍정/부정 리뷰처럼 일부 리뷰만 볼 때는 그 리뷰들에서만 동시출현을 세고 P(y) 는 전체 기준을 쓴다.
+"""
+import numpy as np
+
+# 동시출현으로 보는 토큰 거리
+WINDOW = 5
+# 이보다 적게 함께 나왔거나 데이터셋 전체에서 드문 단어는 PMI 가 과대평가되므로 제외
+MIN_COUNT = 2
+MIN_TERM_FREQ = 5
+TOP_RELATED = 10
+
+
+def window_pairs(ids, offsets, window=WINDOW):
+    """같은 리뷰에서 window 토큰 이내에 함께 나온 토큰 쌍 (앞 토큰 id 배열, 뒤 토큰 id 배열), 같은 토큰끼리는 제외"""
+    lengths = np.diff(offsets)
+    review_of = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+    firsts = []
+    seconds = []
+    for distance in range(1, window + 1):
+        if len(ids) <= distance:
+            break
+        same_review = review_of[:-distance] == review_of[distance:]
+        first = ids[:-distance][same_review]
+        second = ids[distance:][same_review]
+        different = first != second
+        firsts.append(first[different])
+        seconds.append(second[different])
+    if not firsts:
+        return np.empty(0, dtype=ids.dtype), np.empty(0, dtype=ids.dtype)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+class CooccurrenceMatrix:
+    """토큰 동시출현 희소 행렬 (대칭, CSR: indptr / indices / counts)"""
+
+    def __init__(self, token_store, window=WINDOW):
+        self.token_store = token_store
+        self.window = window
+        vocab_size = len(token_store.vocab)
+        self.vocab_size = vocab_size
+
+        # 방향 없는 쌍 (작은 id, 큰 id) 으로 세고, 고유 쌍만 양방향으로 펼쳐 CSR 구성
+        first, second = window_pairs(token_store.ids, token_store.offsets, window)
+        base = max(vocab_size, 1)
+        keys = np.minimum(first, second).astype(np.int64) * base
+        keys += np.maximum(first, second)
+        del first, second
+        keys.sort()
+        if len(keys):
+            starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+            pair_counts = np.diff(np.append(starts, len(keys))).astype(np.int32)
+            keys = keys[starts]
+        else:
+            pair_counts = np.empty(0, dtype=np.int32)
+        low, high = keys // base, keys % base
+        rows = np.concatenate((low, high))
+        cols = np.concatenate((high, low))
+        order = np.lexsort((cols, rows))
+        self.indices = cols[order].astype(np.int32)
+        self.counts = np.concatenate((pair_counts, pair_counts))[order]
+        self.indptr = np.searchsorted(rows[order], np.arange(vocab_size + 1))
+
+        # 배경 확률 P(y)
+        self.term_freq = np.bincount(token_store.ids, minlength=vocab_size)
+        self.total_tokens = max(int(self.term_freq.sum()), 1)
+
+    @property
+    def nnz(self):
+        return len(self.indices)
+
+    def terms_for(self, keyword):
+        """키워드를 포함하는 어휘 번호 ("광고" → 광고, 광고가, 동영상광고 ...)"""
+        return np.array([i for i, term in enumerate(self.token_store.vocab) if keyword in term], dtype=np.int64)
+
+    def neighbor_counts(self, term_ids, rows=None):
+        """term_ids 주변 동시출현 횟수 (어휘 크기 벡터), rows 가 있으면 그 리뷰들에서만 셈"""
+        if len(term_ids) == 0:
+            return np.zeros(self.vocab_size, dtype=np.int64)
+        if rows is None:
+            # 행렬의 해당 행들을 합침
+            slices = [slice(self.indptr[t], self.indptr[t + 1]) for t in term_ids.tolist()]
+            neighbors = np.concatenate([self.indices[s] for s in slices])
+            weights = np.concatenate([self.counts[s] for s in slices])
+            return np.bincount(neighbors, weights=weights, minlength=self.vocab_size).astype(np.int64)
+
+        ids, offsets = self.token_store.subset(rows)
+        first, second = window_pairs(ids, offsets, self.window)
+        counts = np.bincount(second[np.isin(first, term_ids)], minlength=self.vocab_size)
+        counts += np.bincount(first[np.isin(second, term_ids)], minlength=self.vocab_size)
+        return counts.astype(np.int64)
+
+    def related(self, keyword, rows=None, k=TOP_RELATED, min_count=MIN_COUNT, min_term_freq=MIN_TERM_FREQ):
+        """키워드 연관어 상위 k개 [(단어, 동시출현 횟수, PMI), ...] (PMI 내림차순, 같으면 횟수 순)
+
+        PMI 가 양수인 (우연보다 자주 함께 나온) 단어만, 키워드를 포함하거나 키워드에 포함되는 단어는 제외
+        """
+        term_ids = self.terms_for(keyword)
+        counts = self.neighbor_counts(term_ids, rows)
+        counts[term_ids] = 0
+        near_total = counts.sum()
+        if near_total == 0:
+            return []
+
+        vocab = self.token_store.vocab
+        candidates = np.flatnonzero((counts >= min_count) & (self.term_freq >= min_term_freq))
+        candidates = np.array([t for t in candidates.tolist() if vocab[t] not in keyword], dtype=np.int64)
+        if len(candidates) == 0:
+            return []
+        lift = (counts[candidates] / near_total) / (self.term_freq[candidates] / self.total_tokens)
+        pmi = np.log2(lift)
+        positive = pmi > 0
+        candidates, pmi = candidates[positive], pmi[positive]
+        order = np.lexsort((-counts[candidates], -pmi))[:k]
+        return [(vocab[t], int(counts[t]), round(float(pmi[i]), 2)) for i, t in zip(order.tolist(), candidates[order].tolist())]
@@ -0,0 +1,314 @@
+"""분석 파이프라인 벤치마크 (Streamlit 없이 실행)
+
+감성/토픽 사전과 불용어에서 단어를 뽑아 합성 한국어 리뷰 코퍼스(기본 1만/10만/100만 건)를 만들고,
+앱이 쓰는 분석 함수(감성, 토픽, 요청사항, n-gram, 동시출현, 키워드 심층 분석)를 단계별로
+실행 시간과 최대 메모리(tracemalloc)를 재서 JSON 보고서로 남긴다. 버전 간 보고서는 --compare 로 비교한다.
+
+실행: python -m review_analysis.benchmark --sizes 10000 100000 --output bench.json  (webtoon_review 폴더에서)
+"""
+import argparse
+import json
+import platform
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from . import deep_dive, parallel
+from .association import CooccurrenceMatrix
+from .dataset import compact_reviews, memory_report
+from .fingerprint import dataset_fingerprint
+from .lexicon import WEBTOON_SENTIMENT
+from .ngrams import complaint_ngrams, positive_bigrams, top_ngrams
+from .pipeline import StageGraph
+from .request_phrases import REQUEST_ANCHORS
+from .search import ReviewIndex
+from .tokens import STOPWORDS
+from .topics import TOPIC_KEYWORDS
+
+REPORT_VERSION = 1
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_KEYWORD = "광고"
+
+# ----------------------------
+# 합성 코퍼스
+# ----------------------------
+# 평점 1~5 비율 (앱 리뷰처럼 5점이 가장 많음)
+SCORE_WEIGHTS = [0.12, 0.05, 0.08, 0.15, 0.60]
+# 리뷰 길이 (단어 수)
+MIN_WORDS = 3
+MAX_WORDS = 25
+# 평점별 단어 종류 비율 (긍정어, 부정어, 토픽 키워드, 불용어)
+WORD_MIX = {
+    1: [0.05, 0.30, 0.30, 0.35],
+    2: [0.08, 0.25, 0.30, 0.37],
+    3: [0.15, 0.15, 0.30, 0.40],
+    4: [0.25, 0.07, 0.30, 0.38],
+    5: [0.30, 0.05, 0.30, 0.35],
+}
+# 요청 표현 ("<토픽 키워드> 해주세요") 을 덧붙이는 리뷰 비율
+REQUEST_RATE = 0.1
+BASE_TIME = pd.Timestamp("2025-01-19")
+
+
+def synthetic_reviews(n_reviews, seed=0):
+    """합성 리뷰 데이터프레임 (at, score, content), 같은 seed 면 같은 코퍼스"""
+    rng = np.random.default_rng(seed)
+    topic_words = sorted({word for words in TOPIC_KEYWORDS.values() for word in words})
+    groups = [
+        sorted(WEBTOON_SENTIMENT["positive"]),
+        sorted(WEBTOON_SENTIMENT["negative"]),
+        topic_words,
+        sorted(STOPWORDS),
+    ]
+    vocab = np.array([word for group in groups for word in group], dtype=object)
+    group_sizes = np.array([len(group) for group in groups])
+    group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+
+    scores = rng.choice(np.arange(1, 6), size=n_reviews, p=SCORE_WEIGHTS)
+    lengths = rng.integers(MIN_WORDS, MAX_WORDS + 1, size=n_reviews)
+
+    # 단어마다 (리뷰 평점에 따른) 종류를 고르고, 종류 안에서 단어를 고름
+    cumulative = np.cumsum([WORD_MIX[score] for score in range(1, 6)], axis=1)
+    word_scores = np.repeat(scores, lengths)
+    kinds = (rng.random(len(word_scores))[:, None] > cumulative[word_scores - 1]).sum(axis=1)
+    kinds = np.minimum(kinds, len(groups) - 1)
+    word_ids = group_starts[kinds] + (rng.random(len(kinds)) * group_sizes[kinds]).astype(np.int64)
+    words = vocab[word_ids]
+
+    ends = np.cumsum(lengths)
+    contents = [" ".join(words[end - length:end]) for end, length in zip(ends.tolist(), lengths.tolist())]
+
+    anchors = REQUEST_ANCHORS[0][0]
+    for row in np.flatnonzero(rng.random(n_reviews) < REQUEST_RATE).tolist():
+        contents[row] += f" {topic_words[rng.integers(len(topic_words))]} {anchors[rng.integers(len(anchors))]}"
+
+    seconds = rng.integers(0, 365 * 86400, size=n_reviews)
+    at = BASE_TIME - pd.to_timedelta(np.sort(seconds), unit="s")
+    return pd.DataFrame({"at": at, "score": scores, "content": contents})
+
+
+def load_reviews(path):
+    """실제 리뷰 CSV (건수 제한 없이, at/score/content 만)"""
+    df = pd.read_csv(path, usecols=["at", "score", "content"])
+    df["at"] = pd.to_datetime(df["at"])
+    df["content"] = df["content"].astype(str)
+    return df
+
+
+# ----------------------------
+# 측정 단계 (앱 분석 단계와 같은 함수, 등록 순서대로 실행)
+# ----------------------------
+BENCHMARK = StageGraph()
+
+
+@BENCHMARK.stage("reviews", name="compact")
+def _compact(reviews):
+    return compact_reviews(reviews)
+
+
+@BENCHMARK.stage("compact", name="fingerprint")
+def _fingerprint(df):
+    return dataset_fingerprint(df)
+
+
+@BENCHMARK.stage("compact", name="contents")
+def _contents(df):
+    return df["content"].to_numpy()
+
+
+@BENCHMARK.stage("compact", name="scores")
+def _scores(df):
+    return df["score"].to_numpy()
+
+
+@BENCHMARK.stage("contents", "scores", "workers", name="sentiment_webtoon")
+def _sentiment_webtoon(contents, scores, workers):
+    return parallel.score_sentiment(contents, scores, True, workers)
+
+
+@BENCHMARK.stage("contents", "scores", "workers", name="sentiment_basic")
+def _sentiment_basic(contents, scores, workers):
+    return parallel.score_sentiment(contents, scores, False, workers)
+
+
+@BENCHMARK.stage("contents", "workers", name="topics")
+def _topics(contents, workers):
+    return parallel.topic_matrix(contents, workers)
+
+
+@BENCHMARK.stage("contents", "workers", name="requests")
+def _requests(contents, workers):
+    return parallel.extract_requests(contents, workers)
+
+
+@BENCHMARK.stage("contents", "workers", name="token_store")
+def _token_store(contents, workers):
+    return parallel.build_token_store(contents, workers)
+
+
+@BENCHMARK.stage("contents", name="review_index")
+def _review_index(contents):
+    return ReviewIndex(contents)
+
+
+@BENCHMARK.stage("token_store", name="keywords")
+def _keywords(token_store):
+    return top_ngrams(token_store, 1, k=50)
+
+
+@BENCHMARK.stage("token_store", "scores", name="complaint_ngrams")
+def _complaint_ngrams(token_store, scores):
+    return complaint_ngrams(token_store, scores)
+
+
+@BENCHMARK.stage("token_store", "scores", name="positive_bigrams")
+def _positive_bigrams(token_store, scores):
+    return positive_bigrams(token_store, scores)
+
+
+@BENCHMARK.stage("token_store", name="cooccurrence")
+def _cooccurrence(token_store):
+    return CooccurrenceMatrix(token_store)
+
+
+@BENCHMARK.stage("review_index", "keyword", name="keyword_rows")
+def _keyword_rows(review_index, keyword):
+    return deep_dive.keyword_rows(review_index, keyword)
+
+
+@BENCHMARK.stage("contents", "sentiment_webtoon", "keyword_rows", "keyword", name="keyword_sentiment")
+def _keyword_sentiment(contents, sentiment, keyword_rows, keyword):
+    return deep_dive.keyword_sentiment(contents, sentiment["sentiment"], keyword_rows, keyword)
+
+
+@BENCHMARK.stage("cooccurrence", "keyword_rows", "keyword", name="keyword_related")
+def _keyword_related(cooccurrence, keyword_rows, keyword):
+    return deep_dive.related_terms(cooccurrence, keyword_rows, keyword)
+
+
+@BENCHMARK.stage("token_store", "keyword_rows", "keyword", name="keyword_bigrams")
+def _keyword_bigrams(token_store, keyword_rows, keyword):
+    return deep_dive.keyword_bigrams(token_store, keyword_rows, keyword)
+
+
+@BENCHMARK.stage("cooccurrence", "keyword_rows", "keyword_sentiment", "keyword", name="keyword_split_related")
+def _keyword_split_related(cooccurrence, keyword_rows, keyword_sentiment, keyword):
+    return deep_dive.split_related(cooccurrence, keyword_rows, keyword_sentiment, keyword)
+
+
+def _new_run(reviews, keyword, workers):
+    run = BENCHMARK.run({})
+    run.set_input("reviews", reviews, key=id(reviews))
+    run.set_input("keyword", keyword)
+    run.set_input("workers", workers)
+    return run
+
+
+def measure(reviews, keyword=DEFAULT_KEYWORD, memory=True, workers=1):
+    """단계별 {"seconds", "peak_bytes"} (등록 순서, 의존 단계는 이미 계산된 상태에서 잼)
+
+    workers > 1 이면 병렬 단계의 peak_bytes 는 이 프로세스(병합) 몫만 잰다.
+    """
+    steps = {}
+    run = _new_run(reviews, keyword, workers)
+    for name in BENCHMARK.stages:
+        run[name]
+        _, _, ms = run.trace[-1]
+        steps[name] = {"seconds": round(ms / 1000, 4)}
+    dataset_bytes = memory_report(run["compact"])[1]
+
+    if memory:
+        # tracemalloc 은 실행을 느리게 하므로 시간 측정과 따로 한 번 더 실행
+        run = _new_run(reviews, keyword, workers)
+        tracemalloc.start()
+        try:
+            for name in BENCHMARK.stages:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+                run[name]
+                steps[name]["peak_bytes"] = tracemalloc.get_traced_memory()[1] - before
+        finally:
+            tracemalloc.stop()
+    return steps, dataset_bytes
+
+
+def benchmark_dataset(name, reviews, keyword=DEFAULT_KEYWORD, memory=True, workers=1):
+    steps, dataset_bytes = measure(reviews, keyword, memory, workers)
+    return {
+        "name": name,
+        "rows": int(len(reviews)),
+        "dataset_bytes": dataset_bytes,
+        "total_seconds": round(sum(step["seconds"] for step in steps.values()), 4),
+        "steps": steps,
+    }
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+    }
+
+
+def compare_reports(old, new):
+    """두 보고서의 같은 데이터셋/단계 시간 비교 [(데이터셋, 단계, 이전 초, 현재 초, 배율), ...]"""
+    old_datasets = {dataset["name"]: dataset for dataset in old["datasets"]}
+    rows = []
+    for dataset in new["datasets"]:
+        previous = old_datasets.get(dataset["name"])
+        if previous is None:
+            continue
+        for step, result in dataset["steps"].items():
+            if step not in previous["steps"]:
+                continue
+            before, after = previous["steps"][step]["seconds"], result["seconds"]
+            rows.append((dataset["name"], step, before, after, round(after / before, 2) if before else None))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리뷰 분석 파이프라인 벤치마크 (합성 코퍼스)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="합성 리뷰 건수들")
+    parser.add_argument("--csv", action="append", default=[], help="함께 잴 실제 리뷰 CSV (건수 제한 없음)")
+    parser.add_argument("--keyword", default=DEFAULT_KEYWORD, help="키워드 심층 분석 단계에 쓸 키워드")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="메모리 측정(tracemalloc 재실행) 생략")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"병렬 분석 작업자 프로세스 수 (기본 1: 직렬, {parallel.MIN_PARALLEL_ROWS:,}건 미만은 항상 직렬)")
+    parser.add_argument("--output", default="benchmark.json", help="보고서 JSON 경로")
+    parser.add_argument("--compare", help="비교할 이전 보고서 JSON")
+    args = parser.parse_args(argv)
+
+    datasets = []
+    for size in args.sizes:
+        reviews = synthetic_reviews(size, seed=args.seed)
+        datasets.append(benchmark_dataset(f"synthetic-{size}", reviews, args.keyword, not args.no_memory, args.workers))
+        print(f"synthetic-{size}: {datasets[-1]['total_seconds']:.2f}s")
+    for path in args.csv:
+        datasets.append(benchmark_dataset(path, load_reviews(path), args.keyword, not args.no_memory, args.workers))
+        print(f"{path}: {datasets[-1]['total_seconds']:.2f}s")
+
+    report = {
+        "version": REPORT_VERSION,
+        "environment": environment(),
+        "seed": args.seed,
+        "keyword": args.keyword,
+        "workers": args.workers,
+        "datasets": datasets,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"{args.output}: {len(datasets)}개 데이터셋")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            old = json.load(f)
+        for name, step, before, after, ratio in compare_reports(old, report):
+            print(f"{name:>20} {step:<24} {before:>9.4f}s → {after:>9.4f}s  x{ratio}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""리뷰 파일 → 분석 스냅샷 JSON 일괄 생성 (Streamlit 없이 실행)
+
+입력은 CSV 또는 Parquet (at, score, content[, sentiment]), 출력은 default_analysis.json 과 같은 형태.
+여러 파일을 한 번에 넘기면 --output-dir 아래에 <파일 이름>.json 으로 저장한다.
+
+실행: python -m review_analysis reviews_a.csv reviews_b.parquet --output-dir out/  (webtoon_review 폴더에서)
+"""
+import argparse
+import os
+import sys
+
+from .dataset import read_reviews
+from .parallel import DEFAULT_WORKERS, MIN_PARALLEL_ROWS
+from .snapshot import build_snapshot, write_snapshot
+
+
+def output_path(input_path, output_dir):
+    """입력 파일 이름에서 확장자만 .json 으로 바꾼 출력 경로"""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, f"{stem}.json")
+
+
+def analyze_file(input_path, output, limit=None, webtoon_mode=True, workers=1):
+    """리뷰 파일 하나를 분석해 스냅샷 JSON 으로 저장, 스냅샷 dict 반환"""
+    snapshot = build_snapshot(read_reviews(input_path, limit, webtoon_mode, workers), workers)
+    write_snapshot(snapshot, output)
+    return snapshot
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m review_analysis", description="리뷰 CSV/Parquet 로부터 분석 스냅샷(JSON) 생성")
+    parser.add_argument("inputs", nargs="+", help="리뷰 파일 (.csv 또는 .parquet)")
+    parser.add_argument("-o", "--output", help="출력 JSON 경로 (입력이 하나일 때)")
+    parser.add_argument("--output-dir", help="출력 폴더 (<입력 파일 이름>.json 으로 저장)")
+    parser.add_argument("--limit", type=int, default=None, help="파일당 앞에서부터 사용할 리뷰 수 (기본: 전체)")
+    parser.add_argument("--basic", action="store_true", help="CSV에 sentiment 가 없을 때 기본 감성분석 사용 (기본: 웹툰 특화)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"병렬 분석 작업자 프로세스 수 (기본: CPU 수, {MIN_PARALLEL_ROWS:,}건 미만은 직렬)")
+    args = parser.parse_args(argv)
+
+    if args.output and len(args.inputs) > 1:
+        parser.error("입력이 여러 개면 --output 대신 --output-dir 을 사용하세요")
+    if not args.output and not args.output_dir:
+        parser.error("--output 또는 --output-dir 이 필요합니다")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    failed = 0
+    for input_path in args.inputs:
+        output = args.output or output_path(input_path, args.output_dir)
+        try:
+            snapshot = analyze_file(input_path, output, args.limit, not args.basic, args.workers)
+        except Exception as e:
+            # 한 파일이 실패해도 나머지는 계속 처리
+            failed += 1
+            print(f"{input_path}: 실패 ({e})", file=sys.stderr)
+            continue
+        print(f"{output}: {snapshot['stats']['total']}건, fingerprint {snapshot['fingerprint']}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
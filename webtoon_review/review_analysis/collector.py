@@ -0,0 +1,224 @@
+"""리뷰 수집 API 클라이언트 (스트리밍)
+
+수집 서버 응답 형식 (Content-Type 으로 구분):
+- NDJSON (application/x-ndjson): 한 줄에 리뷰 1건. {"error": "..."} 줄은 수집 실패로 처리
+- JSON (기존 형식): {"success": true, "data": [...], "next_cursor": "..."(선택)}
+  next_cursor 가 있으면 cursor 파라미터로 다음 페이지를 이어서 요청
+
+어느 형식이든 chunk_size 건씩 DataFrame 조각으로 돌려주므로, 호출 측은 첫 조각부터 바로 분석/표시할 수 있다.
+응답 도중 다음 데이터가 읽기 타임아웃 안에 오지 않으면 받은 건수를 담은 CollectorError(재시도 가능)로 알린다.
+"""
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlparse
+
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+# 조각 크기 (첫 화면에 필요한 리뷰 수)
+CHUNK_SIZE = 100
+# (연결, 조각 사이 대기) 타임아웃 - 전체 수집 시간이 아니라 다음 데이터가 오기까지의 대기 시간
+TIMEOUT = (10, 120)
+NDJSON_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-lines")
+
+
+# 일괄 수집: 동시 작업 수, 같은 호스트로의 동시 요청 수, 재시도
+MAX_WORKERS = 4
+PER_HOST_LIMIT = 3
+RETRIES = 2
+BACKOFF = 1.0
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class CollectorError(Exception):
+    """수집 서버가 실패를 응답한 경우 (retryable: 일시적 오류라 재시도할 만한지)"""
+
+    def __init__(self, message, retryable=False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _status_error(status_code):
+    return CollectorError(f"API 오류: {status_code}", retryable=status_code in RETRYABLE_STATUS)
+
+
+def normalize_reviews(records):
+    """API 리뷰 레코드 → DataFrame (at: datetime, content: str)"""
+    df = pd.DataFrame(records)
+    if not df.empty:
+        df["at"] = pd.to_datetime(df["at"], errors="coerce")
+        df["content"] = df["content"].astype(str)
+    return df
+
+
+def _chunks(records, chunk_size):
+    for start in range(0, len(records), chunk_size):
+        yield records[start:start + chunk_size]
+
+
+def _iter_ndjson(response, chunk_size):
+    buffer = []
+    for line in response.iter_lines(decode_unicode=True):
+        if not line:
+            continue
+        record = json.loads(line)
+        if "error" in record:
+            raise CollectorError(record["error"])
+        buffer.append(record)
+        if len(buffer) >= chunk_size:
+            yield buffer
+            buffer = []
+    if buffer:
+        yield buffer
+
+
+def _is_read_timeout(error):
+    """응답 본문을 읽다가 난 타임아웃 (requests 는 ReadTimeoutError 를 ConnectionError 로 감싸서 올림)"""
+    if isinstance(error, requests.exceptions.Timeout):
+        return True
+    return bool(error.args) and isinstance(error.args[0], ReadTimeoutError)
+
+
+def _read_timeout_error(timeout, received):
+    seconds = timeout[1] if isinstance(timeout, tuple) else timeout
+    return CollectorError(
+        f"수집 서버 응답 대기 시간 초과: {seconds}초 동안 다음 리뷰가 오지 않음 ({received:,}건 받은 뒤 중단)",
+        retryable=True,
+    )
+
+
+def _check_json(response):
+    if response.status_code != 200:
+        raise _status_error(response.status_code)
+    result = response.json()
+    if not result.get("success"):
+        raise CollectorError(result.get("error", "알 수 없는 오류"))
+    return result
+
+
+def iter_review_chunks(url, app_id, count, chunk_size=CHUNK_SIZE, session=None, timeout=TIMEOUT, params=None):
+    """수집 API 에서 리뷰를 chunk_size 건씩 DataFrame 으로 받아오는 제너레이터 (최대 count 건)"""
+    http = session or requests
+    base_params = {"app_id": app_id, "count": count, "stream": 1, "chunk_size": chunk_size}
+    base_params.update(params or {})
+    received = 0
+    cursor = None
+
+    while received < count:
+        page_params = dict(base_params)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = http.get(url, params=page_params, timeout=timeout, stream=True)
+        try:
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip()
+            if content_type in NDJSON_TYPES:
+                if response.status_code != 200:
+                    raise _status_error(response.status_code)
+                pages, cursor = _iter_ndjson(response, chunk_size), None
+            else:
+                result = _check_json(response)
+                pages, cursor = _chunks(result.get("data", []), chunk_size), result.get("next_cursor")
+
+            for records in pages:
+                records = records[:count - received]
+                received += len(records)
+                yield normalize_reviews(records)
+                if received >= count:
+                    break
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if not _is_read_timeout(e):
+                raise
+            raise _read_timeout_error(timeout, received) from e
+        finally:
+            response.close()
+
+        if not cursor:
+            break
+
+
+# ----------------------------
+# 여러 앱 동시 수집
+# ----------------------------
+def make_session(pool_size=MAX_WORKERS):
+    """연결을 재사용하는 공용 세션 (앱별 요청이 같은 커넥션 풀 사용)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def collect_reviews(url, app_id, count, session=None, retries=RETRIES, backoff=BACKOFF, limiter=None):
+    """앱 1개 전체 수집 (일시적 오류는 지수 백오프로 재시도)
+
+    limiter: 동시 요청 수를 제한하는 세마포어 (호스트별)
+    """
+    for attempt in range(retries + 1):
+        try:
+            if limiter is None:
+                chunks = list(iter_review_chunks(url, app_id, count, session=session))
+            else:
+                with limiter:
+                    chunks = list(iter_review_chunks(url, app_id, count, session=session))
+            chunks = [chunk for chunk in chunks if not chunk.empty]
+            return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout, requests.exceptions.ChunkedEncodingError):
+            if attempt == retries:
+                raise
+        except CollectorError as e:
+            if not e.retryable or attempt == retries:
+                raise
+        time.sleep(backoff * (2 ** attempt))
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 제한"""
+
+    def __init__(self, per_host=PER_HOST_LIMIT):
+        self.per_host = per_host
+        self._semaphores = {}
+        self._lock = threading.Lock()
+
+    def for_url(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+# 프로세스 전체에서 공유 (여러 세션이 동시에 일괄 수집해도 호스트별 제한 유지)
+HOST_LIMITER = HostLimiter()
+
+
+def collect_many(url, app_ids, count, max_workers=MAX_WORKERS, retries=RETRIES, backoff=BACKOFF,
+                 limiter=None, on_done=None):
+    """여러 앱을 동시에 수집해 app_id 컬럼으로 구분한 하나의 데이터셋으로 반환
+
+    on_done(app_id, df 또는 None, error 또는 None): 앱 하나가 끝날 때마다 완료 순서대로 호출 (호출 스레드에서 실행)
+    반환: (합친 DataFrame - app_ids 순서, {app_id: 오류 메시지})
+    """
+    limiter = limiter or HOST_LIMITER.for_url(url)
+    frames = {}
+    errors = {}
+    with make_session(max_workers) as session, ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(collect_reviews, url, app_id, count, session, retries, backoff, limiter): app_id
+            for app_id in app_ids
+        }
+        for future in as_completed(futures):
+            app_id = futures[future]
+            try:
+                frames[app_id] = future.result()
+            except Exception as e:
+                errors[app_id] = str(e)
+            if on_done:
+                on_done(app_id, frames.get(app_id), errors.get(app_id))
+
+    parts = [frames[app_id].assign(app_id=app_id) for app_id in app_ids if app_id in frames and not frames[app_id].empty]
+    combined = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+    return combined, errors
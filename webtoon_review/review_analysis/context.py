@@ -0,0 +1,104 @@
+"""키워드 주변 문맥 기반 감성 판정
+
+기존 7개 정규식(`키워드.*?(부정어)` 등)과 같은 판정을, 키워드와 표지어의 출현 위치 비교로 계산한다.
+- 키워드는 정규식이 아니라 문자열 그대로 취급 (`(` 같은 입력도 안전)
+- `.*?` 는 줄바꿈을 넘지 않으므로 줄 단위로 판정
+- 표지어 묶음은 re.escape 로 만든 단일 alternation 으로 컴파일해 정해진 구간에서 한 번씩만 검색하므로
+  리뷰 길이 L, 표지어 수 M 에 대해 O(L·M), `.*?` 역추적 없음
+"""
+import re
+from functools import lru_cache
+
+from .sentiment import NEGATIVE, POSITIVE
+
+# 부정 표지어: "키워드 ... 부정어" 또는 "부정어 ... 키워드"
+NEGATIVE_MARKERS = ("빼", "없애", "제거", "싫", "별로", "짜증", "불편", "안좋", "최악", "노잼", "지루", "답답", "하차", "그만")
+# "키워드 ... 왜/뭐야 ... 있/나와" (왜 나오냐는 불만)
+QUESTION_MARKERS = ("왜", "뭐야", "뭔", "진짜", "도대체")
+APPEAR_MARKERS = ("있", "나와", "뜨", "보여")
+# "제발/부탁 ... 키워드 ... 빼/없/제거" (없애 달라는 요청)
+PLEA_MARKERS = ("제발", "부탁")
+REMOVE_MARKERS = ("빼", "없", "제거", "하지")
+
+# 긍정 표지어: "키워드 ... 긍정어" 또는 "긍정어 ... 키워드"
+POSITIVE_MARKERS = ("좋", "최고", "완벽", "대박", "굿", "짱", "사랑", "감사", "편리", "유용", "도움")
+# "키워드 ... 있어서/덕분" (키워드 덕분에 좋다는 표현)
+BENEFIT_MARKERS = ("있어서", "덕분", "편해", "좋아")
+
+
+def _alternation(markers):
+    return re.compile("|".join(re.escape(marker) for marker in markers))
+
+
+NEGATIVE_RE = _alternation(NEGATIVE_MARKERS)
+APPEAR_RE = _alternation(APPEAR_MARKERS)
+REMOVE_RE = _alternation(REMOVE_MARKERS)
+POSITIVE_RE = _alternation(POSITIVE_MARKERS)
+BENEFIT_RE = _alternation(BENEFIT_MARKERS)
+
+
+def _first_end(line, markers, start=0):
+    """start 이후 표지어 출현의 가장 이른 끝 위치 (없으면 None)"""
+    best = None
+    for marker in markers:
+        pos = line.find(marker, start)
+        if pos != -1 and (best is None or pos + len(marker) < best):
+            best = pos + len(marker)
+    return best
+
+
+class KeywordContextRules:
+    """키워드 1개에 대해 컴파일된 문맥 감성 규칙"""
+
+    def __init__(self, keyword):
+        self.keyword = keyword
+
+    def _line_negative(self, line):
+        keyword = self.keyword
+        first_kw_end = line.find(keyword) + len(keyword)
+        last_kw = line.rfind(keyword)
+
+        # 키워드 ... 부정어 / 부정어 ... 키워드
+        if NEGATIVE_RE.search(line, first_kw_end) or NEGATIVE_RE.search(line, 0, last_kw):
+            return True
+        # 키워드 ... 왜/뭐야 ... 있/나와
+        question_end = _first_end(line, QUESTION_MARKERS, first_kw_end)
+        if question_end is not None and APPEAR_RE.search(line, question_end):
+            return True
+        # 제발/부탁 ... 키워드 ... 빼/없
+        plea_end = _first_end(line, PLEA_MARKERS)
+        if plea_end is not None:
+            kw_after_plea = line.find(keyword, plea_end)
+            if kw_after_plea != -1 and REMOVE_RE.search(line, kw_after_plea + len(keyword)):
+                return True
+        return False
+
+    def _line_positive(self, line):
+        keyword = self.keyword
+        first_kw_end = line.find(keyword) + len(keyword)
+        last_kw = line.rfind(keyword)
+        return bool(
+            POSITIVE_RE.search(line, first_kw_end)
+            or POSITIVE_RE.search(line, 0, last_kw)
+            or BENEFIT_RE.search(line, first_kw_end)
+        )
+
+    def classify(self, text):
+        """문맥 감성 ("부정"/"긍정"), 패턴 매칭 안되면 None (기존 감성 사용)"""
+        keyword = self.keyword
+        lines = [line for line in str(text).lower().split("\n") if keyword in line]
+        # 부정 패턴이 한 줄이라도 맞으면 긍정보다 우선
+        if any(self._line_negative(line) for line in lines):
+            return NEGATIVE
+        if any(self._line_positive(line) for line in lines):
+            return POSITIVE
+        return None
+
+    def classify_many(self, texts):
+        return [self.classify(text) for text in texts]
+
+
+@lru_cache(maxsize=64)
+def context_rules(keyword):
+    """키워드별 규칙 (같은 키워드는 재사용)"""
+    return KeywordContextRules(keyword)
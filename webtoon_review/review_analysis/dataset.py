@@ -0,0 +1,105 @@
+"""리뷰 데이터셋 로드 + 메모리 절약형 dtype 변환"""
+import numpy as np
+import pandas as pd
+
+from . import parallel
+from .sentiment import NEGATIVE, NEUTRAL, POSITIVE
+
+# 메모리 최적화: 기본 데이터는 최대 1000건만 사용
+DEFAULT_LIMIT = 1000
+
+# 감성 라벨 범주 (문자열 정렬 순서와 같게 두어 groupby/정렬 결과가 object 컬럼일 때와 같음)
+SENTIMENT_CATEGORIES = sorted([POSITIVE, NEGATIVE, NEUTRAL])
+SENTIMENT_COLUMNS = ["sentiment", "sentiment_webtoon", "sentiment_basic"]
+# 작은 정수로 줄이는 컬럼 (평점 1~5, 감성 가중치 합, 토픽 비트마스크)
+SMALL_INT_COLUMNS = ["score", "pos_score", "neg_score", "topic_mask"]
+TEXT_COLUMNS = ["content", "reviewId"]
+CATEGORY_COLUMNS = ["app_id"]
+
+
+def _arrow_string_dtype():
+    """Arrow 기반 문자열 dtype (pyarrow 가 없으면 None)"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return None
+    try:
+        # pandas 3 기본 str 과 같은 결측값(NaN) 규칙
+        return pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:
+        return pd.StringDtype("pyarrow")
+
+
+ARROW_STRING = _arrow_string_dtype()
+
+
+def _is_arrow_string(dtype):
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def compact_reviews(df):
+    """리뷰 데이터프레임을 작은 dtype 으로 (감성: category, 평점/가중치: int8 등, 본문: Arrow 문자열)
+
+    이미 변환된 컬럼은 그대로 두므로 여러 번 불러도 비용이 거의 없다.
+    """
+    changes = {}
+    for column in SENTIMENT_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            changes[column] = pd.Categorical(df[column], categories=SENTIMENT_CATEGORIES)
+    for column in CATEGORY_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            changes[column] = df[column].astype("category")
+    for column in SMALL_INT_COLUMNS:
+        if column in df.columns and df[column].dtype.kind in "iuf" and df[column].dtype.itemsize > 1:
+            # 결측값이 있거나 정수가 아니면 그대로, 범위에 맞는 가장 작은 정수형으로 (int8 → int16 ...)
+            downcast = pd.to_numeric(df[column], downcast="integer")
+            if downcast.dtype.kind in "iu" and downcast.dtype.itemsize < df[column].dtype.itemsize:
+                changes[column] = downcast
+    if ARROW_STRING is not None:
+        for column in TEXT_COLUMNS:
+            if column in df.columns and not _is_arrow_string(df[column].dtype):
+                changes[column] = df[column].astype(ARROW_STRING)
+    return df.assign(**changes) if changes else df
+
+
+def memory_report(df):
+    """컬럼별 메모리 사용량 (dtype, 바이트), 합계는 total_bytes 로"""
+    usage = df.memory_usage(index=True, deep=True)
+    report = pd.DataFrame({
+        "컬럼": usage.index,
+        "dtype": [str(df[column].dtype) if column in df.columns else "index" for column in usage.index],
+        "바이트": usage.to_numpy(),
+    })
+    return report, int(usage.sum())
+
+
+def prepare_reviews(df, limit=DEFAULT_LIMIT, webtoon_mode=True, workers=1):
+    """불러온 리뷰 정리 (at 변환, 건수 제한, sentiment 없으면 감성분석 수행, 작은 dtype)"""
+    df = df.copy(deep=False)
+    df["at"] = pd.to_datetime(df["at"])
+
+    if limit is not None and len(df) > limit:
+        df = df.head(limit)
+
+    # 이미 sentiment가 있으면 바로 반환
+    if "sentiment" in df.columns:
+        return compact_reviews(df)
+
+    columns = parallel.score_sentiment(df["content"].to_numpy(), df["score"].to_numpy(), webtoon_mode, workers)
+    for name, values in columns.items():
+        df[name] = values
+    return compact_reviews(df)
+
+
+def read_reviews_csv(path, limit=DEFAULT_LIMIT):
+    """리뷰 CSV 로드 (CSV에 sentiment 없으면 웹툰 특화 감성분석 수행)"""
+    return prepare_reviews(pd.read_csv(path), limit)
+
+
+def read_reviews(path, limit=None, webtoon_mode=True, workers=1):
+    """리뷰 파일 로드 (CSV 또는 Parquet, 확장자로 구분), 기본은 건수 제한 없음"""
+    if str(path).lower().endswith((".parquet", ".pq")):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    return prepare_reviews(df, limit, webtoon_mode, workers)
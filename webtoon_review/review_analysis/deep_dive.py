@@ -0,0 +1,60 @@
+"""키워드 심층 분석 (키워드 포함 리뷰의 문맥 감성, 키워드 조합, 긍정/부정별 연관어)
+
+데이터셋 단위 구조(ReviewIndex, TokenStore, CooccurrenceMatrix)를 받아 키워드 하나에 대한 결과만 계산한다.
+연관어는 동시출현 PMI 표 [(단어, 동시출현, PMI)] 이고, 어휘에 없는 키워드(영문, 여러 단어, 자모 등)나
+리뷰가 적어 PMI 결과가 없으면 키워드 포함 리뷰의 토큰 빈도 표 [(단어, 빈도)] 로 대신한다.
+"""
+from .association import TOP_RELATED
+from .context import context_rules
+from .ngrams import top_ngrams
+from .sentiment import NEGATIVE, POSITIVE, apply_context_labels
+
+TOP_KEYWORD_BIGRAMS = 10
+TOP_SPLIT_RELATED = 15
+# 이보다 적은 리뷰에서는 PMI 가 불안정하므로 토큰 빈도로 대신함
+MIN_RELATED_ROWS = 20
+
+
+def keyword_rows(review_index, keyword):
+    """키워드를 포함하는 리뷰 행 번호 (대소문자 무시)"""
+    return review_index.search(keyword, case=False)
+
+
+def keyword_sentiment(contents, sentiments, rows, keyword):
+    """키워드 문맥 기반 감성 재분류 (문맥 감성이 있으면 그걸 사용, 없으면 기존 감성 사용)
+
+    contents, sentiments: 데이터셋 전체 배열, 반환은 rows 순서의 object 배열
+    """
+    context_labels = context_rules(keyword).classify_many(contents[rows])
+    return apply_context_labels(context_labels, sentiments[rows])
+
+
+def keyword_bigrams(token_store, rows, keyword, k=TOP_KEYWORD_BIGRAMS):
+    """키워드가 들어간 바이그램 상위 k개 (키워드 포함 리뷰에서만)"""
+    return top_ngrams(token_store, 2, rows, k, lambda bigram: keyword in bigram)
+
+
+def frequent_terms(token_store, rows, keyword, k=TOP_RELATED):
+    """rows 리뷰에서 많이 나온 단어 상위 k개 [(단어, 빈도), ...] (키워드를 포함하거나 키워드에 포함되는 단어는 제외)"""
+    return top_ngrams(token_store, 1, rows, k, lambda term: keyword not in term and term not in keyword)
+
+
+def related_terms(cooccurrence, rows, keyword, k=TOP_RELATED, scoped=False):
+    """키워드 연관어 (PMI 표, 없으면 rows 리뷰의 토큰 빈도 표)
+
+    rows: 키워드 포함 리뷰 행 번호, scoped 이면 동시출현도 이 리뷰들에서만 센다 (아니면 데이터셋 전체 행렬)
+    """
+    if len(rows) >= MIN_RELATED_ROWS:
+        related = cooccurrence.related(keyword, rows if scoped else None, k=k)
+        if related:
+            return related
+    return frequent_terms(cooccurrence.token_store, rows, keyword, k)
+
+
+def split_related(cooccurrence, rows, labels, keyword, k=TOP_SPLIT_RELATED):
+    """긍정/부정 리뷰별 연관어 {"긍정": [...], "부정": [...]} (해당 리뷰가 없으면 None)"""
+    split = {}
+    for label in (POSITIVE, NEGATIVE):
+        label_rows = rows[labels == label]
+        split[label] = related_terms(cooccurrence, label_rows, keyword, k, scoped=True) if len(label_rows) > 0 else None
+    return split
@@ -0,0 +1,92 @@
+"""평점 × 감성 패싯 (값별 비트마스크를 데이터셋당 한 번 만들어 필터/집계에 재사용)
+
+- 평점 값(1~5)과 감성 라벨마다 리뷰 포함 여부를 np.packbits 비트맵으로 저장 (리뷰 8건당 1바이트)
+- 필터 조합은 선택한 값 비트맵의 OR, 평점/감성 사이는 AND 로 계산
+- 건수는 비트 수만 세면 되므로 평점 분포, 감성 분포, 평점 × 감성 교차표를 데이터프레임을 다시 훑지 않고 만든다
+"""
+import numpy as np
+import pandas as pd
+
+
+def _bitmaps(values):
+    """값 목록(Index, 정렬 순서 / 범주형이면 범주 순서), {값: 비트맵}"""
+    categorical = pd.Categorical(values)
+    categories = categorical.categories
+    codes = categorical.codes
+    return categories, {value: np.packbits(codes == code) for code, value in enumerate(categories.tolist())}
+
+
+def _popcount(bitmap):
+    if hasattr(np, "bitwise_count"):
+        return int(np.bitwise_count(bitmap).sum(dtype=np.int64))
+    return int(np.unpackbits(bitmap).sum(dtype=np.int64))
+
+
+class Facets:
+    """평점/감성 값별 비트마스크 (필터 → 행 번호, 패싯 건수)"""
+
+    def __init__(self, scores, sentiments):
+        self.n_rows = len(scores)
+        self.score_index, self._score_bits = _bitmaps(scores)
+        self.label_index, self._label_bits = _bitmaps(sentiments)
+        self._all = np.packbits(np.ones(self.n_rows, dtype=bool))
+        self._none = np.zeros_like(self._all)
+
+    def __sizeof__(self):
+        bitmaps = list(self._score_bits.values()) + list(self._label_bits.values()) + [self._all, self._none]
+        return object.__sizeof__(self) + sum(bitmap.nbytes for bitmap in bitmaps)
+
+    def _union(self, bits, values):
+        if values is None:
+            return self._all
+        bitmap = self._none
+        for value in values:
+            if value in bits:
+                bitmap = bitmap | bits[value]
+        return bitmap
+
+    def mask(self, scores=None, sentiments=None):
+        """선택한 평점 중 하나이면서 선택한 감성 중 하나인 리뷰 비트맵 (None 이면 해당 조건 없음)"""
+        return self._union(self._score_bits, scores) & self._union(self._label_bits, sentiments)
+
+    def rows(self, bitmap):
+        """비트맵 → 리뷰 위치 (오름차순)"""
+        return np.flatnonzero(np.unpackbits(bitmap, count=self.n_rows))
+
+    def bool_mask(self, bitmap):
+        """비트맵 → 리뷰 수 길이의 boolean 배열"""
+        return np.unpackbits(bitmap, count=self.n_rows).view(bool)
+
+    def count(self, bitmap):
+        return _popcount(bitmap)
+
+    def score_counts(self):
+        """평점별 리뷰 수 (value_counts().sort_index() 와 같은 모양, 0건인 값 제외)"""
+        counts = pd.Series(
+            [self.count(bits) for bits in self._score_bits.values()], index=self.score_index, name="count", dtype=np.int64,
+        )
+        counts.index.name = "score"
+        return counts[counts > 0]
+
+    def sentiment_counts(self):
+        """감성 라벨별 리뷰 수 (많은 순, 동률이면 라벨 순)"""
+        counts = pd.Series(
+            [self.count(bits) for bits in self._label_bits.values()], index=self.label_index, name="count", dtype=np.int64,
+        )
+        counts.index.name = "sentiment"
+        return counts.sort_values(ascending=False, kind="stable")
+
+    def crosstab(self):
+        """평점 × 감성 교차표 (groupby(["score", "sentiment"], observed=True).size().unstack(fill_value=0) 과 같음)"""
+        table = np.array([
+            [self.count(score_bits & label_bits) for label_bits in self._label_bits.values()]
+            for score_bits in self._score_bits.values()
+        ], dtype=np.int64).reshape(len(self._score_bits), len(self._label_bits))
+        # 한 번도 나오지 않은 평점/라벨은 groupby(observed=True) 처럼 뺌
+        keep_rows = table.sum(axis=1) > 0
+        keep_columns = table.sum(axis=0) > 0
+        return pd.DataFrame(
+            table[keep_rows][:, keep_columns],
+            index=self.score_index[keep_rows].rename("score"),
+            columns=self.label_index[keep_columns].rename("sentiment"),
+        )
@@ -0,0 +1,36 @@
+"""리뷰 데이터셋 지문 (캐시 키용)
+
+데이터프레임 전체를 직렬화하지 않고, 리뷰 식별 컬럼의 행 해시만으로
+안정적인 짧은 키를 만든다. 같은 리뷰 집합이면 세션/프로세스가 달라도 같은 값이다.
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+# 지문에 사용하는 컬럼 (있는 것만 사용, 순서 고정)
+FINGERPRINT_COLUMNS = ["reviewId", "at", "score", "content"]
+
+
+def _normalize(column, values):
+    """로드 경로(CSV/API)에 따라 달라지는 dtype 을 맞춰 같은 데이터면 같은 해시가 나오게 함"""
+    if column == "at":
+        # 시간대가 있으면 UTC 로 맞춘 뒤 시간대 제거 (시간대 없는 값은 그대로)
+        return pd.to_datetime(values, utc=True, errors="coerce").dt.tz_localize(None).astype("datetime64[ns]")
+    if column == "score":
+        return pd.to_numeric(values, errors="coerce").astype("float64")
+    return values.astype(str)
+
+
+def dataset_fingerprint(df, columns=FINGERPRINT_COLUMNS):
+    """리뷰 집합의 내용 기반 지문 (hex 문자열)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(len(df)).encode())
+    for column in columns:
+        if column not in df.columns:
+            continue
+        values = _normalize(column, df[column])
+        row_hashes = pd.util.hash_pandas_object(values, index=False).to_numpy(dtype=np.uint64)
+        digest.update(column.encode())
+        digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
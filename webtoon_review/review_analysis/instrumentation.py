@@ -0,0 +1,207 @@
+"""재실행(rerun)별 성능 계측 (선택 사항, 꺼져 있으면 호출 1번당 스레드 로컬 조회 1번만 추가)
+
+- span(name, rows): 구간 실행 시간 + 처리 행 수 (행 수를 나중에 알면 frame["rows"] 에 넣음)
+- record(name, ms, ...): 이미 잰 값을 바로 기록 (분석 단계 캐시 적중 등)
+- timed(name, rows): 함수 데코레이터 (span 과 같음)
+- cached(cache_decorator, name, rows): st.cache_data / st.cache_resource 를 감싸 호출 시간과 적중/미스 기록
+  (캐시 안쪽 함수 본문이 실행되면 미스, 아니면 적중)
+- 메모리: 이번 재실행 동안의 현재 RSS 변화량 (/proc/self/statm, 다른 세션 몫도 포함)과
+  프로세스 시작 이후 최대 RSS (getrusage, 한 번 올라가면 내려가지 않으므로 재실행별 값이 아님)
+  (tracemalloc 은 켜 두는 동안 모든 세션의 실행을 몇 배 느리게 해 잰 시간을 왜곡하므로 쓰지 않음)
+
+Streamlit 은 세션마다 다른 스레드에서 스크립트를 실행하므로, 현재 기록기는 스레드 로컬로 둔다.
+"""
+import functools
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+HIT = "hit"
+MISS = "miss"
+
+_local = threading.local()
+
+
+def peak_rss_bytes():
+    """프로세스 최대 RSS (바이트, 알 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 는 KB, macOS 는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss_bytes():
+    """프로세스 현재 RSS (바이트, /proc 이 없는 OS 면 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class RerunRecorder:
+    """재실행 1회의 계측 기록"""
+
+    def __init__(self, label="", track_memory=True):
+        self.label = label
+        self.track_memory = track_memory
+        self.records = []
+        self.started_at = time.time()
+        self.total_ms = None
+        self.peak_bytes = None
+        self.rss_bytes = None
+        self.rss_delta_bytes = None
+        self._frames = []
+        self._start = None
+        self._start_rss = None
+
+    def start(self):
+        self._start = time.perf_counter()
+        if self.track_memory:
+            self._start_rss = current_rss_bytes()
+        return self
+
+    def finish(self):
+        if self._start is not None and self.total_ms is None:
+            self.total_ms = (time.perf_counter() - self._start) * 1000
+            if self.track_memory:
+                self.peak_bytes = peak_rss_bytes()
+                self.rss_bytes = current_rss_bytes()
+                if self.rss_bytes is not None and self._start_rss is not None:
+                    self.rss_delta_bytes = self.rss_bytes - self._start_rss
+        return self
+
+    def elapsed_ms(self, now=None):
+        return ((now or time.perf_counter()) - self._start) * 1000
+
+    def add(self, name, ms, rows=None, cache=None, depth=0, start_ms=None):
+        """구간 기록 (start_ms: 재실행 시작부터 구간 시작까지, 없으면 지금 끝난 것으로 계산)"""
+        if start_ms is None:
+            start_ms = self.elapsed_ms() - ms
+        self.records.append({
+            "name": name, "start_ms": round(start_ms, 3), "ms": round(ms, 3),
+            "rows": rows, "cache": cache, "depth": depth,
+        })
+
+    def ordered_records(self):
+        """시작 순서대로 (중첩 구간은 끝난 순서로 쌓이므로)"""
+        return sorted(self.records, key=lambda record: (record["start_ms"], record["depth"]))
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total_ms": None if self.total_ms is None else round(self.total_ms, 3),
+            "peak_bytes": self.peak_bytes,
+            "rss_bytes": self.rss_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+            "records": self.ordered_records(),
+        }
+
+
+def current():
+    """이 스레드에서 계측 중인 기록기 (없으면 None)"""
+    return getattr(_local, "recorder", None)
+
+
+def activate(recorder):
+    _local.recorder = recorder.start()
+    return recorder
+
+
+def deactivate():
+    recorder = current()
+    _local.recorder = None
+    return recorder.finish() if recorder is not None else None
+
+
+def _count_rows(rows, args, kwargs):
+    if rows is None:
+        return None
+    try:
+        return int(rows(*args, **kwargs))
+    except Exception:
+        return None
+
+
+@contextmanager
+def span(name, rows=None):
+    """구간 계측 (rows: 처리 행 수), 계측 중이 아니면 기록하지 않음 (frame 에 값을 넣어도 무시됨)"""
+    recorder = current()
+    if recorder is None:
+        yield {}
+        return
+    frame = {"miss": False, "rows": rows}
+    recorder._frames.append(frame)
+    start = time.perf_counter()
+    try:
+        yield frame
+    finally:
+        recorder._frames.pop()
+        recorder.add(
+            name, (time.perf_counter() - start) * 1000, frame["rows"], frame.get("cache"),
+            len(recorder._frames), recorder.elapsed_ms(start),
+        )
+
+
+def record(name, ms, rows=None, cache=None):
+    """이미 잰 구간 기록, 계측 중이 아니면 무시"""
+    recorder = current()
+    if recorder is not None:
+        recorder.add(name, ms, rows, cache, len(recorder._frames))
+
+
+def timed(name=None, rows=None):
+    """함수 계측 데코레이터 (rows: 인자 → 처리 행 수)"""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current() is None:
+                return func(*args, **kwargs)
+            with span(label, _count_rows(rows, args, kwargs)):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def cached(cache_decorator, name=None, rows=None):
+    """캐시 데코레이터(st.cache_data 등) + 계측: 호출마다 시간과 적중/미스를 기록
+
+    안쪽 함수는 functools.wraps 로 원래 이름/시그니처/소스를 유지하므로 캐시 키와 `_` 인자 규칙은 그대로다.
+    """
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def compute(*args, **kwargs):
+            recorder = current()
+            if recorder is not None and recorder._frames:
+                recorder._frames[-1]["miss"] = True
+            return func(*args, **kwargs)
+
+        cached_func = cache_decorator(compute)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current() is None:
+                return cached_func(*args, **kwargs)
+            with span(label, _count_rows(rows, args, kwargs)) as frame:
+                result = cached_func(*args, **kwargs)
+                frame["cache"] = MISS if frame["miss"] else HIT
+                return result
+
+        # st.cache_data 의 clear() 는 그대로 노출
+        if hasattr(cached_func, "clear"):
+            wrapper.clear = cached_func.clear
+        return wrapper
+    return decorate
@@ -0,0 +1,50 @@
+"""감성 사전 정의 및 컴파일된 매칭기"""
+from .matcher import LexiconMatcher
+
+# ----------------------------
+# 감성 키워드 정의 (기본)
+# ----------------------------
+POSITIVE_WORDS = {"좋아", "최고", "재밌", "재미있", "편리", "편해", "만족", "추천", "굿", "대박", "사랑", "완벽", "훌륭", "감사", "행복", "즐거"}
+NEGATIVE_WORDS = {"별로", "싫어", "최악", "불편", "짜증", "화나", "실망", "후회", "쓰레기", "폭망", "구림", "개선", "답답", "불만", "짜증나", "에러", "버그"}
+
+# ----------------------------
+# 웹툰/만화 특화 감성 키워드 (가중치 포함)
+# ----------------------------
+WEBTOON_SENTIMENT = {
+    "positive": {
+        # 기본 (weight 1-3)
+        "좋다": 1, "좋아요": 1, "만족": 1,
+        "재밌다": 2, "재미있다": 2, "추천": 2, "감동": 2, "몰입": 2, "여운": 2,
+        "강추": 3, "최고": 3, "완벽": 3,
+        # 웹툰특화
+        "작화좋다": 2, "작화좋음": 2, "작화미쳤다": 3, "작화미침": 3,
+        "스토리탄탄": 3, "전개깔끔": 2, "연출좋다": 2, "연출좋음": 2,
+        "캐릭터매력": 2, "개연성있다": 2, "세계관탄탄": 3,
+        "떡밥회수": 3, "다음화기대": 2, "정주행": 2, "시간순삭": 3,
+        # 극단
+        "갓작": 3, "명작": 3, "레전드": 3, "인생웹툰": 3, "소름": 3,
+        # 추가 변형
+        "재밌": 2, "재미있": 2, "좋아": 1, "강력추천": 3, "꿀잼": 3,
+        "작화": 1, "스토리": 1, "몰입감": 2, "감동적": 2,
+    },
+    "negative": {
+        # 기본
+        "노잼": 3, "별로": 1, "실망": 2, "아쉽다": 1, "아쉬움": 1,
+        "지루": 2, "답답": 2, "비추": 2, "최악": 3, "재미없다": 2, "재미없": 2,
+        # 웹툰특화
+        "작화붕괴": 3, "작붕": 3, "스토리산으로": 3, "산으로": 2,
+        "개연성없다": 3, "개연성없음": 3, "전개느림": 2, "급전개": 2,
+        "캐붕": 3, "설정붕괴": 3, "질질끈다": 2, "질질끔": 2,
+        "떡밥방치": 3, "몰입깨짐": 2,
+        # 극단
+        "하차": 3, "시간낭비": 3, "돈아까움": 3, "발암": 3, "개망작": 3,
+        # 추가 변형
+        "노잼임": 3, "별로임": 1, "지루함": 2, "지루해": 2,
+    }
+}
+
+# ----------------------------
+# 컴파일된 매칭기 (사전별 1회 생성)
+# ----------------------------
+BASIC_MATCHER = LexiconMatcher({"positive": POSITIVE_WORDS, "negative": NEGATIVE_WORDS})
+WEBTOON_MATCHER = LexiconMatcher(WEBTOON_SENTIMENT)
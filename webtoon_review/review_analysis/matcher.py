@@ -0,0 +1,83 @@
+"""다중 패턴 사전 매칭기
+
+여러 감성 사전(긍정/부정 등)의 단어를 리뷰 한 번 훑기로 모두 찾는다.
+`word in text` 를 사전 단어 수만큼 반복하던 방식과 결과가 같다
+(단어가 여러 번 나와도 한 번만 집계, 서로 겹치는 단어도 모두 집계).
+"""
+import re
+
+
+class LexiconMatcher:
+    """사전 묶음을 트라이 + 첫 글자 정규식으로 컴파일한 매칭기
+
+    lexicons: {라벨: {단어: 가중치}} 또는 {라벨: 단어 집합(가중치 1)}
+    """
+
+    def __init__(self, lexicons):
+        self.labels = list(lexicons)
+        self._entries = []  # (라벨 순번, 단어, 가중치) - 사전 정의 순서
+        self._trie = {}
+
+        for label_idx, label in enumerate(self.labels):
+            words = lexicons[label]
+            items = words.items() if isinstance(words, dict) else ((w, 1) for w in words)
+            for word, weight in items:
+                if not word:
+                    continue
+                entry_idx = len(self._entries)
+                self._entries.append((label_idx, word, weight))
+                node = self._trie
+                for ch in word:
+                    node = node.setdefault(ch, {})
+                node.setdefault(None, []).append(entry_idx)
+
+        # 후보 시작 위치만 C 레벨에서 빠르게 찾고, 트라이는 후보에서만 탐색
+        first_chars = sorted({word[0] for _, word, _ in self._entries})
+        if first_chars:
+            self._starts = re.compile("[" + "".join(re.escape(ch) for ch in first_chars) + "]")
+        else:
+            self._starts = re.compile(r"(?!)")
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _hit_entries(self, text):
+        """텍스트에 포함된 사전 항목 번호 집합 (한 번의 스캔)"""
+        hits = set()
+        trie = self._trie
+        n = len(text)
+        for m in self._starts.finditer(text):
+            node = trie
+            i = m.start()
+            while True:
+                ends = node.get(None)
+                if ends:
+                    hits.update(ends)
+                if i >= n:
+                    break
+                node = node.get(text[i])
+                if node is None:
+                    break
+                i += 1
+        return hits
+
+    def find(self, text):
+        """라벨별 매칭 단어 목록 {라벨: [(단어, 가중치), ...]} (사전 정의 순서)"""
+        found = {label: [] for label in self.labels}
+        for entry_idx in sorted(self._hit_entries(str(text))):
+            label_idx, word, weight = self._entries[entry_idx]
+            found[self.labels[label_idx]].append((word, weight))
+        return found
+
+    def score(self, text):
+        """라벨별 가중치 합 튜플 (self.labels 순서)"""
+        totals = [0] * len(self.labels)
+        entries = self._entries
+        for entry_idx in self._hit_entries(str(text)):
+            label_idx, _, weight = entries[entry_idx]
+            totals[label_idx] += weight
+        return tuple(totals)
+
+    def score_many(self, texts):
+        """여러 리뷰의 라벨별 가중치 합 리스트"""
+        return [self.score(text) for text in texts]
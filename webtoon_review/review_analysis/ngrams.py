@@ -0,0 +1,85 @@
+"""키워드 조합(n-gram) 빈도 분석 - 토큰 저장소 기반
+
+n-gram 을 문자열로 만들지 않고 토큰 id 를 묶은 int64 키를 정렬해 집계하고,
+표시용 문자열은 상위 k개에 대해서만 만든다.
+순위는 Counter.most_common 과 같다 (빈도 내림차순, 동률이면 먼저 나온 순).
+"""
+import numpy as np
+
+TOP_NGRAMS = 30
+# 처음 나온 위치를 찾을 때 한 번에 검사하는 키 수
+FIRST_SCAN_CHUNK = 1 << 16
+
+
+def negative_rows(scores):
+    """불만 리뷰 (1-2점) 위치"""
+    return np.flatnonzero(np.asarray(scores) <= 2)
+
+
+def positive_rows(scores):
+    """긍정 리뷰 (4-5점) 위치"""
+    return np.flatnonzero(np.asarray(scores) >= 4)
+
+
+def ngram_counts(token_store, n, rows=None):
+    """n-gram 키별 빈도 (키 오름차순 unique, counts)"""
+    keys = token_store.ngram_keys(n, rows)
+    keys.sort()
+    # 리뷰 경계 자리(-1)는 정렬 후 맨 앞에 모이므로 잘라냄 (복사 없음)
+    keys = keys[np.searchsorted(keys, 0):]
+    if len(keys) == 0:
+        return keys, np.empty(0, dtype=np.int64)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    counts = np.diff(np.append(starts, len(keys)))
+    return keys[starts], counts
+
+
+def _first_positions(token_store, n, rows, candidates):
+    """후보 키(오름차순)가 처음 나온 위치 (동률 순서용, 키 배열을 조각으로 나눠 검사)"""
+    keys = token_store.ngram_keys(n, rows)
+    first = np.full(len(candidates), len(keys), dtype=np.int64)
+    for start in range(0, len(keys), FIRST_SCAN_CHUNK):
+        chunk = keys[start:start + FIRST_SCAN_CHUNK]
+        pos = np.minimum(np.searchsorted(candidates, chunk), len(candidates) - 1)
+        hit = candidates[pos] == chunk
+        np.minimum.at(first, pos[hit], np.flatnonzero(hit) + start)
+    return first
+
+
+def top_ngrams(token_store, n, rows=None, k=TOP_NGRAMS, predicate=None):
+    """선택한 리뷰들의 n-gram 빈도 상위 k개 [(조합, 빈도), ...] (n=1 이면 단어)
+
+    predicate: 조합 문자열을 받아 포함 여부를 정하는 함수 (조건에 맞는 것 중 상위 k개)
+    """
+    keys, counts = ngram_counts(token_store, n, rows)
+    if len(keys) == 0:
+        return []
+    if predicate is not None:
+        # 조건에 맞는 조합은 문자열을 봐야 알 수 있으므로 고유 조합만 문자열로 만들어 거름
+        keep = np.array([predicate(token_store.decode_ngram(key, n)) for key in keys.tolist()], dtype=bool)
+        keys, counts = keys[keep], counts[keep]
+        if len(keys) == 0:
+            return []
+    # k 번째 빈도 이상인 후보만 처음 나온 위치를 구해 정렬
+    threshold = np.partition(counts, len(counts) - k)[len(counts) - k] if len(counts) > k else counts.min()
+    candidate = counts >= threshold
+    keys, counts = keys[candidate], counts[candidate]
+    first = _first_positions(token_store, n, rows, keys)
+    order = np.lexsort((first, -counts))[:k]
+    return [(token_store.decode_ngram(key, n), count) for key, count in zip(keys[order].tolist(), counts[order].tolist())]
+
+
+def complaint_ngrams(token_store, scores):
+    """불만 키워드 조합 (1-2점 리뷰): (바이그램 상위, 트리그램 상위)"""
+    rows = negative_rows(scores)
+    if len(rows) == 0:
+        return [], []
+    return top_ngrams(token_store, 2, rows), top_ngrams(token_store, 3, rows)
+
+
+def positive_bigrams(token_store, scores):
+    """긍정 키워드 조합 (4-5점 리뷰, 바이그램 상위)"""
+    rows = positive_rows(scores)
+    if len(rows) == 0:
+        return []
+    return top_ngrams(token_store, 2, rows)
@@ -0,0 +1,68 @@
+"""리뷰 목록 페이지 나누기 (필터 결과는 행 번호로만 두고, 보이는 페이지만 표시용으로 변환)
+
+정렬도 행 번호 배열에서 하므로 데이터프레임을 복사하지 않고, 화면에 보내는 행 수는 데이터 크기와 무관하게 페이지 크기로 고정된다.
+"""
+import numpy as np
+import pandas as pd
+
+PAGE_SIZE = 50
+# 정렬 이름 → (컬럼, 내림차순) (None 이면 데이터 순서 그대로)
+SORT_OPTIONS = {
+    "기본 순서": None,
+    "최신순": ("at", True),
+    "오래된순": ("at", False),
+    "평점 높은순": ("score", True),
+    "평점 낮은순": ("score", False),
+}
+DATE_FORMAT = "%Y-%m-%d"
+
+
+def sort_rows(rows, keys, descending=False):
+    """행 번호를 keys[rows] 기준으로 안정 정렬 (동률은 원래 순서 유지, 빈 날짜(NaT)는 방향과 상관없이 맨 뒤)"""
+    values = np.asarray(keys)[rows]
+    missing = None
+    if values.dtype.kind in "mM":
+        missing = np.isnat(values)
+        values = values.view(np.int64)
+    if descending:
+        # 정수는 ~ 로 뒤집으면 최솟값(NaT)도 넘치지 않음, 실수의 NaN 은 -NaN 이어도 맨 뒤
+        values = -values if values.dtype.kind == "f" else ~values
+    if missing is not None and missing.any():
+        # lexsort 도 안정 정렬 (마지막 키가 우선)
+        return rows[np.lexsort((values, missing))]
+    return rows[np.argsort(values, kind="stable")]
+
+
+def sort_keys(column):
+    """정렬용 numpy 배열 (날짜는 시간대가 있으면 UTC 로 맞춘 datetime64, to_numpy 는 Timestamp 객체 배열이 되므로)"""
+    if isinstance(column.dtype, pd.DatetimeTZDtype):
+        return column.dt.tz_convert("UTC").dt.tz_localize(None).to_numpy()
+    return column.to_numpy()
+
+
+def sorted_rows(reviews, rows, sort):
+    """SORT_OPTIONS 이름으로 정렬한 행 번호"""
+    option = SORT_OPTIONS[sort]
+    if option is None:
+        return rows
+    column, descending = option
+    return sort_rows(rows, sort_keys(reviews[column]), descending)
+
+
+def page_count(n_rows, page_size=PAGE_SIZE):
+    """페이지 수 (행이 없어도 1)"""
+    return max((n_rows + page_size - 1) // page_size, 1)
+
+
+def page_rows(rows, page, page_size=PAGE_SIZE):
+    """page 번째 페이지(1부터)의 행 번호"""
+    start = (page - 1) * page_size
+    return rows[start:start + page_size]
+
+
+def format_page(reviews, rows, columns):
+    """보이는 행만 꺼내 표시용 표로 (columns: {원래 컬럼: 표시 이름}, 날짜는 문자열로)"""
+    page = reviews.iloc[rows][list(columns)]
+    if "at" in columns:
+        page = page.assign(at=page["at"].dt.strftime(DATE_FORMAT))
+    return page.rename(columns=columns)
@@ -0,0 +1,114 @@
+"""대용량 리뷰 병렬 분석 (프로세스 풀)
+
+리뷰를 순서대로 연속 조각으로 나눠 작업자 프로세스에서 분석하고, 조각 순서대로 병합한다.
+- 리뷰별 결과(감성, 토픽 행렬)는 이어붙이고, 빈도(요청사항, 토큰 vocab)는 앞 조각부터 합쳐
+  처음 나온 순서(동률 순위)까지 직렬 실행과 같은 결과를 낸다.
+- 리뷰 수가 min_rows 보다 적거나 작업자가 1개면 풀 없이 직렬로 실행한다 (풀 비용이 더 큼).
+
+작업자 프로세스는 spawn 방식으로 한 번 만들어 재사용한다 (Streamlit 처럼 스레드가 있는 프로세스에서도 안전).
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .request_phrases import count_requests, merge_request_counts, top_requests
+from .request_phrases import extract_requests as _extract_requests
+from .sentiment import score_sentiment as _score_sentiment
+from .tokens import TokenStore
+from .topics import topic_matrix as _topic_matrix
+
+# 기본 작업자 수 (CPU 수)
+DEFAULT_WORKERS = os.cpu_count() or 1
+# 이보다 적은 리뷰는 직렬 실행
+MIN_PARALLEL_ROWS = 20_000
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def resolve_workers(workers=None):
+    return DEFAULT_WORKERS if workers is None else max(int(workers), 1)
+
+
+def shard_bounds(n_rows, shards):
+    """[0, n_rows) 를 거의 같은 크기의 연속 구간 shards 개로 [(start, end), ...]"""
+    edges = np.linspace(0, n_rows, shards + 1).astype(np.int64).tolist()
+    return [(start, end) for start, end in zip(edges[:-1], edges[1:]) if end > start]
+
+
+def _pool(workers):
+    with _pools_lock:
+        pool = _pools.get(workers)
+        if pool is None:
+            pool = _pools[workers] = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+        return pool
+
+
+def shutdown():
+    """만들어 둔 프로세스 풀 종료"""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
+
+
+def _serial(contents, workers, min_rows):
+    return resolve_workers(workers) <= 1 or len(contents) < min_rows
+
+
+def map_shards(func, columns, workers=None, min_rows=MIN_PARALLEL_ROWS):
+    """같은 길이 배열들(columns)을 조각으로 나눠 func(*조각) 실행 → 조각 순서대로 결과 리스트
+
+    func 는 작업자 프로세스로 보내야 하므로 모듈 최상위 함수(또는 그 partial)여야 한다.
+    """
+    if _serial(columns[0], workers, min_rows):
+        return [func(*columns)]
+    workers = resolve_workers(workers)
+    pool = _pool(workers)
+    futures = [
+        pool.submit(func, *(column[start:end] for column in columns))
+        for start, end in shard_bounds(len(columns[0]), workers)
+    ]
+    return [future.result() for future in futures]
+
+
+def _as_list(contents):
+    # 조각을 작업자에게 보낼 때 Arrow 배열/Series 대신 가벼운 문자열 목록으로
+    return contents if isinstance(contents, list) else [str(text) for text in contents]
+
+
+def score_sentiment(contents, scores, webtoon_mode=True, workers=None, min_rows=MIN_PARALLEL_ROWS):
+    """sentiment.score_sentiment 와 같은 결과 (리뷰별 컬럼을 조각 순서대로 이어붙임)"""
+    if _serial(contents, workers, min_rows):
+        return _score_sentiment(contents, scores, webtoon_mode)
+    parts = map_shards(
+        partial(_score_sentiment, webtoon_mode=webtoon_mode),
+        [_as_list(contents), np.asarray(scores)], workers, min_rows,
+    )
+    return {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+
+
+def topic_matrix(contents, workers=None, min_rows=MIN_PARALLEL_ROWS):
+    """topics.topic_matrix 와 같은 리뷰 × 토픽 행렬"""
+    if _serial(contents, workers, min_rows):
+        return _topic_matrix(contents)
+    return np.concatenate(map_shards(_topic_matrix, [_as_list(contents)], workers, min_rows), axis=0)
+
+
+def extract_requests(contents, workers=None, min_rows=MIN_PARALLEL_ROWS):
+    """request_phrases.extract_requests 와 같은 상위 요청사항 (조각별 Counter 를 순서대로 병합)"""
+    if _serial(contents, workers, min_rows):
+        return _extract_requests(contents)
+    parts = map_shards(count_requests, [_as_list(contents)], workers, min_rows)
+    return top_requests(*merge_request_counts(parts))
+
+
+def build_token_store(contents, workers=None, min_rows=MIN_PARALLEL_ROWS):
+    """TokenStore.from_texts 와 같은 토큰 저장소 (조각 저장소를 vocab 병합해 이어붙임)"""
+    if _serial(contents, workers, min_rows):
+        return TokenStore.from_texts(contents)
+    return TokenStore.concat(map_shards(TokenStore.from_texts, [_as_list(contents)], workers, min_rows))
@@ -0,0 +1,114 @@
+"""분석 단계 그래프 (지연 계산 + 단계별 캐시 + 실행 기록)
+
+각 단계는 이름, 계산 함수, 의존하는 단계/입력 이름으로 한 번 등록해 두고,
+재실행(rerun)마다 StageRun 에 입력(데이터셋 지문, 위젯 값 등)을 넣은 뒤 필요한 단계만 꺼내 쓴다.
+
+- 지연 계산: 꺼내 쓴 단계와 그 의존 단계만 계산 (보이지 않는 탭의 단계는 실행되지 않음)
+- 캐시 키: 단계 이름 + 의존 값들의 키 → 위젯 하나가 바뀌면 그 입력에 (직간접으로) 의존하는 단계만 다시 계산
+- 실행 기록: 이번 재실행에서 단계별로 계산(run)했는지 캐시(hit)였는지와 걸린 시간
+  (성능 계측이 켜져 있으면 instrumentation 기록에도 남김)
+"""
+import hashlib
+import time
+
+from .instrumentation import HIT as CACHE_HIT, MISS as CACHE_MISS, record, span
+
+RUN = "run"
+HIT = "hit"
+
+_MISSING = object()
+
+
+class Stage:
+    """분석 단계 (func 는 deps 순서대로 값을 받음)"""
+
+    def __init__(self, name, func, deps):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+
+class StageGraph:
+    """단계 정의 모음 (의존 그래프)"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def stage(self, *deps, name=None):
+        """단계 등록 데코레이터: @graph.stage("contents", "fingerprint")"""
+        def register(func):
+            stage_name = name or func.__name__
+            if stage_name in self.stages:
+                raise ValueError(f"이미 등록된 단계: {stage_name}")
+            self.stages[stage_name] = Stage(stage_name, func, deps)
+            return func
+        return register
+
+    def run(self, cache):
+        """재실행 1회분 실행기 (cache: 단계 키 → 값, 재실행 사이에 유지되는 dict 또는 ResultCache)"""
+        return StageRun(self, cache)
+
+
+class StageRun:
+    """재실행 1회 동안의 입력, 계산된 단계 값, 실행 기록"""
+
+    def __init__(self, graph, cache):
+        self.graph = graph
+        self.cache = cache
+        self._inputs = {}
+        self._values = {}
+        self._keys = {}
+        self.trace = []
+
+    def set_input(self, name, value, key=None):
+        """입력 값 지정 (key: 캐시 키로 쓸 값, 없으면 value 자체 - 데이터프레임 등은 지문을 넘김)"""
+        if name in self.graph.stages:
+            raise ValueError(f"단계 이름과 같은 입력: {name}")
+        if name in self._inputs:
+            # 같은 입력을 다시 지정하면 이번 실행에서 이미 계산한 단계 값/키는 버림
+            self._values.clear()
+            self._keys = {input_name: self._keys[input_name] for input_name in self._inputs}
+        self._inputs[name] = value
+        self._keys[name] = repr(value if key is None else key)
+
+    def _key(self, name):
+        if name in self._keys:
+            return self._keys[name]
+        if name not in self.graph.stages:
+            raise KeyError(f"입력이 지정되지 않은 이름: {name}")
+        stage = self.graph.stages[name]
+        parts = [name] + [self._key(dep) for dep in stage.deps]
+        key = hashlib.blake2b("\x1f".join(parts).encode(), digest_size=16).hexdigest()
+        self._keys[name] = key
+        return key
+
+    def key(self, name):
+        """단계/입력의 캐시 키"""
+        return self._key(name)
+
+    def __getitem__(self, name):
+        if name in self._inputs:
+            return self._inputs[name]
+        if name in self._values:
+            return self._values[name]
+
+        stage = self.graph.stages[name]
+        key = (name, self._key(name))
+        start = time.perf_counter()
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            status = HIT
+            ms = (time.perf_counter() - start) * 1000
+            record(f"단계 {name}", ms, cache=CACHE_HIT)
+        else:
+            args = [self[dep] for dep in stage.deps]
+            with span(f"단계 {name}") as frame:
+                start = time.perf_counter()
+                value = stage.func(*args)
+                ms = (time.perf_counter() - start) * 1000
+                frame["cache"] = CACHE_MISS
+            self.cache[key] = value
+            status = RUN
+        self.trace.append((name, status, ms))
+        self._values[name] = value
+        return value
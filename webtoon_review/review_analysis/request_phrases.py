@@ -0,0 +1,124 @@
+"""사용자 요청사항 추출
+
+요청 패턴은 `(.{2,20})(해주세요|...)` 처럼 "짧은 앞부분 + 요청 표지어" 형태라서
+그대로 re.findall 하면 모든 글자 위치에서 매칭을 시도한다.
+여기서는 표지어(고정 문자열)를 먼저 찾고, 그 앞 최대 길이만큼의 구간에서만 정규식을 돌린다.
+결과(찾는 문자열과 순서)는 re.findall 과 같다.
+"""
+import re
+from collections import Counter
+
+# ----------------------------
+# 요청 패턴 정의
+# ----------------------------
+REQUEST_PATTERNS = [
+    r"(.{2,20})(해주세요|해줘요|해주길|바랍니다|바래요|원합니다|원해요|했으면|으면 좋겠|면 좋겠|해달라|해줬으면)",
+    r"(제발|부탁).{0,20}(해주|바랍|원)",
+    r"(.{2,15})(기능|옵션).{0,5}(추가|넣어|만들어)",
+]
+
+# 패턴별 (표지어, 앞부분 최소/최대 길이, 표지어부터 매칭 끝까지 최대 길이)
+REQUEST_ANCHORS = [
+    (["해주세요", "해줘요", "해주길", "바랍니다", "바래요", "원합니다", "원해요", "했으면", "으면 좋겠", "면 좋겠", "해달라", "해줬으면"], 2, 20, 5),
+    (["제발", "부탁"], 0, 0, 24),
+    (["기능", "옵션"], 2, 15, 10),
+]
+
+TOP_REQUESTS = 30
+# 이보다 짧은 요청 문구는 버림
+MIN_REQUEST_LENGTH = 6
+
+# 중복 판정용 정규화: 공백/문장부호 차이만 있는 요청은 같은 요청으로 집계
+_SPACES = re.compile(r"\s+")
+_EDGE_PUNCT = re.compile(r"^[\s.,!?~ㅠㅜㅋㅎ^]+|[\s.,!?~ㅠㅜㅋㅎ^]+$")
+
+
+class AnchoredPattern:
+    """표지어 앞 구간에서만 시도하는 정규식 (re.findall 과 같은 결과)"""
+
+    def __init__(self, pattern, anchors, min_prefix, max_prefix, max_tail):
+        self.pattern = re.compile(pattern)
+        self.anchors = anchors
+        self._anchor_re = re.compile("|".join(re.escape(anchor) for anchor in anchors))
+        self.min_prefix = min_prefix
+        self.max_prefix = max_prefix
+        self.max_tail = max_tail
+
+    def might_match(self, text):
+        """표지어가 하나도 없으면 매칭될 수 없음 (빠른 사전 필터)"""
+        return any(anchor in text for anchor in self.anchors)
+
+    def finditer(self, text):
+        pos = 0
+        while True:
+            anchor = self._anchor_re.search(text, pos + self.min_prefix)
+            if anchor is None:
+                return
+            # 이 표지어를 쓸 수 있는 매칭 시작 위치: [anchor - max_prefix, anchor - min_prefix]
+            last_start = anchor.start() - self.min_prefix
+            window_start = max(pos, anchor.start() - self.max_prefix)
+            match = self.pattern.search(text, window_start, last_start + self.max_prefix + self.max_tail)
+            if match is not None and match.start() <= last_start:
+                yield match
+                pos = match.end()
+            else:
+                pos = last_start + 1
+
+    def findall(self, text):
+        """매칭 그룹을 이어붙인 문자열 목록"""
+        if not self.might_match(text):
+            return []
+        return ["".join(match.groups()) for match in self.finditer(text)]
+
+
+REQUEST_MATCHERS = [
+    AnchoredPattern(pattern, *anchor) for pattern, anchor in zip(REQUEST_PATTERNS, REQUEST_ANCHORS)
+]
+
+
+def normalize_request(request_text):
+    """중복 판정 키 (앞뒤 문장부호/이모티콘 제거, 공백 하나로)"""
+    return _SPACES.sub(" ", _EDGE_PUNCT.sub("", request_text))
+
+
+def count_requests(contents):
+    """요청 정규화 키별 횟수와 원문별 횟수 (counts, variants), 처음 나온 순서를 유지"""
+    counts = Counter()
+    variants = {}
+
+    for text in contents:
+        text = str(text)
+        for matcher in REQUEST_MATCHERS:
+            for request_text in matcher.findall(text):
+                if len(request_text) < MIN_REQUEST_LENGTH:
+                    continue
+                key = normalize_request(request_text)
+                counts[key] += 1
+                variants.setdefault(key, Counter())[request_text] += 1
+
+    return counts, variants
+
+
+def merge_request_counts(parts):
+    """리뷰 순서대로 나눈 조각들의 count_requests 결과 병합 (전체를 한 번에 센 것과 같은 순서)"""
+    counts = Counter()
+    variants = {}
+    for part_counts, part_variants in parts:
+        # 앞 조각의 키가 먼저 들어가므로 처음 나온 순서(동률 순위)가 직렬 실행과 같음
+        counts.update(part_counts)
+        for key, texts in part_variants.items():
+            variants.setdefault(key, Counter()).update(texts)
+    return counts, variants
+
+
+def top_requests(counts, variants, k=TOP_REQUESTS):
+    """가장 많이 나온 요청 k개 [(요청, 횟수), ...] (가장 많이 나온 원문으로 표시)"""
+    return [(variants[key].most_common(1)[0][0], count) for key, count in counts.most_common(k)]
+
+
+def extract_requests(contents):
+    """요청사항 빈도 상위 30개 [(요청, 횟수), ...]
+
+    정규화 키가 같은 요청은 합쳐서 세고, 가장 많이 나온 원문으로 표시
+    """
+    return top_requests(*count_requests(contents))
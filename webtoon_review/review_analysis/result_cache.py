@@ -0,0 +1,92 @@
+"""세션별 분석 결과 캐시 (LRU + 메모리 예산)
+
+키는 데이터셋 지문 + 분석 파라미터(모드, 단계 이름 등) 튜플로 만든다.
+앱 이름이나 리뷰 수처럼 다른 데이터셋끼리 겹칠 수 있는 값은 키로 쓰지 않는다.
+예산(max_bytes)을 넘으면 가장 오래 쓰지 않은 항목부터 버리고, 적중/미스/제거 횟수를 센다.
+
+크기는 값이 직접 들고 있는 메모리만 어림한다 (데이터프레임/배열은 실제 바이트,
+st.cache_resource 로 공유되는 토큰 저장소 같은 객체는 참조 크기만).
+"""
+import sys
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# 세션당 기본 예산
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def estimate_size(value):
+    """캐시 항목 크기 어림값 (바이트)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """LRU 결과 캐시 (dict 처럼 get / [] = 로 사용)"""
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """값 조회 (적중/미스 집계, 적중한 항목은 가장 최근으로)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def __setitem__(self, key, value):
+        size = estimate_size(value)
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key)[1]
+        if size > self.max_bytes:
+            # 예산보다 큰 항목은 저장하지 않음 (곧바로 제거된 것으로 집계)
+            self.evictions += 1
+            return
+        self._entries[key] = (value, size)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """적중/미스/제거 횟수와 사용량"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+        }
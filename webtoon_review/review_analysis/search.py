@@ -0,0 +1,113 @@
+"""리뷰 역색인 (키워드 검색용)
+
+한글 어절(연속된 한글 음절) → 리뷰 위치 목록(posting list) 역색인을 데이터셋당 1회 만들고,
+부분 어간 검색("광고" → "광고가", "동영상광고")은 어휘 목록의 글자 bigram 색인으로 후보 어절을 좁혀 처리한다.
+결과는 `contents.str.contains(query, regex=False, na=False)` 와 같은 행을 돌려준다.
+"""
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+HANGUL_RUN = re.compile(r"[가-힣]+")
+
+# 검색 결과 캐시 크기 (데이터셋별)
+QUERY_CACHE_SIZE = 256
+
+
+def _char_grams(term, n):
+    return {term[i:i + n] for i in range(len(term) - n + 1)}
+
+
+class ReviewIndex:
+    """리뷰 본문 역색인
+
+    contents: 리뷰 본문 배열 (데이터프레임 행 순서 = 리뷰 위치)
+    """
+
+    def __init__(self, contents):
+        self._contents = list(contents)
+        postings = {}
+        for row, text in enumerate(self._contents):
+            if not isinstance(text, str):
+                continue
+            for term in set(HANGUL_RUN.findall(text)):
+                postings.setdefault(term, []).append(row)
+
+        self.vocab = list(postings)
+        self._postings = [np.array(rows, dtype=np.int32) for rows in postings.values()]
+
+        # 부분 문자열 검색용: 글자 1-gram / 2-gram → 어휘 번호
+        unigrams = {}
+        bigrams = {}
+        for term_id, term in enumerate(self.vocab):
+            for gram in _char_grams(term, 1):
+                unigrams.setdefault(gram, []).append(term_id)
+            for gram in _char_grams(term, 2):
+                bigrams.setdefault(gram, []).append(term_id)
+        self._unigrams = {gram: np.array(ids, dtype=np.int32) for gram, ids in unigrams.items()}
+        self._bigrams = {gram: np.array(ids, dtype=np.int32) for gram, ids in bigrams.items()}
+
+        # 여러 세션이 같은 색인을 공유하므로 검색 캐시는 잠금으로 보호
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._contents)
+
+    def _candidate_terms(self, query):
+        """query 를 부분 문자열로 포함하는 어휘 번호"""
+        if len(query) == 1:
+            return self._unigrams.get(query, np.empty(0, dtype=np.int32))
+        grams = sorted(_char_grams(query, 2), key=lambda g: len(self._bigrams.get(g, ())))
+        candidates = self._bigrams.get(grams[0])
+        if candidates is None:
+            return np.empty(0, dtype=np.int32)
+        for gram in grams[1:]:
+            if len(candidates) == 0:
+                break
+            candidates = np.intersect1d(candidates, self._bigrams.get(gram, ()), assume_unique=True)
+        if len(query) > 2:
+            vocab = self.vocab
+            candidates = [term_id for term_id in candidates.tolist() if query in vocab[term_id]]
+        return candidates
+
+    def _scan(self, query, case):
+        """색인으로 풀 수 없는 검색어 (한글 외 문자 포함): 전체 본문 부분 문자열 검사"""
+        mask = pd.Series(self._contents, dtype=object).str.contains(query, case=case, regex=False, na=False)
+        return np.flatnonzero(mask.to_numpy(dtype=bool))
+
+    def search(self, query, case=True):
+        """query 를 포함하는 리뷰 위치 (오름차순 np.ndarray)"""
+        key = (query, case)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        if HANGUL_RUN.fullmatch(query):
+            # 한글 음절은 대소문자가 없으므로 case 와 무관
+            postings = [self._postings[term_id] for term_id in self._candidate_terms(query)]
+            if not postings:
+                rows = np.empty(0, dtype=np.int64)
+            elif len(postings) == 1:
+                rows = postings[0].astype(np.int64)
+            else:
+                rows = np.unique(np.concatenate(postings)).astype(np.int64)
+        else:
+            rows = self._scan(query, case)
+
+        rows.flags.writeable = False
+        with self._lock:
+            self._cache[key] = rows
+            if len(self._cache) > QUERY_CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return rows
+
+    def contains_mask(self, query, case=True):
+        """query 포함 여부 boolean 배열 (행 순서)"""
+        mask = np.zeros(len(self._contents), dtype=bool)
+        mask[self.search(query, case)] = True
+        return mask
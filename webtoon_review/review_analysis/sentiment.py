@@ -0,0 +1,74 @@
+"""컬럼 단위 감성 분석 엔진
+
+리뷰 본문/평점 배열을 받아 pos_score, neg_score, sentiment 배열을 한 번에 계산한다.
+평점 규칙(4점 이상, 2점 이하, 차이 ±2, 가중치 6 이상)은 배열 마스크로 적용한다.
+"""
+import numpy as np
+
+from .lexicon import BASIC_MATCHER, WEBTOON_MATCHER
+
+POSITIVE = "긍정"
+NEGATIVE = "부정"
+NEUTRAL = "중립"
+
+# 웹툰 모드에서 평점과 반대 감성으로 뒤집기 위한 최소 가중치
+STRONG_WEIGHT = 6
+# 3점 리뷰에서 긍정/부정으로 판단할 최소 가중치 차이
+DIFF_THRESHOLD = 2
+
+
+def lexicon_weights(contents, matcher):
+    """리뷰별 (긍정, 부정) 가중치 합 배열"""
+    weights = np.array(matcher.score_many(str(text) for text in contents), dtype=np.int64)
+    if weights.size == 0:
+        weights = weights.reshape(0, 2)
+    return weights[:, 0], weights[:, 1]
+
+
+def label_webtoon(scores, pos, neg):
+    """웹툰 특화 규칙: 평점 기반 판단 + 가중치 보정"""
+    scores = np.asarray(scores)
+    high = scores >= 4
+    low = scores <= 2
+    diff = pos - neg
+    conditions = [
+        high & (neg >= STRONG_WEIGHT) & (neg > pos),
+        high,
+        low & (pos >= STRONG_WEIGHT) & (pos > neg),
+        low,
+        diff >= DIFF_THRESHOLD,
+        diff <= -DIFF_THRESHOLD,
+    ]
+    choices = [NEGATIVE, POSITIVE, POSITIVE, NEGATIVE, POSITIVE, NEGATIVE]
+    return np.select(conditions, choices, default=NEUTRAL).astype(object)
+
+
+def label_basic(scores, pos, neg):
+    """기본 규칙: 평점 우선, 3점은 긍정/부정 단어 수 비교"""
+    scores = np.asarray(scores)
+    conditions = [scores >= 4, scores <= 2, pos > neg, neg > pos]
+    choices = [POSITIVE, NEGATIVE, POSITIVE, NEGATIVE]
+    return np.select(conditions, choices, default=NEUTRAL).astype(object)
+
+
+def score_sentiment(contents, scores, webtoon_mode=True):
+    """감성 분석 결과 컬럼 {"sentiment", "pos_score", "neg_score"}
+
+    기본 모드는 기존과 같이 pos_score/neg_score 를 0으로 둔다.
+    """
+    if webtoon_mode:
+        pos, neg = lexicon_weights(contents, WEBTOON_MATCHER)
+        sentiment = label_webtoon(scores, pos, neg)
+    else:
+        pos, neg = lexicon_weights(contents, BASIC_MATCHER)
+        sentiment = label_basic(scores, pos, neg)
+        pos = np.zeros_like(pos)
+        neg = np.zeros_like(neg)
+    return {"sentiment": sentiment, "pos_score": pos, "neg_score": neg}
+
+
+def apply_context_labels(context_labels, base_labels):
+    """문맥 감성이 있으면 그것을, 없으면(None) 기존 감성을 사용"""
+    context = np.asarray(context_labels, dtype=object)
+    base = np.asarray(base_labels, dtype=object)
+    return np.where(context == None, base, context)  # noqa: E711
@@ -0,0 +1,163 @@
+"""프로세스 전체에서 공유하는 리뷰/분석 결과 캐시 (TTL + 메모리 예산 + 단일 실행)
+
+여러 세션이 같은 앱을 같은 건수로 수집하거나 같은 데이터셋을 분석하면 한 번만 계산하고 결과를 나눠 쓴다.
+- 항목은 ttl 초가 지나면 만료되고, 예산(max_bytes)을 넘으면 가장 오래 쓰지 않은 항목부터 버린다.
+- get_or_compute: 같은 키를 계산 중인 다른 호출이 있으면 새로 계산하지 않고 그 결과를 기다린다.
+  계산 결과가 None 이면 저장하지 않고 기다리던 호출에도 None 을 돌려준다 (수집 실패 등).
+  계산 중 예외가 나면(세션 중단 포함) 기다리던 호출 중 하나가 이어서 계산한다.
+  기다리는 동안 wait_poll 초마다 on_wait 를 부르므로, 그 안의 st.* 호출에서 기다리던 세션도 중단/재실행될 수 있다.
+
+값은 여러 세션이 같은 객체를 공유하므로 꺼낸 쪽에서 수정하지 않는다 (데이터프레임은 assign 등으로 새로 만든다).
+"""
+import threading
+import time
+from collections import OrderedDict
+
+from .instrumentation import HIT, MISS
+from .result_cache import estimate_size
+
+# 다른 호출이 계산한 결과를 기다려 받은 경우
+WAITED = "waited"
+
+DEFAULT_TTL = 3600
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# 다른 호출의 계산을 기다릴 때 on_wait 를 부르는 간격 (초)
+WAIT_POLL_SECONDS = 0.5
+
+
+class _Flight:
+    """진행 중인 계산 1건 (끝나면 done 이 설정됨)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.completed = False
+        self.value = None
+
+
+class SharedCache:
+    """스레드 안전 TTL + LRU 캐시 (st.cache_resource 로 프로세스당 하나)"""
+
+    def __init__(self, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, key):
+        """잠금을 잡은 상태에서 조회 (만료된 항목은 제거), 없으면 None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] <= self._clock():
+            self._drop(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _drop(self, key):
+        self.bytes -= self._entries.pop(key)[1]
+
+    def _store(self, key, value):
+        size = estimate_size(value)
+        if key in self._entries:
+            self._drop(key)
+        if size > self.max_bytes:
+            self.evictions += 1
+            return
+        self._entries[key] = (value, size, self._clock() + self.ttl)
+        self.bytes += size
+        while self.bytes > self.max_bytes:
+            evicted_key = next(iter(self._entries))
+            self._drop(evicted_key)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[0]
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._store(key, value)
+
+    def get_or_compute(self, key, compute, on_wait=None, wait_poll=WAIT_POLL_SECONDS):
+        """(값, 상태) - 상태는 HIT / MISS(직접 계산) / WAITED(다른 호출의 계산을 기다림)
+
+        on_wait(waited_seconds): 다른 호출의 계산을 기다리는 동안 wait_poll 초마다 불림 (진행 표시, 중단 확인용)
+        """
+        while True:
+            with self._lock:
+                entry = self._lookup(key)
+                if entry is not None:
+                    self.hits += 1
+                    return entry[0], HIT
+                flight = self._flights.get(key)
+                if flight is None:
+                    flight = self._flights[key] = _Flight()
+                    leader = True
+                    self.misses += 1
+                else:
+                    leader = False
+                    self.waits += 1
+
+            if leader:
+                try:
+                    value = compute()
+                    with self._lock:
+                        if value is not None:
+                            self._store(key, value)
+                        flight.value = value
+                        flight.completed = True
+                    return value, MISS
+                finally:
+                    with self._lock:
+                        del self._flights[key]
+                    flight.done.set()
+
+            started = self._clock()
+            while True:
+                if on_wait is not None:
+                    on_wait(self._clock() - started)
+                if flight.done.wait(wait_poll):
+                    break
+            if flight.completed:
+                return flight.value, WAITED
+            # 계산하던 호출이 중단됨 → 다시 시도 (이번엔 직접 계산할 수도 있음)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        """적중/미스/대기/제거/만료 횟수와 사용량"""
+        with self._lock:
+            lookups = self.hits + self.misses + self.waits
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "waits": self.waits,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits + self.waits) / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "in_flight": len(self._flights),
+            }
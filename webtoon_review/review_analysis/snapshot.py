@@ -0,0 +1,128 @@
+"""분석 스냅샷 (default_analysis.json)
+
+번들 리뷰 CSV 로부터 대시보드 섹션(통계, 토픽, 요청사항, 키워드 조합 등)을 미리 계산해 JSON 으로 저장하고,
+앱은 데이터 지문이 일치할 때 이 섹션들을 그대로 읽어 첫 화면을 바로 그린다.
+
+빌드: python -m review_analysis.snapshot default_reviews.csv default_analysis.json  (webtoon_review 폴더에서)
+"""
+import argparse
+import json
+
+import pandas as pd
+
+from . import parallel
+from .dataset import read_reviews_csv
+from .fingerprint import FINGERPRINT_COLUMNS, dataset_fingerprint
+from .ngrams import complaint_ngrams, negative_rows, positive_bigrams, positive_rows, top_ngrams
+from .sentiment import NEGATIVE, NEUTRAL, POSITIVE
+from .topics import matrix_to_rows
+
+# 스냅샷 섹션은 감성 라벨에도 의존하므로 지문에 포함
+SNAPSHOT_COLUMNS = FINGERPRINT_COLUMNS + ["sentiment"]
+SNAPSHOT_VERSION = 1
+TOP_KEYWORDS = 50
+
+
+def snapshot_fingerprint(df):
+    return dataset_fingerprint(df, SNAPSHOT_COLUMNS)
+
+
+def build_snapshot(df, workers=1):
+    """데이터프레임 → 스냅샷 dict (JSON 직렬화 가능), workers: 대용량일 때 병렬 작업자 수"""
+    contents = df["content"].to_numpy()
+    scores = df["score"].to_numpy()
+    token_store = parallel.build_token_store(contents, workers)
+
+    complaint_bigrams, complaint_trigrams = complaint_ngrams(token_store, scores)
+    complaint_rows = negative_rows(scores)
+    praise_rows = positive_rows(scores)
+    sentiment_by_score = df.groupby(["score", "sentiment"], observed=True).size().unstack(fill_value=0)
+
+    return {
+        "version": SNAPSHOT_VERSION,
+        "fingerprint": snapshot_fingerprint(df),
+        "stats": {
+            "total": int(len(df)),
+            "avg_score": round(float(df["score"].mean()), 2),
+            "pos_count": int((df["sentiment"] == POSITIVE).sum()),
+            "neg_count": int((df["sentiment"] == NEGATIVE).sum()),
+            "neu_count": int((df["sentiment"] == NEUTRAL).sum()),
+            "score_dist": {str(score): int(count) for score, count in df["score"].value_counts().items()},
+        },
+        "topics": matrix_to_rows(parallel.topic_matrix(contents, workers)),
+        "keywords": top_ngrams(token_store, 1, k=TOP_KEYWORDS),
+        "bigrams": top_ngrams(token_store, 2),
+        "requests": parallel.extract_requests(contents, workers),
+        "complaints": {
+            "bigrams": complaint_bigrams,
+            "trigrams": complaint_trigrams,
+            "count": int(len(complaint_rows)),
+            "indices": complaint_rows.tolist(),
+        },
+        "positives": {
+            "bigrams": positive_bigrams(token_store, scores),
+            "count": int(len(praise_rows)),
+            "indices": praise_rows.tolist(),
+        },
+        "sentiment_by_score": {
+            str(score): {label: int(count) for label, count in row.items()}
+            for score, row in sentiment_by_score.iterrows()
+        },
+    }
+
+
+def _pairs(items):
+    return [tuple(item) for item in items]
+
+
+def load_snapshot(path):
+    """스냅샷 JSON 로드 (목록 항목은 분석 함수 반환 형태와 같은 튜플로 변환), 없거나 구버전이면 None"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    for section in ("keywords", "bigrams", "requests"):
+        snapshot[section] = _pairs(snapshot[section])
+    snapshot["complaints"]["bigrams"] = _pairs(snapshot["complaints"]["bigrams"])
+    snapshot["complaints"]["trigrams"] = _pairs(snapshot["complaints"]["trigrams"])
+    snapshot["positives"]["bigrams"] = _pairs(snapshot["positives"]["bigrams"])
+    return snapshot
+
+
+def snapshot_matches(snapshot, df):
+    """스냅샷이 이 데이터프레임으로 만들어졌는지 (지문 비교)"""
+    return snapshot is not None and "sentiment" in df.columns and snapshot["fingerprint"] == snapshot_fingerprint(df)
+
+
+def sentiment_by_score_frame(snapshot):
+    """스냅샷의 평점×감성 표 → groupby(["score", "sentiment"]).size().unstack() 과 같은 모양"""
+    table = pd.DataFrame.from_dict(snapshot["sentiment_by_score"], orient="index")
+    table.index = table.index.astype(int)
+    table.index.name = "score"
+    table.columns.name = "sentiment"
+    return table
+
+
+def write_snapshot(snapshot, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="리뷰 CSV 로부터 분석 스냅샷(JSON) 생성")
+    parser.add_argument("csv", help="리뷰 CSV (at, score, content[, sentiment])")
+    parser.add_argument("output", help="출력 JSON 경로")
+    args = parser.parse_args(argv)
+
+    snapshot = build_snapshot(read_reviews_csv(args.csv))
+    write_snapshot(snapshot, args.output)
+    print(f"{args.output}: {snapshot['stats']['total']}건, fingerprint {snapshot['fingerprint']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+"""로컬 리뷰 저장소 (SQLite, 앱별 증분 동기화)
+
+- 리뷰는 (app_id, 리뷰 키) 로 중복 제거: reviewId 가 있으면 그대로, 없으면 작성 시각 + 본문 해시
+- 감성(웹툰/기본 모드)과 토픽은 새로 들어온 행만 분석해 함께 저장하므로
+  다시 불러올 때는 분석 없이 바로 사용
+- 동기화는 저장된 가장 최근 `at` 이후 리뷰만 수집 서버에 요청 (since 파라미터)
+- `at` 은 시간대 없는 UTC 로 맞춰 저장/비교 (수집 서버가 오프셋 있는 ISO 시각을 보내도 같은 기준)
+"""
+import hashlib
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .collector import CHUNK_SIZE, iter_review_chunks
+from .dataset import compact_reviews
+from .sentiment import score_sentiment
+from .topics import TOPIC_PRIORITY, topic_matrix
+
+# 저장된 분석 결과의 버전 (감성 사전/토픽 키워드가 바뀌면 올려서 전체 재분석)
+ANALYSIS_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    app_id TEXT NOT NULL,
+    review_key TEXT NOT NULL,
+    review_id TEXT,
+    at TEXT,
+    score INTEGER,
+    content TEXT,
+    pos_score INTEGER,
+    neg_score INTEGER,
+    sentiment_webtoon TEXT,
+    sentiment_basic TEXT,
+    topic_mask INTEGER,
+    PRIMARY KEY (app_id, review_key)
+);
+CREATE INDEX IF NOT EXISTS reviews_app_at ON reviews (app_id, at);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+_COLUMNS = [
+    "app_id", "review_key", "review_id", "at", "score", "content",
+    "pos_score", "neg_score", "sentiment_webtoon", "sentiment_basic", "topic_mask",
+]
+# 저장하는 at 형식 (문자열 정렬 = 시각 정렬)
+AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 저장소에서 불러온 데이터프레임에만 있는 분석 컬럼
+STORED_COLUMNS = ["sentiment_webtoon", "sentiment_basic", "topic_mask"]
+
+
+def naive_utc(values):
+    """작성 시각 → 시간대 없는 UTC datetime Series (시간대가 없던 값은 그대로, 잘못된 값은 NaT)"""
+    return pd.to_datetime(values, utc=True, errors="coerce").dt.tz_localize(None)
+
+
+def _stored_at(values):
+    return naive_utc(values).dt.strftime(AT_FORMAT)
+
+
+def review_keys(df):
+    """중복 제거용 리뷰 키 (reviewId, 없으면 작성 시각 + 본문 해시)"""
+    at = _stored_at(df["at"]).fillna("")
+    hashed = [
+        f"{when}|{hashlib.blake2b(str(text).encode(), digest_size=8).hexdigest()}"
+        for when, text in zip(at, df["content"])
+    ]
+    if "reviewId" not in df.columns:
+        return pd.Series(hashed, index=df.index)
+    ids = df["reviewId"]
+    return ids.astype(str).where(ids.notna(), pd.Series(hashed, index=df.index))
+
+
+def topic_masks(contents):
+    """리뷰별 토픽 비트마스크 (TOPIC_PRIORITY 순서의 비트)"""
+    return topic_matrix(contents).astype(np.int64) @ (1 << np.arange(len(TOPIC_PRIORITY), dtype=np.int64))
+
+
+def topic_matrix_from_masks(masks):
+    """토픽 비트마스크 → topic_matrix 와 같은 리뷰 × 토픽 행렬"""
+    masks = np.asarray(masks, dtype=np.int64)
+    return (masks[:, None] >> np.arange(len(TOPIC_PRIORITY), dtype=np.int64)) & 1 == 1
+
+
+def stored_sentiment(df, webtoon_mode=True):
+    """저장된 분석 결과 → score_sentiment 와 같은 컬럼 (기본 모드는 점수 0)"""
+    if webtoon_mode:
+        return {
+            "sentiment": df["sentiment_webtoon"].to_numpy(dtype=object),
+            "pos_score": df["pos_score"].to_numpy(),
+            "neg_score": df["neg_score"].to_numpy(),
+        }
+    zeros = np.zeros(len(df), dtype=np.int64)
+    return {"sentiment": df["sentiment_basic"].to_numpy(dtype=object), "pos_score": zeros, "neg_score": zeros}
+
+
+def analyze_rows(contents, scores):
+    """새 행 분석: 두 모드 감성 + 토픽 마스크"""
+    webtoon = score_sentiment(contents, scores, webtoon_mode=True)
+    basic = score_sentiment(contents, scores, webtoon_mode=False)
+    return {
+        "pos_score": webtoon["pos_score"],
+        "neg_score": webtoon["neg_score"],
+        "sentiment_webtoon": webtoon["sentiment"],
+        "sentiment_basic": basic["sentiment"],
+        "topic_mask": topic_masks(contents),
+    }
+
+
+def _records(frame):
+    """DataFrame → sqlite3 에 넘길 튜플 목록 (numpy 스칼라는 파이썬 값으로)"""
+    return [
+        tuple(value.item() if isinstance(value, np.generic) else value for value in record)
+        for record in frame.itertuples(index=False, name=None)
+    ]
+
+
+class ReviewStore:
+    """앱별 리뷰 저장소 (SQLite 파일 1개)"""
+
+    def __init__(self, path):
+        self.path = path
+        # Streamlit 은 세션마다 다른 스레드에서 실행되므로 연결 공유 + 잠금
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+        if self._meta("analysis_version") != str(ANALYSIS_VERSION):
+            self.reanalyze()
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        self._conn.close()
+
+    def app_ids(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT DISTINCT app_id FROM reviews ORDER BY app_id")]
+
+    def count(self, app_id):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reviews WHERE app_id = ?", (app_id,)).fetchone()[0]
+
+    def latest_at(self, app_id):
+        """저장된 가장 최근 리뷰 시각 (없으면 None)"""
+        with self._lock:
+            value = self._conn.execute("SELECT MAX(at) FROM reviews WHERE app_id = ?", (app_id,)).fetchone()[0]
+        return pd.Timestamp(value) if value else None
+
+    def add(self, app_id, df):
+        """리뷰 추가 (이미 있는 리뷰는 건너뛰고 새 행만 분석), 새로 추가된 건수 반환"""
+        if df.empty:
+            return 0
+        df = df.assign(review_key=review_keys(df).to_numpy()).drop_duplicates("review_key")
+        with self._lock:
+            existing = {
+                row[0] for row in self._conn.execute("SELECT review_key FROM reviews WHERE app_id = ?", (app_id,))
+            }
+        new = df[~df["review_key"].isin(existing)]
+        if new.empty:
+            return 0
+
+        contents = new["content"].astype(str).to_numpy()
+        review_id = new["reviewId"].astype(str) if "reviewId" in new.columns else pd.Series(None, index=new.index)
+        # 평점이 없거나 숫자가 아닌 리뷰도 저장 (평점은 NULL)
+        scores = pd.to_numeric(new["score"], errors="coerce")
+        analysis = analyze_rows(contents, scores.to_numpy(dtype=np.float64))
+        rows = pd.DataFrame({
+            "app_id": app_id,
+            "review_key": new["review_key"].to_numpy(),
+            "review_id": review_id.to_numpy(dtype=object),
+            "at": _stored_at(new["at"]).to_numpy(dtype=object),
+            "score": scores.astype(object).where(scores.notna(), None).to_numpy(),
+            "content": contents,
+            **analysis,
+        })[_COLUMNS]
+        records = _records(rows)
+        placeholders = ", ".join("?" * len(_COLUMNS))
+        with self._lock, self._conn:
+            cursor = self._conn.executemany(
+                f"INSERT OR IGNORE INTO reviews ({', '.join(_COLUMNS)}) VALUES ({placeholders})", records
+            )
+        return cursor.rowcount
+
+    def load(self, app_id, limit=None):
+        """앱의 저장된 리뷰 (최신순, 분석 컬럼 포함, compact_reviews dtype)"""
+        query = (
+            "SELECT review_id AS reviewId, at, score, content, pos_score, neg_score, "
+            "sentiment_webtoon, sentiment_basic, topic_mask FROM reviews WHERE app_id = ? ORDER BY at DESC"
+        )
+        params = [app_id]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            df = pd.read_sql_query(query, self._conn, params=params)
+        df["at"] = pd.to_datetime(df["at"])
+        if df["reviewId"].isna().all():
+            df = df.drop(columns="reviewId")
+        return compact_reviews(df)
+
+    def reanalyze(self):
+        """저장된 모든 리뷰를 현재 사전/토픽 정의로 다시 분석"""
+        with self._lock:
+            df = pd.read_sql_query("SELECT rowid, content, score FROM reviews", self._conn)
+        if not df.empty:
+            analysis = analyze_rows(df["content"].astype(str).to_numpy(), df["score"].to_numpy())
+            updates = pd.DataFrame(analysis).assign(rowid=df["rowid"].to_numpy())
+            columns = list(analysis)
+            records = _records(updates[columns + ["rowid"]])
+            assignments = ", ".join(f"{column} = ?" for column in columns)
+            with self._lock, self._conn:
+                self._conn.executemany(f"UPDATE reviews SET {assignments} WHERE rowid = ?", records)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('analysis_version', ?)", (str(ANALYSIS_VERSION),)
+            )
+
+
+def sync_chunks(store, url, app_id, count, chunk_size=CHUNK_SIZE, session=None):
+    """저장된 최근 리뷰 이후만 요청하는 iter_review_chunks (서버가 since 를 무시해도 이전 리뷰는 걸러냄)"""
+    latest = store.latest_at(app_id)
+    params = {"since": latest.isoformat(sep=" ")} if latest is not None else None
+    for chunk in iter_review_chunks(url, app_id, count, chunk_size=chunk_size, session=session, params=params):
+        if latest is not None and not chunk.empty:
+            # 저장된 at 은 시간대 없는 UTC 이므로 같은 기준으로 비교, 작성 시각이 없는 리뷰는 걸러내지 않음 (중복은 add 에서 제거)
+            at = naive_utc(chunk["at"])
+            chunk = chunk[(at >= latest) | at.isna()]
+        yield chunk
+
+
+def sync_app(store, url, app_id, count, session=None):
+    """새 리뷰만 수집해 저장, 새로 추가된 건수 반환"""
+    added = 0
+    for chunk in sync_chunks(store, url, app_id, count, session=session):
+        added += store.add(app_id, chunk)
+    return added
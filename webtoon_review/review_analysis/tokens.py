@@ -0,0 +1,180 @@
+"""토크나이저 및 데이터셋 단위 토큰 저장소
+
+리뷰마다 정규식 토큰화를 한 번만 수행해 평탄한 토큰 배열 + 리뷰별 오프셋으로 보관하고,
+키워드/n-gram/동시출현 분석이 모두 이 저장소를 읽도록 한다.
+"""
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"[가-힣]{2,}")
+
+# ----------------------------
+# 불용어 정의
+# ----------------------------
+STOPWORDS = {
+    "너무", "정말", "진짜", "매우", "아주", "완전", "되게", "꽤", "좀", "약간", "살짝",
+    "그냥", "이거", "저거", "그것", "이것", "저것", "하는", "있는", "없는",
+    "해서", "하고", "해요", "합니다", "입니다", "있어요", "없어요", "같아요",
+    "이런", "저런", "그런", "어떤", "무슨", "왜", "어디", "언제", "어떻게",
+    "근데", "그래서", "하지만", "그러나", "그리고", "또한", "그래도",
+    "있어", "없어", "하면", "이용", "사용", "정도", "이상", "계속", "다시", "처음", "마지막",
+    "쿠키", "만화", "작품", "좋아", "읽고", "보고"
+}
+
+# n-gram 표시용 구분자
+NGRAM_SEPARATOR = " + "
+
+
+def simple_tokenizer(text):
+    tokens = TOKEN_PATTERN.findall(str(text))
+    tokens = [t for t in tokens if t not in STOPWORDS and len(t) >= 2]
+    return tokens
+
+
+def join_ngram(tokens):
+    return NGRAM_SEPARATOR.join(tokens)
+
+
+def extract_bigrams(text):
+    """키워드 조합 (바이그램) 추출"""
+    return ngrams_of(simple_tokenizer(text), 2)
+
+
+def extract_trigrams(text):
+    """키워드 조합 (트리그램 - 3단어) 추출"""
+    return ngrams_of(simple_tokenizer(text), 3)
+
+
+def ngrams_of(tokens, n):
+    """토큰 리스트의 연속 n-gram 문자열"""
+    return [join_ngram(tokens[i:i + n]) for i in range(len(tokens) - n + 1)]
+
+
+class TokenStore:
+    """데이터셋 전체 토큰 (리뷰당 1회 토큰화)
+
+    vocab: 토큰 문자열 목록, ids: 전체 토큰의 vocab 번호(평탄 배열),
+    offsets: i번째 리뷰 토큰은 ids[offsets[i]:offsets[i + 1]]
+    """
+
+    def __init__(self, vocab, ids, offsets):
+        self.vocab = vocab
+        self.ids = ids
+        self.offsets = offsets
+
+    @classmethod
+    def from_texts(cls, texts):
+        vocab = []
+        index = {}
+        ids = []
+        offsets = [0]
+        for text in texts:
+            for token in simple_tokenizer(text):
+                token_id = index.get(token)
+                if token_id is None:
+                    token_id = index[token] = len(vocab)
+                    vocab.append(token)
+                ids.append(token_id)
+            offsets.append(len(ids))
+        return cls(vocab, np.array(ids, dtype=np.int32), np.array(offsets, dtype=np.int64))
+
+    @classmethod
+    def concat(cls, stores):
+        """리뷰 순서대로 나눈 조각 저장소들을 이어붙임 (전체를 from_texts 한 것과 같은 vocab/ids)"""
+        vocab = []
+        index = {}
+        ids = []
+        offsets = [np.zeros(1, dtype=np.int64)]
+        total = 0
+        for store in stores:
+            # 조각 vocab 은 조각 안에서 처음 나온 순서이므로 앞 조각부터 합치면 전체에서 처음 나온 순서가 됨
+            mapping = np.empty(len(store.vocab), dtype=np.int32)
+            for local_id, token in enumerate(store.vocab):
+                token_id = index.get(token)
+                if token_id is None:
+                    token_id = index[token] = len(vocab)
+                    vocab.append(token)
+                mapping[local_id] = token_id
+            ids.append(mapping[store.ids])
+            offsets.append(store.offsets[1:] + total)
+            total += len(store.ids)
+        return cls(vocab, np.concatenate(ids) if ids else np.empty(0, dtype=np.int32), np.concatenate(offsets))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def _rows(self, rows):
+        return range(len(self)) if rows is None else rows
+
+    def review_ids(self, i):
+        """i번째 리뷰의 토큰 id 배열"""
+        return self.ids[self.offsets[i]:self.offsets[i + 1]]
+
+    def review_tokens(self, i):
+        """i번째 리뷰의 토큰 리스트 (simple_tokenizer 결과와 동일)"""
+        vocab = self.vocab
+        return [vocab[t] for t in self.review_ids(i).tolist()]
+
+    def iter_tokens(self, rows=None):
+        """리뷰별 토큰 리스트 (rows: 리뷰 위치 목록, None 이면 전체)"""
+        for i in self._rows(rows):
+            yield self.review_tokens(i)
+
+    def flat_tokens(self, rows=None):
+        """선택한 리뷰들의 토큰을 순서대로 이어붙인 리스트"""
+        tokens = []
+        for review_tokens in self.iter_tokens(rows):
+            tokens += review_tokens
+        return tokens
+
+    def subset(self, rows=None):
+        """선택한 리뷰 토큰만 이어붙인 (ids, offsets) - 저장소와 같은 형식"""
+        if rows is None:
+            return self.ids, self.offsets
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = self.offsets[rows + 1] - self.offsets[rows]
+        index_dtype = np.int32 if len(self.ids) < 2 ** 31 else np.int64
+        positions = np.repeat((self.offsets[rows] - np.cumsum(lengths) + lengths).astype(index_dtype), lengths)
+        positions += np.arange(len(positions), dtype=index_dtype)
+        return self.ids[positions], np.concatenate(([0], np.cumsum(lengths)))
+
+    def ngram_keys(self, n, rows=None):
+        """n-gram 을 int64 하나로 묶은 키 (토큰 id 를 어휘 크기 진법으로 자리 배치)
+
+        리뷰 경계를 넘는 위치는 복사 없이 -1 로 채워 둔다 (집계 시 제외)
+        """
+        base = max(len(self.vocab), 1)
+        if base ** n >= 2 ** 63:
+            raise OverflowError(f"어휘 {base:,}개로는 {n}-gram 을 int64 키로 만들 수 없음")
+        ids, offsets = self.subset(rows)
+        count = len(ids) - n + 1
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+
+        keys = ids[:count].astype(np.int64)
+        for offset in range(1, n):
+            keys *= base
+            keys += ids[offset:offset + count]
+        # 리뷰 끝 n-1 개 위치에서 시작하는 조합은 다음 리뷰로 넘어가므로 제외
+        ends = offsets[1:]
+        for back in range(1, n):
+            cut = ends - back
+            keys[cut[(cut >= 0) & (cut < count)]] = -1
+        return keys
+
+    def decode_ngram(self, key, n):
+        """ngram_keys 키 → n-gram 문자열"""
+        base = max(len(self.vocab), 1)
+        token_ids = []
+        for _ in range(n):
+            key, token_id = divmod(int(key), base)
+            token_ids.append(token_id)
+        return join_ngram([self.vocab[token_id] for token_id in reversed(token_ids)])
+
+    def ngrams(self, n, rows=None):
+        """선택한 리뷰들의 n-gram 문자열 (리뷰 경계를 넘지 않음)"""
+        grams = []
+        for review_tokens in self.iter_tokens(rows):
+            grams += ngrams_of(review_tokens, n)
+        return grams
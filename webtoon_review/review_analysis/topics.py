@@ -0,0 +1,64 @@
+"""토픽 분류 (복수 토픽 허용)
+
+토픽 키워드와 요청 표현을 하나의 사전 매칭기로 컴파일해 리뷰당 한 번만 훑고,
+결과는 리뷰 × 토픽 boolean 행렬로 돌려준다 (본문 문자열을 토픽별로 복사하지 않음).
+"""
+import numpy as np
+
+from .matcher import LexiconMatcher
+
+# ----------------------------
+# 토픽 키워드 정의
+# ----------------------------
+TOPIC_KEYWORDS = {
+    "📚 콘텐츠": ["작품", "연재", "완결", "스토리", "내용", "재미", "그림", "퀄리티", "신작", "추천", "작가", "회차", "출시", "보고싶", "읽고싶", "기다", "시즌", "에피소드", "캐릭터", "결말", "전작", "후속", "외전", "재밌", "재미있", "웹툰"],
+    "💰 결제/가격": ["결제", "돈", "유료", "무료", "가격", "비싸", "비용", "코인", "충전", "환불", "구매", "구독", "이용권", "할인", "캐시", "쿠키", "유료화", "과금", "유료가", "무료로", "무료면", "유료면", "돈내", "돈을"],
+    "📺 광고": ["광고", "배너", "팝업", "스킵", "건너뛰기", "동영상광고", "전면광고", "광고가", "광고없", "광고좀", "광고를"],
+    "🐛 버그/오류": ["버그", "오류", "에러", "렉걸", "튕김", "튕겨", "멈춤", "작동안", "느려", "로딩", "꺼짐", "강제종료", "crash", "팅김", "무한로딩", "앱꺼", "실행안", "멈춰", "다운됨"],
+    "📱 UI/UX": ["화면", "버튼", "디자인", "인터페이스", "메뉴", "레이아웃", "구성", "위치", "아이콘", "색상", "폰트", "글씨", "스크롤", "터치", "조작"],
+    "🔔 알림/편의": ["알림", "푸시", "북마크", "저장", "기록", "목록", "검색", "정렬", "필터", "공유", "다운로드", "오프라인"],
+}
+
+TOPIC_PRIORITY = ["📚 콘텐츠", "💰 결제/가격", "📺 광고", "🐛 버그/오류", "📱 UI/UX", "🔔 알림/편의"]
+
+# 요청 패턴 (이게 있으면 버그가 아님)
+BUG_TOPIC = "🐛 버그/오류"
+REQUEST_MARKERS = ["해주", "해줘", "싶어", "바람", "원해", "으면 좋", "면 좋겠", "제발", "부탁", "없으면", "있으면"]
+
+
+# 토픽 키워드 + 요청 표현 (마지막 라벨) 을 한 번에 매칭
+REQUEST_LABEL = "요청"
+TOPIC_MATCHER = LexiconMatcher({**{topic: TOPIC_KEYWORDS[topic] for topic in TOPIC_PRIORITY}, REQUEST_LABEL: REQUEST_MARKERS})
+
+
+def topic_matrix(contents):
+    """리뷰 × 토픽 boolean 행렬 (열 순서: TOPIC_PRIORITY)"""
+    hits = np.array(TOPIC_MATCHER.score_many(str(text) for text in contents), dtype=np.int32)
+    hits = hits.reshape(-1, len(TOPIC_MATCHER.labels)) > 0
+    matrix = hits[:, :len(TOPIC_PRIORITY)].copy()
+    # 버그/오류 토픽은 요청 표현이 있으면 제외
+    matrix[:, TOPIC_PRIORITY.index(BUG_TOPIC)] &= ~hits[:, -1]
+    return matrix
+
+
+def topic_counts(matrix):
+    """토픽별 리뷰 수 {토픽: 건수} (TOPIC_PRIORITY 순서)"""
+    return dict(zip(TOPIC_PRIORITY, matrix.sum(axis=0).tolist()))
+
+
+def matrix_to_rows(matrix):
+    """토픽 행렬 → {토픽: [리뷰 위치, ...]}"""
+    return {topic: np.flatnonzero(matrix[:, col]).tolist() for col, topic in enumerate(TOPIC_PRIORITY)}
+
+
+def rows_to_matrix(topic_rows, n_reviews):
+    """{토픽: [리뷰 위치, ...]} → 토픽 행렬"""
+    matrix = np.zeros((n_reviews, len(TOPIC_PRIORITY)), dtype=bool)
+    for col, topic in enumerate(TOPIC_PRIORITY):
+        matrix[topic_rows.get(topic, []), col] = True
+    return matrix
+
+
+def classify_topics(contents):
+    """토픽별 리뷰 위치 목록 {토픽: [리뷰 위치, ...]}"""
+    return matrix_to_rows(topic_matrix(contents))
@@ -0,0 +1,141 @@
+"""워드클라우드 이미지 (백그라운드 렌더링 + 디스크 캐시)
+
+- 키: 단어 빈도 지문 + 폰트 경로 + 크기 → 같은 키의 PNG 는 다른 세션/재시작 후에도 파일에서 바로 읽음
+- 원본 크기 이미지는 작업자 스레드에서 렌더링 (같은 키는 한 번만 요청), 화면은 먼저 작은 미리보기를 보여 줌
+- PNG 는 임시 파일에 쓴 뒤 이름을 바꿔 저장하므로 다른 프로세스가 반쯤 쓴 파일을 읽지 않음
+"""
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+WIDTH = 800
+HEIGHT = 400
+MAX_WORDS = 50
+# 미리보기 축소 비율 (레이아웃 비용은 면적에 비례하므로 1/4 크기면 수십 ms)
+PREVIEW_SCALE = 4
+# 디스크 캐시 파일 수 상한 (넘으면 오래된 파일부터 삭제)
+MAX_FILES = 512
+
+
+def frequency_fingerprint(word_freq):
+    """단어 빈도 지문 (단어 순서 무관)"""
+    payload = json.dumps(sorted((str(word), float(count)) for word, count in word_freq), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def render_png(word_freq, font_path, width=WIDTH, height=HEIGHT):
+    """워드클라우드 PNG 바이트 (렌더링 실패 시 None)"""
+    from wordcloud import WordCloud
+
+    try:
+        wc = WordCloud(
+            font_path=font_path,
+            width=width, height=height,
+            background_color="white",
+            colormap="viridis",
+            max_words=MAX_WORDS,
+        )
+        wc.generate_from_frequencies(dict(word_freq))
+        buffer = BytesIO()
+        wc.to_image().save(buffer, format="PNG")
+        return buffer.getvalue()
+    except Exception:
+        return None
+
+
+class WordCloudCache:
+    """워드클라우드 PNG 디스크 캐시 + 백그라운드 렌더러 (프로세스 전체에서 하나를 공유)"""
+
+    def __init__(self, directory, max_files=MAX_FILES, workers=1):
+        self.directory = directory
+        self.max_files = max_files
+        os.makedirs(directory, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="wordcloud")
+        self._pending = {}
+        # 렌더링에 실패한 키 (같은 빈도로 다시 요청하지 않음)
+        self._failed = set()
+        # 이미 끝난 Future 의 완료 콜백은 submit 안에서 바로 불리므로 재진입 가능한 잠금
+        self._lock = threading.RLock()
+
+    def key(self, word_freq, font_path, width=WIDTH, height=HEIGHT):
+        payload = f"{frequency_fingerprint(word_freq)}|{font_path or ''}|{width}x{height}"
+        return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.png")
+
+    def load(self, key):
+        """캐시된 PNG (없으면 None)"""
+        try:
+            with open(self._path(key), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store(self, key, png):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(png)
+            os.replace(tmp_path, self._path(key))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._prune()
+
+    def _prune(self):
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".png")]
+        except OSError:
+            return
+        if len(names) <= self.max_files:
+            return
+        paths = sorted((os.path.join(self.directory, name) for name in names), key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_files]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _render(self, key, word_freq, font_path, width, height):
+        png = self.load(key)
+        if png is None:
+            png = render_png(word_freq, font_path, width, height)
+            if png is None:
+                self._failed.add(key)
+            else:
+                self._store(key, png)
+        return png
+
+    def failed(self, key):
+        return key in self._failed
+
+    def render(self, word_freq, font_path, width=WIDTH, height=HEIGHT):
+        """캐시에 있으면 읽고, 없으면 지금 렌더링해 저장 (미리보기처럼 작은 이미지용)"""
+        word_freq = tuple(word_freq)
+        return self._render(self.key(word_freq, font_path, width, height), word_freq, font_path, width, height)
+
+    def preview(self, word_freq, font_path):
+        """저해상도 미리보기 PNG (원본의 1/PREVIEW_SCALE 크기)"""
+        return self.render(word_freq, font_path, WIDTH // PREVIEW_SCALE, HEIGHT // PREVIEW_SCALE)
+
+    def submit(self, word_freq, font_path, width=WIDTH, height=HEIGHT):
+        """백그라운드 렌더링 요청 → Future (결과: PNG 바이트 또는 None), 같은 키는 진행 중인 요청을 공유"""
+        word_freq = tuple(word_freq)
+        key = self.key(word_freq, font_path, width, height)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self._render, key, word_freq, font_path, width, height)
+                self._pending[key] = future
+                future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
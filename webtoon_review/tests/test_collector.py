@@ -0,0 +1,132 @@
+"""수집 API 클라이언트 테스트 (localhost 에 띄운 대역 HTTP 서버 사용)
+
+실행: python -m unittest discover tests  (webtoon_review 폴더에서)
+"""
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+from review_analysis.collector import CollectorError, iter_review_chunks
+
+REVIEWS = [
+    {"reviewId": f"r{i}", "at": f"2024-01-{i % 28 + 1:02d}T12:00:00", "score": i % 5 + 1, "content": f"리뷰 {i}"}
+    for i in range(250)
+]
+PAGE_SIZE = 80
+# 조각 사이 대기 타임아웃 (스트림 중간에 멈추는 서버는 이보다 오래 멈춤)
+READ_TIMEOUT = 0.5
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """app_id 로 응답 방식 선택: ndjson / paged / error(스트림 중간 오류 줄) / stall(스트림 중간에 멈춤)"""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, content_type, body=None):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if body is not None:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body is not None:
+            self.wfile.write(body)
+
+    def _write_line(self, record):
+        self.wfile.write((json.dumps(record, ensure_ascii=False) + "\n").encode())
+        self.wfile.flush()
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in parse_qs(urlparse(self.path).query).items()}
+        app_id = query["app_id"]
+        records = REVIEWS[:int(query["count"])]
+        self.server.requests.append(query)
+
+        if app_id == "paged":
+            cursor = int(query.get("cursor", 0))
+            body = {"success": True, "data": records[cursor:cursor + PAGE_SIZE]}
+            if cursor + PAGE_SIZE < len(records):
+                body["next_cursor"] = str(cursor + PAGE_SIZE)
+            self._send("application/json", json.dumps(body, ensure_ascii=False).encode())
+            return
+
+        self._send("application/x-ndjson; charset=utf-8")
+        for i, record in enumerate(records):
+            if app_id == "error" and i == 150:
+                self._write_line({"error": "앱을 찾을 수 없습니다"})
+                return
+            if app_id == "stall" and i == 150:
+                time.sleep(READ_TIMEOUT * 4)
+                return
+            self._write_line(record)
+
+
+class CollectorTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.requests = []
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+    def collect(self, app_id, count=len(REVIEWS), **kwargs):
+        return list(iter_review_chunks(self.url, app_id, count, timeout=(5, READ_TIMEOUT), **kwargs))
+
+    def test_ndjson_stream_in_chunks(self):
+        chunks = self.collect("ndjson")
+        self.assertEqual([len(chunk) for chunk in chunks], [100, 100, 50])
+        df = pd.concat(chunks, ignore_index=True)
+        self.assertEqual(df["reviewId"].tolist(), [record["reviewId"] for record in REVIEWS])
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(df["at"]))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_ndjson_stops_at_count(self):
+        chunks = self.collect("ndjson", count=120, chunk_size=50)
+        self.assertEqual([len(chunk) for chunk in chunks], [50, 50, 20])
+
+    def test_paged_json_follows_cursor(self):
+        chunks = self.collect("paged")
+        df = pd.concat(chunks, ignore_index=True)
+        self.assertEqual(df["reviewId"].tolist(), [record["reviewId"] for record in REVIEWS])
+        self.assertEqual([request.get("cursor") for request in self.server.requests], [None, "80", "160", "240"])
+
+    def test_since_is_sent_as_parameter(self):
+        self.collect("paged", count=10, params={"since": "2024-01-01 00:00:00"})
+        self.assertEqual(self.server.requests[0]["since"], "2024-01-01 00:00:00")
+
+    def test_error_line_mid_stream(self):
+        chunks = iter_review_chunks(self.url, "error", len(REVIEWS), timeout=(5, READ_TIMEOUT))
+        # 오류 줄 앞의 조각은 그대로 받음
+        self.assertEqual(len(next(chunks)), 100)
+        with self.assertRaises(CollectorError) as caught:
+            list(chunks)
+        self.assertIn("앱을 찾을 수 없습니다", str(caught.exception))
+        self.assertFalse(caught.exception.retryable)
+
+    def test_read_timeout_mid_stream(self):
+        chunks = iter_review_chunks(self.url, "stall", len(REVIEWS), timeout=(5, READ_TIMEOUT))
+        self.assertEqual(len(next(chunks)), 100)
+        with self.assertRaises(CollectorError) as caught:
+            list(chunks)
+        self.assertIn("시간 초과", str(caught.exception))
+        self.assertIn("100건", str(caught.exception))
+        self.assertTrue(caught.exception.retryable)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""키워드 문맥 감성 테스트 (기존 키워드별 정규식 판정과 같은지)"""
+import os
+import random
+import re
+import unittest
+
+import pandas as pd
+
+from review_analysis.context import (
+    APPEAR_MARKERS, BENEFIT_MARKERS, NEGATIVE_MARKERS, PLEA_MARKERS, POSITIVE_MARKERS, QUESTION_MARKERS,
+    REMOVE_MARKERS, context_rules,
+)
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(__file__)), "default_reviews.csv")
+KEYWORDS = ["광고", "결제", "쿠키", "작품", "업데이트", "ad", "AD", "앱"]
+
+
+def regex_context_sentiment(text, keyword):
+    """기존 구현 (app.py 의 키워드별 정규식, 키워드는 문자열 그대로 쓰도록 re.escape 만 추가)"""
+    keyword = re.escape(keyword)
+    negative_patterns = [
+        f"{keyword}.*?(빼|없애|제거|싫|별로|짜증|불편|안좋|최악|노잼|지루|답답|하차|그만)",
+        f"(빼|없애|제거|싫|별로|짜증|불편|안좋|최악|노잼|지루|답답|하차|그만).*?{keyword}",
+        f"{keyword}.*?(왜|뭐야|뭔|진짜|도대체).*?(있|나와|뜨|보여)",
+        f"(제발|부탁).*?{keyword}.*?(빼|없|제거|하지)",
+    ]
+    positive_patterns = [
+        f"{keyword}.*?(좋|최고|완벽|대박|굿|짱|사랑|감사|편리|유용|도움)",
+        f"(좋|최고|완벽|대박|굿|짱|사랑|감사|편리|유용|도움).*?{keyword}",
+        f"{keyword}.*?(있어서|덕분|편해|좋아)",
+    ]
+    text_lower = text.lower()
+    for pattern in negative_patterns:
+        if re.search(pattern, text_lower):
+            return "부정"
+    for pattern in positive_patterns:
+        if re.search(pattern, text_lower):
+            return "긍정"
+    return None
+
+
+def generated_texts(keyword, count=2000, seed=0):
+    """키워드와 표지어를 무작위 순서/줄바꿈으로 섞은 문장"""
+    rng = random.Random(seed)
+    pieces = (
+        [keyword] * 4 + list(NEGATIVE_MARKERS + QUESTION_MARKERS + APPEAR_MARKERS + PLEA_MARKERS + REMOVE_MARKERS)
+        + list(POSITIVE_MARKERS + BENEFIT_MARKERS) + ["웹툰", "그리고", " ", "\n", "AD", "Ad", "광"]
+    )
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 8))) for _ in range(count)]
+
+
+class ContextRulesTest(unittest.TestCase):
+    def assert_same_as_regex(self, texts, keyword):
+        rules = context_rules(keyword)
+        expected = [regex_context_sentiment(text, keyword) for text in texts]
+        self.assertEqual(rules.classify_many(texts), expected)
+        for text, label in zip(texts[:50], expected[:50]):
+            self.assertEqual(rules.classify(text), label, text)
+
+    def test_default_reviews(self):
+        texts = pd.read_csv(DEFAULT_CSV)["content"].astype(str).tolist()
+        for keyword in KEYWORDS:
+            with self.subTest(keyword=keyword):
+                self.assert_same_as_regex(texts, keyword)
+
+    def test_generated_marker_orders(self):
+        for seed, keyword in enumerate(KEYWORDS):
+            with self.subTest(keyword=keyword):
+                self.assert_same_as_regex(generated_texts(keyword, seed=seed), keyword)
+
+    def test_keyword_is_not_a_pattern(self):
+        rules = context_rules("(광고")
+        self.assertEqual(rules.classify("(광고 너무 별로"), "부정")
+        self.assertIsNone(rules.classify("광고 너무 별로"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""평점 × 감성 패싯 비트맵 테스트 (pandas 필터/집계와 같은지)"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from review_analysis.facets import Facets
+
+LABELS = np.array(["긍정", "부정", "중립"], dtype=object)
+
+
+def reviews(n_rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "score": rng.integers(1, 6, n_rows),
+        "sentiment": LABELS[rng.integers(0, 3, n_rows)],
+    })
+
+
+class FacetsTest(unittest.TestCase):
+    # 8의 배수가 아닌 행 수 (마지막 바이트의 남는 비트) 포함
+    SIZES = [0, 1, 7, 8, 9, 13, 64, 1001]
+
+    def test_mask_matches_pandas_filter(self):
+        filters = [
+            (None, None), ([5], None), (None, ["부정"]), ([1, 2], ["부정", "중립"]),
+            ([4, 5], ["긍정"]), ([], None), ([3], []), ([9], ["없는 라벨"]),
+        ]
+        for n_rows in self.SIZES:
+            df = reviews(n_rows, seed=n_rows)
+            facets = Facets(df["score"], df["sentiment"])
+            for scores, sentiments in filters:
+                with self.subTest(n_rows=n_rows, scores=scores, sentiments=sentiments):
+                    expected = np.ones(n_rows, dtype=bool)
+                    if scores is not None:
+                        expected &= df["score"].isin(scores).to_numpy()
+                    if sentiments is not None:
+                        expected &= df["sentiment"].isin(sentiments).to_numpy()
+                    bitmap = facets.mask(scores, sentiments)
+                    np.testing.assert_array_equal(facets.bool_mask(bitmap), expected)
+                    np.testing.assert_array_equal(facets.rows(bitmap), np.flatnonzero(expected))
+                    # 패딩 비트는 세지 않음
+                    self.assertEqual(facets.count(bitmap), int(expected.sum()))
+
+    def test_counts_match_value_counts(self):
+        for n_rows in self.SIZES[1:]:
+            df = reviews(n_rows, seed=n_rows)
+            facets = Facets(df["score"], df["sentiment"])
+            with self.subTest(n_rows=n_rows):
+                pd.testing.assert_series_equal(
+                    facets.score_counts(), df["score"].value_counts().sort_index(), check_names=False,
+                )
+                self.assertEqual(facets.sentiment_counts().to_dict(), df["sentiment"].value_counts().to_dict())
+                expected = df.groupby(["score", "sentiment"], observed=True).size().unstack(fill_value=0)
+                np.testing.assert_array_equal(facets.crosstab().to_numpy(), expected.to_numpy())
+                self.assertEqual(list(facets.crosstab().index), list(expected.index))
+                self.assertEqual(list(facets.crosstab().columns), list(expected.columns))
+
+    def test_unused_values_are_dropped(self):
+        df = pd.DataFrame({"score": [5, 5, 1], "sentiment": ["긍정", "긍정", "긍정"]})
+        facets = Facets(df["score"], pd.Categorical(df["sentiment"], categories=list(LABELS)))
+        self.assertEqual(list(facets.score_counts().index), [1, 5])
+        self.assertEqual(list(facets.crosstab().columns), ["긍정"])
+        self.assertEqual(facets.count(facets.mask(None, ["부정"])), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+"""데이터셋 지문 테스트"""
+import unittest
+
+import pandas as pd
+
+from review_analysis.fingerprint import dataset_fingerprint
+
+
+def _reviews(at):
+    return pd.DataFrame({"at": at, "score": [5, 1, 3], "content": ["재밌어요", "광고 너무 많아요", "그냥 그래요"]})
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_same_reviews_from_strings_and_datetimes(self):
+        at = ["2024-01-01 12:00:00", "2024-01-02 08:30:00", None]
+        self.assertEqual(dataset_fingerprint(_reviews(at)), dataset_fingerprint(_reviews(pd.to_datetime(at))))
+
+    def test_tz_aware_at(self):
+        # 수집 서버가 오프셋 있는 ISO 시각을 보내면 at 이 시간대 있는 dtype 이 됨
+        aware = pd.to_datetime(["2024-01-01T21:00:00+09:00", "2024-01-02T17:30:00+09:00", None], errors="coerce")
+        naive = pd.to_datetime(["2024-01-01 12:00:00", "2024-01-02 08:30:00", None])
+        self.assertEqual(dataset_fingerprint(_reviews(aware)), dataset_fingerprint(_reviews(naive)))
+
+    def test_content_change_changes_fingerprint(self):
+        at = pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-03"])
+        changed = _reviews(at).assign(content=["재밌어요", "광고 너무 많아요", "최고"])
+        self.assertNotEqual(dataset_fingerprint(_reviews(at)), dataset_fingerprint(changed))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""리뷰 목록 페이지 나누기 테스트"""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from review_analysis import paging
+
+
+class PageTest(unittest.TestCase):
+    def test_page_count(self):
+        self.assertEqual(paging.page_count(0), 1)
+        self.assertEqual(paging.page_count(1), 1)
+        self.assertEqual(paging.page_count(50), 1)
+        self.assertEqual(paging.page_count(51), 2)
+        self.assertEqual(paging.page_count(7, page_size=3), 3)
+
+    def test_pages_cover_rows_once(self):
+        rows = np.arange(10, 133)
+        pages = [paging.page_rows(rows, page, 50) for page in range(1, paging.page_count(len(rows), 50) + 1)]
+        self.assertEqual([len(page) for page in pages], [50, 50, 23])
+        np.testing.assert_array_equal(np.concatenate(pages), rows)
+        self.assertEqual(len(paging.page_rows(rows, 4, 50)), 0)
+
+    def test_format_page_only_visible_rows(self):
+        df = pd.DataFrame({"at": pd.to_datetime(["2024-01-01", "2024-01-02", None]), "score": [1, 2, 3]})
+        page = paging.format_page(df, np.array([2, 0]), {"at": "날짜", "score": "평점"})
+        self.assertEqual(list(page.columns), ["날짜", "평점"])
+        self.assertEqual(page["평점"].tolist(), [3, 1])
+        self.assertEqual(page["날짜"].iloc[1], "2024-01-01")
+        self.assertTrue(pd.isna(page["날짜"].iloc[0]))
+
+
+class SortTest(unittest.TestCase):
+    AT = ["2024-01-02T00:00:00Z", None, "2024-01-01T03:00:00Z", "2024-01-02T00:00:00Z", None, "2024-01-01T00:00:00Z"]
+
+    def reviews(self, tz_aware):
+        at = pd.to_datetime(self.AT, errors="coerce")
+        if not tz_aware:
+            at = at.tz_localize(None)
+        return pd.DataFrame({"at": at, "score": [3, 5, 3, 1, 5, 3]})
+
+    def test_date_sorts_are_stable_and_keep_nat_last(self):
+        for tz_aware in (True, False):
+            df = self.reviews(tz_aware)
+            rows = np.arange(len(df))
+            with self.subTest(tz_aware=tz_aware):
+                # 같은 시각(0, 3)과 NaT(1, 4)는 원래 순서 유지
+                np.testing.assert_array_equal(paging.sorted_rows(df, rows, "최신순"), [0, 3, 2, 5, 1, 4])
+                np.testing.assert_array_equal(paging.sorted_rows(df, rows, "오래된순"), [5, 2, 0, 3, 1, 4])
+
+    def test_tz_aware_order_uses_utc(self):
+        # 서울 시각으로 표시된 값이어도 순서는 UTC 기준
+        at = pd.to_datetime(["2024-01-01T01:00:00Z", "2023-12-31T17:00:00Z", "2024-01-01T00:30:00Z"]).tz_convert("Asia/Seoul")
+        df = pd.DataFrame({"at": at})
+        np.testing.assert_array_equal(paging.sorted_rows(df, np.arange(3), "오래된순"), [1, 2, 0])
+
+    def test_score_sorts_are_stable(self):
+        df = self.reviews(False)
+        rows = np.array([5, 4, 3, 2, 1, 0])
+        np.testing.assert_array_equal(paging.sorted_rows(df, rows, "평점 높은순"), [4, 1, 5, 2, 0, 3])
+        np.testing.assert_array_equal(paging.sorted_rows(df, rows, "평점 낮은순"), [3, 5, 2, 0, 4, 1])
+        np.testing.assert_array_equal(paging.sorted_rows(df, rows, "기본 순서"), rows)
+
+    def test_sorted_subset_pages(self):
+        df = self.reviews(True)
+        rows = paging.sorted_rows(df, np.array([0, 1, 2, 5]), "최신순")
+        self.assertEqual([paging.page_rows(rows, page, 3).tolist() for page in (1, 2)], [[0, 2, 5], [1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
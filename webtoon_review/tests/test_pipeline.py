@@ -0,0 +1,115 @@
+"""분석 단계 그래프 테스트 (지연 계산, 의존 단계 캐시 재사용)"""
+import unittest
+
+from review_analysis.pipeline import HIT, RUN, StageGraph
+
+
+def counting_graph():
+    """단계별 호출 횟수를 세는 그래프: a ← b ← c, a ← d"""
+    calls = {"a": 0, "b": 0, "c": 0, "d": 0}
+    graph = StageGraph()
+
+    @graph.stage("x", name="a")
+    def a(x):
+        calls["a"] += 1
+        return x * 2
+
+    @graph.stage("a", "y", name="b")
+    def b(a_value, y):
+        calls["b"] += 1
+        return a_value + y
+
+    @graph.stage("b", name="c")
+    def c(b_value):
+        calls["c"] += 1
+        return b_value * 10
+
+    @graph.stage("a", name="d")
+    def d(a_value):
+        calls["d"] += 1
+        return -a_value
+
+    return graph, calls
+
+
+def new_run(graph, cache, x=1, y=2):
+    run = graph.run(cache)
+    run.set_input("x", x)
+    run.set_input("y", y)
+    return run
+
+
+class StageGraphTest(unittest.TestCase):
+    def test_only_requested_stages_run(self):
+        graph, calls = counting_graph()
+        run = new_run(graph, {})
+        self.assertEqual(run["b"], 4)
+        # c, d 는 꺼내지 않았으므로 실행되지 않음
+        self.assertEqual(calls, {"a": 1, "b": 1, "c": 0, "d": 0})
+        self.assertEqual([(name, status) for name, status, _ in run.trace], [("a", RUN), ("b", RUN)])
+
+    def test_shared_dependency_computed_once_per_run(self):
+        graph, calls = counting_graph()
+        run = new_run(graph, {})
+        self.assertEqual(run["c"], 40)
+        self.assertEqual(run["d"], -2)
+        self.assertEqual(run["c"], 40)
+        self.assertEqual(calls["a"], 1)
+        self.assertEqual(calls["c"], 1)
+
+    def test_cache_reused_across_runs(self):
+        graph, calls = counting_graph()
+        cache = {}
+        new_run(graph, cache)["c"]
+        run = new_run(graph, cache)
+        self.assertEqual(run["c"], 40)
+        self.assertEqual(calls, {"a": 1, "b": 1, "c": 1, "d": 0})
+        # 캐시 적중한 단계의 의존 단계는 꺼내지도 않음
+        self.assertEqual([(name, status) for name, status, _ in run.trace], [("c", HIT)])
+
+    def test_changed_input_reruns_only_dependents(self):
+        graph, calls = counting_graph()
+        cache = {}
+        run = new_run(graph, cache)
+        run["c"], run["d"]
+        run = new_run(graph, cache, y=3)
+        self.assertEqual(run["c"], 50)
+        self.assertEqual(run["d"], -2)
+        # y 에 의존하는 b, c 만 다시 계산
+        self.assertEqual(calls, {"a": 1, "b": 2, "c": 2, "d": 1})
+
+    def test_set_input_again_drops_values_of_this_run(self):
+        graph, calls = counting_graph()
+        run = new_run(graph, {})
+        self.assertEqual(run["b"], 4)
+        run.set_input("x", 5)
+        self.assertEqual(run["b"], 12)
+        self.assertEqual(calls["a"], 2)
+
+    def test_key_uses_given_key_not_value(self):
+        graph, calls = counting_graph()
+        cache = {}
+        run = graph.run(cache)
+        run.set_input("x", 1, key="dataset")
+        run.set_input("y", 2)
+        run["a"]
+        run = graph.run(cache)
+        run.set_input("x", 100, key="dataset")
+        run.set_input("y", 2)
+        # 같은 키 → 값이 달라도 캐시된 결과
+        self.assertEqual(run["a"], 2)
+        self.assertEqual(calls["a"], 1)
+
+    def test_registration_errors(self):
+        graph, _ = counting_graph()
+        with self.assertRaises(ValueError):
+            graph.stage("x", name="a")(lambda x: x)
+        run = graph.run({})
+        with self.assertRaises(ValueError):
+            run.set_input("a", 1)
+        with self.assertRaises(KeyError):
+            run["a"]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""요청사항 추출 테스트 (기존 re.findall 반복 구현과 같은 결과인지)"""
+import os
+import random
+import re
+import unittest
+from collections import Counter
+
+import pandas as pd
+
+from review_analysis.request_phrases import (
+    REQUEST_ANCHORS, REQUEST_MATCHERS, REQUEST_PATTERNS, count_requests, extract_requests, merge_request_counts,
+    top_requests,
+)
+
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(__file__)), "default_reviews.csv")
+
+FIXTURE = [
+    "광고 좀 줄여주세요 해주세요!! 제발 부탁드려요 해주세요",
+    "다크모드 기능 추가 해주세요ㅠㅠ",
+    "다크모드  기능 추가 해주세요",
+    "제발 광고 빼주세요 바랍니다",
+    "쿠키 가격 좀 내려주면 좋겠어요",
+    "정주행 옵션 하나만 넣어주세요~ 정말 원합니다",
+    "그냥 재밌어요",
+    "",
+]
+
+
+def findall_requests(text):
+    """기존 구현: 패턴마다 re.findall, 그룹은 이어붙이고 6자 이상만"""
+    requests = []
+    for pattern in REQUEST_PATTERNS:
+        for match in re.findall(pattern, str(text)):
+            request_text = "".join(match) if isinstance(match, tuple) else match
+            if len(request_text) > 5:
+                requests.append(request_text)
+    return requests
+
+
+def anchored_requests(text):
+    requests = []
+    for matcher in REQUEST_MATCHERS:
+        requests += [request_text for request_text in matcher.findall(str(text)) if len(request_text) > 5]
+    return requests
+
+
+def generated_texts(count=3000, seed=0):
+    """요청 표지어와 짧은 문구를 무작위로 이어붙인 문장 (표지어가 겹치거나 줄바꿈이 낀 경우 포함)"""
+    rng = random.Random(seed)
+    pieces = [anchor for anchors, *_ in REQUEST_ANCHORS for anchor in anchors]
+    pieces += ["광고", "다크모드", "쿠키 ", "좀 ", "ㅠㅠ", "!", "\n", " ", "추가", "넣어", "만들어", "원", "바랍", "해주"]
+    return ["".join(rng.choice(pieces) for _ in range(rng.randint(1, 12))) for _ in range(count)]
+
+
+class RequestPhrasesTest(unittest.TestCase):
+    def test_matches_findall_on_default_reviews(self):
+        for text in pd.read_csv(DEFAULT_CSV)["content"].astype(str):
+            self.assertEqual(anchored_requests(text), findall_requests(text), text)
+
+    def test_matches_findall_on_generated_texts(self):
+        for text in FIXTURE + generated_texts():
+            self.assertEqual(anchored_requests(text), findall_requests(text), text)
+
+    def test_default_top_requests_unchanged(self):
+        contents = pd.read_csv(DEFAULT_CSV)["content"].astype(str).tolist()
+        expected = Counter(request for text in contents for request in findall_requests(text)).most_common(30)
+        self.assertEqual(extract_requests(contents), expected)
+
+    def test_near_duplicates_are_merged(self):
+        requests = dict(extract_requests(FIXTURE))
+        # 공백/문장부호만 다른 두 요청은 한 번에 세고, 더 많이 나온(같으면 먼저 나온) 원문으로 표시
+        self.assertEqual(requests["다크모드 기능 추가 해주세요"], 2)
+        self.assertNotIn("다크모드  기능 추가 해주세요", requests)
+
+    def test_merge_matches_single_pass(self):
+        texts = FIXTURE + generated_texts(500, seed=1)
+        parts = [count_requests(texts[start:start + 97]) for start in range(0, len(texts), 97)]
+        self.assertEqual(top_requests(*merge_request_counts(parts)), extract_requests(texts))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""세션별 결과 캐시 테스트 (LRU 제거 순서, 메모리 예산)"""
+import unittest
+
+import numpy as np
+
+from review_analysis.result_cache import ResultCache, estimate_size
+
+
+def block(n_bytes):
+    return np.zeros(n_bytes, dtype=np.uint8)
+
+
+class ResultCacheTest(unittest.TestCase):
+    def test_evicts_least_recently_used_first(self):
+        cache = ResultCache(max_bytes=300)
+        cache["a"] = block(100)
+        cache["b"] = block(100)
+        cache["c"] = block(100)
+        # a 를 조회해 가장 최근으로 → 다음 제거 대상은 b
+        self.assertIsNotNone(cache.get("a"))
+        cache["d"] = block(100)
+        self.assertNotIn("b", cache)
+        self.assertEqual([key in cache for key in "acd"], [True, True, True])
+        cache["e"] = block(100)
+        self.assertNotIn("c", cache)
+        self.assertEqual(cache.stats()["evictions"], 2)
+        self.assertEqual(cache.bytes, 300)
+
+    def test_large_entry_evicts_several(self):
+        cache = ResultCache(max_bytes=300)
+        for key in "abc":
+            cache[key] = block(100)
+        cache["big"] = block(250)
+        self.assertEqual(len(cache), 1)
+        self.assertIn("big", cache)
+        self.assertEqual(cache.stats()["evictions"], 3)
+        self.assertEqual(cache.bytes, 250)
+
+    def test_entry_over_budget_not_stored(self):
+        cache = ResultCache(max_bytes=100)
+        cache["a"] = block(50)
+        cache["huge"] = block(101)
+        self.assertNotIn("huge", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_overwrite_updates_size_and_recency(self):
+        cache = ResultCache(max_bytes=300)
+        cache["a"] = block(100)
+        cache["b"] = block(100)
+        cache["a"] = block(150)
+        self.assertEqual(cache.bytes, 250)
+        # 덮어쓴 a 가 가장 최근 → b 가 먼저 제거됨
+        cache["c"] = block(100)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(cache.bytes, 250)
+
+    def test_hit_miss_counts(self):
+        cache = ResultCache()
+        sentinel = object()
+        self.assertIs(cache.get("a", sentinel), sentinel)
+        cache["a"] = 1
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("a"), 1)
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+        cache.clear()
+        self.assertEqual((len(cache), cache.bytes), (0, 0))
+
+    def test_estimate_size_of_containers(self):
+        array = block(1000)
+        self.assertEqual(estimate_size(array), 1000)
+        self.assertGreater(estimate_size([array, array]), 2000)
+        self.assertGreater(estimate_size({"k": array}), 1000)
+
+
+if __name__ == "__main__":
+    unittest.main()
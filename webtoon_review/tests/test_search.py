@@ -0,0 +1,62 @@
+"""리뷰 역색인 테스트 (str.contains 전체 검사와 같은 결과인지)"""
+import os
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from review_analysis.search import ReviewIndex
+
+CONTENTS = [
+    "광고가 너무 많아요",
+    "동영상광고 때문에 못 보겠어요 ㅋㅋ",
+    "광고 없이 보고 싶어요. AD free 결제 있나요?",
+    "재밌어요",
+    "ad가 너무 길어요",
+    None,
+    float("nan"),
+    "",
+    "고가 정책은 별로",
+    "광고광고광고",
+    "결제 오류 😡 환불해주세요",
+]
+QUERIES = ["광고", "광", "고", "고가", "동영상광고", "광고광", "광고 너무", "ㅋ", "ad", "AD", "😡", "", "없는말", "결"]
+DEFAULT_CSV = os.path.join(os.path.dirname(os.path.dirname(__file__)), "default_reviews.csv")
+
+
+def scan(contents, query, case=True):
+    mask = contents.str.contains(query, case=case, regex=False, na=False)
+    return np.flatnonzero(mask.to_numpy(dtype=bool))
+
+
+class ReviewIndexTest(unittest.TestCase):
+    def assert_same_as_scan(self, contents, queries):
+        index = ReviewIndex(contents)
+        for query in queries:
+            for case in (True, False):
+                with self.subTest(query=query, case=case):
+                    np.testing.assert_array_equal(index.search(query, case=case), scan(contents, query, case))
+                    np.testing.assert_array_equal(
+                        np.flatnonzero(index.contains_mask(query, case=case)), scan(contents, query, case)
+                    )
+
+    def test_fixture_matches_str_contains(self):
+        self.assert_same_as_scan(pd.Series(CONTENTS, dtype=object), QUERIES)
+
+    def test_default_reviews_match_str_contains(self):
+        contents = pd.read_csv(DEFAULT_CSV)["content"]
+        # 기본 데이터에서 나온 1/2/3글자 검색어 + 고정 검색어
+        words = [word for text in contents.dropna().head(50) for word in str(text).split()]
+        queries = QUERIES + sorted({word[:n] for word in words for n in (1, 2, 3) if word[:n]})
+        self.assert_same_as_scan(contents, queries)
+
+    def test_cached_result_is_read_only(self):
+        index = ReviewIndex(CONTENTS)
+        rows = index.search("광고")
+        self.assertIs(index.search("광고"), rows)
+        with self.assertRaises(ValueError):
+            rows[0] = 1
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,188 @@
+"""프로세스 공유 캐시 테스트 (TTL 만료, LRU 제거, 동시 호출 단일 실행)"""
+import threading
+import unittest
+
+import numpy as np
+
+from review_analysis.instrumentation import HIT, MISS
+from review_analysis.shared_cache import WAITED, SharedCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def block(n_bytes):
+    return np.zeros(n_bytes, dtype=np.uint8)
+
+
+class SharedCacheTtlTest(unittest.TestCase):
+    def test_entry_expires_after_ttl(self):
+        clock = FakeClock()
+        cache = SharedCache(ttl=10, clock=clock)
+        cache["a"] = 1
+        clock.now = 9.9
+        self.assertEqual(cache.get("a"), 1)
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        stats = cache.stats()
+        self.assertEqual((stats["expirations"], stats["entries"], stats["bytes"]), (1, 0, 0))
+
+    def test_expired_entry_recomputed(self):
+        clock = FakeClock()
+        cache = SharedCache(ttl=10, clock=clock)
+        self.assertEqual(cache.get_or_compute("a", lambda: "v1"), ("v1", MISS))
+        self.assertEqual(cache.get_or_compute("a", lambda: "v2"), ("v1", HIT))
+        clock.now = 11
+        self.assertEqual(cache.get_or_compute("a", lambda: "v2"), ("v2", MISS))
+
+    def test_ttl_counts_from_store_time(self):
+        clock = FakeClock()
+        cache = SharedCache(ttl=10, clock=clock)
+        cache["a"] = 1
+        clock.now = 5
+        cache["a"] = 2
+        clock.now = 12
+        self.assertEqual(cache.get("a"), 2)
+
+    def test_lru_eviction_by_bytes(self):
+        cache = SharedCache(max_bytes=300, clock=FakeClock())
+        for key in "abc":
+            cache[key] = block(100)
+        cache.get("a")
+        cache["d"] = block(100)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_none_result_not_stored(self):
+        cache = SharedCache(clock=FakeClock())
+        self.assertEqual(cache.get_or_compute("a", lambda: None), (None, MISS))
+        self.assertEqual(cache.get_or_compute("a", lambda: 1), (1, MISS))
+
+
+class SharedCacheSingleFlightTest(unittest.TestCase):
+    N_WAITERS = 8
+
+    def _run_concurrently(self, cache, compute, n_callers):
+        """n_callers 개 스레드가 같은 키로 get_or_compute → [(값, 상태)]"""
+        results = [None] * n_callers
+
+        def call(i):
+            results[i] = cache.get_or_compute("key", compute, wait_poll=0.01)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(n_callers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+            self.assertFalse(thread.is_alive())
+        return results
+
+    def test_concurrent_callers_share_one_computation(self):
+        cache = SharedCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+        value = object()
+
+        def compute():
+            calls.append(1)
+            started.set()
+            # 다른 호출들이 모두 대기에 들어갈 때까지 계산을 붙잡아 둠
+            release.wait(10)
+            return value
+
+        def release_when_all_waiting():
+            started.wait(10)
+            while cache.stats()["waits"] < self.N_WAITERS:
+                release.wait(0.001)
+            release.set()
+
+        releaser = threading.Thread(target=release_when_all_waiting)
+        releaser.start()
+        results = self._run_concurrently(cache, compute, self.N_WAITERS + 1)
+        releaser.join(timeout=10)
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is value for result, _ in results))
+        statuses = sorted(status for _, status in results)
+        self.assertEqual(statuses, sorted([MISS] + [WAITED] * self.N_WAITERS))
+        stats = cache.stats()
+        self.assertEqual((stats["misses"], stats["waits"], stats["in_flight"]), (1, self.N_WAITERS, 0))
+        self.assertEqual(cache.get_or_compute("key", compute), (value, HIT))
+
+    def test_waiter_retries_when_leader_fails(self):
+        cache = SharedCache()
+        calls = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            calls.append(1)
+            if len(calls) == 1:
+                started.set()
+                release.wait(10)
+                raise RuntimeError("중단")
+            return "ok"
+
+        results = {}
+
+        def leader():
+            try:
+                cache.get_or_compute("key", compute, wait_poll=0.01)
+            except RuntimeError as exc:
+                results["leader"] = exc
+
+        def waiter():
+            results["waiter"] = cache.get_or_compute("key", compute, wait_poll=0.01)
+
+        leader_thread = threading.Thread(target=leader)
+        leader_thread.start()
+        started.wait(10)
+        waiter_thread = threading.Thread(target=waiter)
+        waiter_thread.start()
+        while cache.stats()["waits"] < 1:
+            release.wait(0.001)
+        release.set()
+        leader_thread.join(timeout=10)
+        waiter_thread.join(timeout=10)
+
+        self.assertIsInstance(results["leader"], RuntimeError)
+        self.assertEqual(results["waiter"], ("ok", MISS))
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(cache.stats()["in_flight"], 0)
+
+    def test_on_wait_called_while_waiting(self):
+        cache = SharedCache()
+        started = threading.Event()
+        release = threading.Event()
+        waited = []
+
+        def compute():
+            started.set()
+            release.wait(10)
+            return 1
+
+        leader_thread = threading.Thread(target=cache.get_or_compute, args=("key", compute))
+        leader_thread.start()
+        started.wait(10)
+
+        def on_wait(seconds):
+            waited.append(seconds)
+            if len(waited) >= 3:
+                release.set()
+
+        result = cache.get_or_compute("key", compute, on_wait=on_wait, wait_poll=0.01)
+        leader_thread.join(timeout=10)
+        self.assertEqual(result, (1, WAITED))
+        self.assertGreaterEqual(len(waited), 3)
+        self.assertEqual(waited, sorted(waited))
+
+
+if __name__ == "__main__":
+    unittest.main()